@@ -0,0 +1,141 @@
+"""
+Audit log index for the Minecraft Server API
+Maintains a SQLite sidecar index over the append-only JSONL audit log so that
+filtered, paginated reads only parse the entries they return
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit (
+    offset INTEGER PRIMARY KEY,
+    length INTEGER NOT NULL,
+    ts TEXT NOT NULL,
+    action TEXT,
+    username TEXT
+);
+CREATE INDEX IF NOT EXISTS audit_ts ON audit (ts DESC, offset);
+CREATE INDEX IF NOT EXISTS audit_action ON audit (action, ts DESC);
+CREATE INDEX IF NOT EXISTS audit_username ON audit (username, ts DESC);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+class AuditIndex:
+    """
+    SQLite index of (byte offset, length, timestamp, action, username) per audit log line.
+
+    The index tracks how many bytes of the log it has covered; sync() indexes
+    only the bytes appended since the last call, and rebuilds from scratch if
+    the log was truncated or replaced.
+    """
+
+    def __init__(self, log_path: Path, index_path: Optional[Path] = None):
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path) if index_path else self.log_path.with_suffix(".idx")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def _meta(self, key: str) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _reset(self):
+        self._conn.execute("DELETE FROM audit")
+        self._conn.execute("DELETE FROM meta")
+
+    def sync(self):
+        """Index any lines appended to the audit log since the last sync"""
+        with self._lock:
+            try:
+                st = os.stat(self.log_path)
+            except FileNotFoundError:
+                if self._meta("size"):
+                    self._reset()
+                    self._conn.commit()
+                return
+
+            indexed_size = self._meta("size")
+            if st.st_ino != self._meta("inode") or st.st_size < indexed_size:
+                self._reset()
+                indexed_size = 0
+            if st.st_size == indexed_size:
+                return
+
+            rows = []
+            position = indexed_size
+            with open(self.log_path, "rb") as f:
+                f.seek(indexed_size)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Partially written entry; index it on a later sync
+                        break
+                    try:
+                        entry = _json_loads(line)
+                        rows.append(
+                            (
+                                position,
+                                len(line),
+                                entry.get("timestamp", ""),
+                                entry.get("action"),
+                                entry.get("username"),
+                            )
+                        )
+                    except (ValueError, AttributeError):
+                        pass
+                    position += len(line)
+
+            self._conn.executemany("INSERT OR REPLACE INTO audit VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('size', ?)", (position,))
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('inode', ?)", (st.st_ino,))
+            self._conn.commit()
+
+    def query(
+        self, action: Optional[str] = None, username: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> Tuple[int, List[dict]]:
+        """
+        Return matching audit entries, newest first.
+
+        Args:
+            action: Only include entries with this action
+            username: Only include entries for this username
+            limit: Maximum number of entries to return
+            offset: Number of matching entries to skip
+
+        Returns:
+            Tuple of (total matching entries, entries in the requested window)
+        """
+        self.sync()
+        where = "WHERE (:action IS NULL OR action = :action) AND (:username IS NULL OR username = :username)"
+        params = {"action": action, "username": username, "limit": limit, "offset": offset}
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM audit {where}", params).fetchone()[0]
+            ranges = self._conn.execute(
+                f"SELECT offset, length FROM audit {where} ORDER BY ts DESC, offset LIMIT :limit OFFSET :offset",
+                params,
+            ).fetchall()
+
+        entries = []
+        if ranges:
+            fd = os.open(self.log_path, os.O_RDONLY)
+            try:
+                for start, length in ranges:
+                    entries.append(_json_loads(os.pread(fd, length, start)))
+            finally:
+                os.close(fd)
+        return total, entries
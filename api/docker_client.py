@@ -0,0 +1,175 @@
+"""
+Docker Engine API client for the Minecraft Server API
+Talks to the Docker daemon over its Unix socket using a persistent keep-alive
+connection, avoiding a docker CLI fork/exec per request
+"""
+
+import http.client
+import json
+import os
+import socket
+import stat
+import threading
+import urllib.parse
+from typing import List, Optional, Tuple
+
+DOCKER_SOCKET = os.environ.get("DOCKER_SOCKET", "/var/run/docker.sock")
+
+# Binary size units, matching the docker CLI's human-readable output
+_BINARY_UNITS = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"]
+
+
+class DockerError(Exception):
+    """Raised when the Docker daemon cannot be reached or returns an error"""
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that connects to a Unix domain socket"""
+
+    def __init__(self, socket_path: str, timeout: float = 10):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count like the docker CLI (e.g. '1.5GiB')"""
+    unit = 0
+    while size >= 1024 and unit < len(_BINARY_UNITS) - 1:
+        size /= 1024.0
+        unit += 1
+    return f"{size:.4g}{_BINARY_UNITS[unit]}"
+
+
+def demux_log_stream(body: bytes) -> bytes:
+    """
+    Strip Docker's multiplexed stream framing from a logs response.
+
+    Containers without a TTY prefix each chunk with an 8-byte header
+    (stream type, 3 zero bytes, big-endian payload length); TTY containers
+    return the raw stream.
+    """
+    if len(body) < 8 or body[0] not in (0, 1, 2) or body[1:4] != b"\x00\x00\x00":
+        return body
+    chunks = []
+    pos = 0
+    while pos + 8 <= len(body):
+        length = int.from_bytes(body[pos + 4 : pos + 8], "big")
+        chunks.append(body[pos + 8 : pos + 8 + length])
+        pos += 8 + length
+    return b"".join(chunks)
+
+
+class DockerClient:
+    """Minimal Docker Engine API client over a persistent Unix socket connection"""
+
+    def __init__(self, socket_path: str = DOCKER_SOCKET, timeout: float = 10):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """Check whether the Docker socket exists"""
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        try:
+            return stat.S_ISSOCK(os.stat(self.socket_path).st_mode)
+        except OSError:
+            return False
+
+    def get(self, path: str, params: Optional[dict] = None) -> Tuple[int, bytes]:
+        """
+        Perform a GET request against the Docker API.
+
+        Args:
+            path: API path, e.g. /containers/<name>/json
+            params: Optional query parameters
+
+        Returns:
+            Tuple of (HTTP status, response body)
+        """
+        if params:
+            path = f"{path}?{urllib.parse.urlencode(params)}"
+        with self._lock:
+            # Retry once: the daemon may have closed an idle keep-alive connection
+            for attempt in range(2):
+                if self._conn is None:
+                    self._conn = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+                try:
+                    self._conn.request("GET", path)
+                    response = self._conn.getresponse()
+                    return response.status, response.read()
+                except (http.client.HTTPException, OSError) as e:
+                    self._conn.close()
+                    self._conn = None
+                    if attempt:
+                        raise DockerError(f"Docker API request failed: {e}") from e
+        raise DockerError("Docker API request failed")
+
+    def get_json(self, path: str, params: Optional[dict] = None):
+        """GET a Docker API path and decode the JSON body, raising DockerError on non-2xx"""
+        status, body = self.get(path, params)
+        if status >= 300:
+            raise DockerError(f"Docker API {path} returned {status}")
+        return json.loads(body)
+
+    def container_statuses(self, name: str) -> List[str]:
+        """
+        Return the status strings of running containers matching a name, like `docker ps --filter name=...`.
+
+        Returns:
+            List of human-readable statuses (e.g. ['Up 3 hours']); empty if none are running
+        """
+        containers = self.get_json("/containers/json", {"filters": json.dumps({"name": [name]})})
+        return [container.get("Status", "") for container in containers]
+
+    def container_stats(self, name: str) -> dict:
+        """
+        Return a one-shot resource usage sample for a container.
+
+        Returns:
+            Dict with cpu_percent, memory_usage and memory_percent formatted like `docker stats`
+        """
+        stats = self.get_json(f"/containers/{name}/stats", {"stream": "false"})
+
+        cpu_stats = stats.get("cpu_stats", {})
+        precpu_stats = stats.get("precpu_stats", {})
+        cpu_delta = cpu_stats.get("cpu_usage", {}).get("total_usage", 0) - precpu_stats.get("cpu_usage", {}).get(
+            "total_usage", 0
+        )
+        system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get("system_cpu_usage", 0)
+        online_cpus = cpu_stats.get("online_cpus") or len(cpu_stats.get("cpu_usage", {}).get("percpu_usage") or []) or 1
+        cpu_percent = cpu_delta / system_delta * online_cpus * 100.0 if cpu_delta > 0 and system_delta > 0 else 0.0
+
+        memory = stats.get("memory_stats", {})
+        mem_detail = memory.get("stats", {})
+        # Exclude page cache, as the docker CLI does (cgroup v1: cache, v2: inactive_file)
+        used = memory.get("usage", 0) - mem_detail.get("cache", mem_detail.get("inactive_file", 0))
+        limit = memory.get("limit", 0)
+        mem_percent = used / limit * 100.0 if limit else 0.0
+
+        return {
+            "cpu_percent": f"{cpu_percent:.2f}",
+            "memory_usage": f"{format_bytes(used)} / {format_bytes(limit)}",
+            "memory_percent": f"{mem_percent:.2f}",
+        }
+
+    def container_logs(self, name: str, tail: int = 100, since: Optional[float] = None) -> str:
+        """Return the last `tail` log lines of a container (stdout and stderr)"""
+        params = {"stdout": "1", "stderr": "1", "tail": str(tail)}
+        if since is not None:
+            params["since"] = f"{since:.6f}"
+        status, body = self.get(f"/containers/{name}/logs", params)
+        if status >= 300:
+            raise DockerError(f"Docker API logs for {name} returned {status}")
+        return demux_log_stream(body).decode("utf-8", errors="replace")
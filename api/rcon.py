@@ -0,0 +1,244 @@
+"""
+RCON client for the Minecraft Server API
+Speaks the Source RCON protocol directly and keeps authenticated connections
+in a small pool, so commands don't fork a shell script and re-authenticate
+"""
+
+import queue
+import shlex
+import socket
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# Packet types
+SERVERDATA_AUTH = 3
+SERVERDATA_AUTH_RESPONSE = 2
+SERVERDATA_EXECCOMMAND = 2
+SERVERDATA_RESPONSE_VALUE = 0
+
+# Maximum packet size accepted from the server (Minecraft splits larger responses at 4096 bytes)
+MAX_PACKET_SIZE = 4096 + 10
+
+# Response body length at which Minecraft splits a response over further packets
+RESPONSE_SPLIT_SIZE = 4096
+
+# Body-less packet sent once a response may have been split; Minecraft answers it ("Unknown request 0")
+# only after the last packet of the command's response, which marks where the response ends
+RESPONSE_END_MARKER = SERVERDATA_RESPONSE_VALUE
+
+
+class RconError(Exception):
+    """Raised when the RCON server cannot be reached, rejects authentication, or drops the connection"""
+
+
+class RconResponseError(RconError):
+    """
+    Raised when a command was sent but its response could not be read, so it may have run.
+
+    `stale` is set when the connection was closed before any reply arrived; on a connection
+    that sat idle in a pool this means the server had dropped it before reading the command.
+    """
+
+    def __init__(self, message: str, stale: bool = False):
+        super().__init__(message)
+        self.stale = stale
+
+
+def load_rcon_config(path: Path) -> Dict[str, str]:
+    """
+    Read RCON settings from a shell-style config file (as used by scripts/rcon-client.sh).
+
+    Args:
+        path: Path to rcon.conf containing RCON_HOST, RCON_PORT and RCON_PASSWORD assignments
+
+    Returns:
+        Dict of the assigned values (empty if the file is missing)
+    """
+    config = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                key = key.strip()
+                if key.startswith("export "):
+                    key = key[len("export ") :].strip()
+                try:
+                    parts = shlex.split(value, comments=True)
+                except ValueError:
+                    continue
+                config[key] = parts[0] if parts else ""
+    except FileNotFoundError:
+        pass
+    return config
+
+
+class RconClient:
+    """A single authenticated RCON connection"""
+
+    def __init__(self, host: str, port: int, password: str, timeout: float = 5):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._request_id = 0
+        self._received = 0  # Bytes read since the last command was sent
+
+    def _packet(self, packet_type: int, body: str):
+        self._request_id = (self._request_id + 1) & 0x7FFFFFFF
+        payload = struct.pack("<ii", self._request_id, packet_type) + body.encode("utf-8") + b"\x00\x00"
+        return self._request_id, struct.pack("<i", len(payload)) + payload
+
+    def _send(self, packet_type: int, body: str) -> int:
+        request_id, packet = self._packet(packet_type, body)
+        self._sock.sendall(packet)
+        return request_id
+
+    def _recv_exact(self, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = self._sock.recv(size - len(data))
+            if not chunk:
+                raise RconError("RCON connection closed")
+            data += chunk
+            self._received += len(chunk)
+        return bytes(data)
+
+    def _recv(self):
+        (length,) = struct.unpack("<i", self._recv_exact(4))
+        if length < 10 or length > MAX_PACKET_SIZE:
+            raise RconError(f"Invalid RCON packet length: {length}")
+        payload = self._recv_exact(length)
+        request_id, packet_type = struct.unpack("<ii", payload[:8])
+        return request_id, packet_type, payload[8:-2].decode("utf-8", errors="replace")
+
+    def _recv_response(self, request_id: int) -> str:
+        while True:
+            response_id, packet_type, body = self._recv()
+            if response_id == request_id and packet_type == SERVERDATA_RESPONSE_VALUE:
+                return body
+
+    def connect(self):
+        """Open the TCP connection and authenticate"""
+        self.close()
+        try:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            auth_id = self._send(SERVERDATA_AUTH, self.password)
+            while True:
+                request_id, packet_type, _ = self._recv()
+                if packet_type == SERVERDATA_AUTH_RESPONSE:
+                    break
+            if request_id == -1 or request_id != auth_id:
+                raise RconError("RCON authentication failed")
+        except OSError as e:
+            self.close()
+            raise RconError(f"RCON connection failed: {e}") from e
+        except RconError:
+            self.close()
+            raise
+
+    def command(self, command: str) -> str:
+        """
+        Run a command and return the server's full response text
+
+        Minecraft reads exactly one packet per socket read, so packets are never sent back to back.
+        Responses over 4096 bytes arrive split over several packets: when the first packet is full,
+        a marker packet is sent and every response packet up to the marker's reply is joined.
+
+        Raises:
+            RconError: If the command could not be sent (it did not run)
+            RconResponseError: If the command was sent but no complete response was read
+        """
+        if self._sock is None:
+            self.connect()
+        try:
+            command_id = self._send(SERVERDATA_EXECCOMMAND, command)
+        except OSError as e:
+            self.close()
+            raise RconError(f"RCON command failed: {e}") from e
+        self._received = 0
+        try:
+            body = self._recv_response(command_id)
+            if len(body) < RESPONSE_SPLIT_SIZE:
+                return body
+            parts = [body]
+            marker_id = self._send(RESPONSE_END_MARKER, "")
+            while True:
+                request_id, packet_type, body = self._recv()
+                if request_id == marker_id:
+                    return "".join(parts)
+                if request_id == command_id and packet_type == SERVERDATA_RESPONSE_VALUE:
+                    parts.append(body)
+        except (OSError, RconError) as e:
+            self.close()
+            # Closed (not timed out) before a single reply byte: the server dropped the connection
+            closed = isinstance(e, (RconError, ConnectionError)) and not isinstance(e, socket.timeout)
+            raise RconResponseError(f"RCON response failed: {e}", stale=closed and not self._received) from e
+
+    def close(self):
+        """Close the connection"""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
+class RconPool:
+    """Bounded pool of reusable RCON connections"""
+
+    def __init__(self, host: str, port: int, password: str, size: int = 4, timeout: float = 5):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[RconClient]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def command(self, command: str) -> str:
+        """
+        Run a command on a pooled connection.
+
+        A stale idle connection (e.g. after a server restart) is replaced and the command
+        retried once on a fresh connection, but only when the command cannot have run: a
+        command is never sent twice once the server may have read it.
+
+        Raises:
+            RconError: If the server is unreachable, authentication fails, or no connection
+                frees up within the timeout
+            RconResponseError: If the command was sent but its response was lost (it may have run)
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise RconError("No RCON connection available")
+        try:
+            try:
+                client = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                client = RconClient(self.host, self.port, self.password, self.timeout)
+                reused = False
+            try:
+                response = client.command(command)
+            except RconError as e:
+                if not reused or (isinstance(e, RconResponseError) and not e.stale):
+                    raise
+                client = RconClient(self.host, self.port, self.password, self.timeout)
+                response = client.command(command)
+            self._idle.put(client)
+            return response
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
@@ -4,17 +4,39 @@ Minecraft Server REST API
 Provides HTTP API for remote server management
 """
 
+import atexit
+import base64
+import gzip
+import hashlib
+import heapq
+import io
 import json
 import os
+import queue
+import re
 import secrets
+import shutil
+import stat
 import subprocess
 import sys
+import tarfile
+import tempfile
+import threading
+import time
 import urllib.parse
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 
-from flask import Flask, jsonify, request, session
+from flask import Flask, Request, jsonify, request, send_file, session
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.utils import secure_filename
 
 # Optional CORS support
 try:
@@ -25,11 +47,47 @@ except ImportError:
     CORS_AVAILABLE = False
     CORS = None  # Placeholder for type checking
 
+# Optional fast JSON support
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+    _json_loads = json.loads
+
+# Optional YAML support (config file validation), preferring the libyaml C loader
+try:
+    import yaml  # type: ignore
+
+    try:
+        from yaml import CSafeLoader as YamlSafeLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlSafeLoader
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+    yaml = None
+    YamlSafeLoader = None
+
+# Optional parallel gzip decompression (used for backup restores)
+try:
+    import rapidgzip  # type: ignore
+
+    RAPIDGZIP_AVAILABLE = True
+except ImportError:
+    RAPIDGZIP_AVAILABLE = False
+    rapidgzip = None
+
 # Optional WebSocket support
 try:
     import eventlet  # type: ignore[import-untyped]
-    from flask_socketio import (
-        SocketIO,  # type: ignore[import-untyped]
+    from flask_socketio import (  # type: ignore[import-untyped]
+        SocketIO,
+        join_room,
+        leave_room,
     )
 
     # Only monkey patch if not in testing environment
@@ -86,10 +144,88 @@ except ImportError:
         return False
 
 
+# Import audit log index (requires sqlite3)
+try:
+    from api.audit_index import AuditIndex
+
+    AUDIT_INDEX_AVAILABLE = True
+except ImportError:
+    AUDIT_INDEX_AVAILABLE = False
+    AuditIndex = None
+
+# Import native RCON client
+try:
+    from api.rcon import RconError, RconPool, RconResponseError, load_rcon_config
+
+    RCON_AVAILABLE = True
+except ImportError:
+    RCON_AVAILABLE = False
+
+    class RconError(Exception):
+        pass
+
+    class RconResponseError(RconError):
+        pass
+
+
+# Import Docker Engine API client (Unix socket)
+try:
+    from api.docker_client import DockerClient, DockerError
+
+    DOCKER_API_AVAILABLE = True
+except ImportError:
+    DOCKER_API_AVAILABLE = False
+    DockerClient = None
+
+    class DockerError(Exception):
+        pass
+
+
+UPLOAD_MAX_BYTES = 10 * 1024 * 1024  # 10MB max uploaded file size
+
+
+class UploadSpoolFile(io.FileIO):
+    """On-disk upload spool that enforces the size cap as bytes arrive"""
+
+    def __init__(self, limit=UPLOAD_MAX_BYTES):
+        # Spool under PROJECT_ROOT so the final move into place is a same-filesystem rename
+        fd, path = tempfile.mkstemp(prefix=".upload-", suffix=".part", dir=str(PROJECT_ROOT))
+        super().__init__(fd, "w+b", closefd=True)
+        self.path = path
+        self.limit = limit
+        self.received = 0
+
+    def write(self, data):
+        self.received += len(data)
+        if self.received > self.limit:
+            raise RequestEntityTooLarge("File too large (max 10MB)")
+        return super().write(data)
+
+    def discard(self):
+        """Close and delete the spool file"""
+        self.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class ApiRequest(Request):
+    """Request that streams multipart file parts straight to an on-disk spool"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        spool = UploadSpoolFile()
+        self.__dict__.setdefault("upload_spools", []).append(spool)
+        return spool
+
+
 app = Flask(__name__)
+app.request_class = ApiRequest
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", secrets.token_hex(32))
 app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB max request size
 app.config["PERMANENT_SESSION_LIFETIME"] = timedelta(hours=24)
+# Let a front-end proxy (Apache mod_xsendfile, lighttpd) stream downloads with sendfile(2)
+app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE", "").lower() in ("1", "true", "yes")
 
 # Rate limiting storage (in-memory, use Redis in production)
 RATE_LIMIT_STORAGE = {}
@@ -97,9 +233,27 @@ RATE_LIMIT_STORAGE = {}
 # CORS configuration - restrict to specific origins in production
 ALLOWED_ORIGINS = os.environ.get("ALLOWED_ORIGINS", "*").split(",")
 
+
+class SocketJSON:
+    """JSON codec for Socket.IO packets, encoding with orjson when available"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(obj).decode("utf-8")
+            except TypeError:
+                pass  # Types orjson rejects (e.g. non-str dict keys) go through the stdlib encoder
+        return json.dumps(obj, separators=(",", ":"))
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return _json_loads(data)
+
+
 # Initialize SocketIO if available
 if SOCKETIO_AVAILABLE:
-    socketio = SocketIO(app, cors_allowed_origins=ALLOWED_ORIGINS, async_mode="eventlet")
+    socketio = SocketIO(app, cors_allowed_origins=ALLOWED_ORIGINS, async_mode="eventlet", json=SocketJSON)
 else:
     socketio = None
 
@@ -177,39 +331,264 @@ API_HOST = "127.0.0.1"  # Only listen on localhost by default
 API_ENABLED = True
 _DEFAULT_SECRET_KEY = "minecraft-server-api-secret-change-in-production"
 
+
+def load_api_config(path):
+    """Parse a KEY=value config file line by line, skipping comments and other lines; empty if missing"""
+    config = {}
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                if "=" in line and not line.strip().startswith("#"):
+                    key, value = line.strip().split("=", 1)
+                    config[key] = value
+    except FileNotFoundError:
+        pass
+    return config
+
+
 # Load configuration
-if API_CONFIG_FILE.exists():
-    with open(API_CONFIG_FILE, "r") as f:
-        config = {}
-        for line in f:
-            if "=" in line and not line.strip().startswith("#"):
-                key, value = line.strip().split("=", 1)
-                config[key] = value
-        API_PORT = int(config.get("API_PORT", API_PORT))
-        API_HOST = config.get("API_HOST", API_HOST)
-        API_ENABLED = config.get("API_ENABLED", "true").lower() == "true"
-        SECRET_KEY = config.get("SECRET_KEY", _DEFAULT_SECRET_KEY)
-else:
-    SECRET_KEY = _DEFAULT_SECRET_KEY
+config = load_api_config(API_CONFIG_FILE)
+API_PORT = int(config.get("API_PORT", API_PORT))
+API_HOST = config.get("API_HOST", API_HOST)
+API_ENABLED = config.get("API_ENABLED", "true").lower() == "true"
+SECRET_KEY = config.get("SECRET_KEY", _DEFAULT_SECRET_KEY)
 
 # Set Flask secret key for sessions
 app.config["SECRET_KEY"] = SECRET_KEY
 
+
+def load_json_file(path):
+    """Load a JSON file (uses orjson when available)"""
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def write_json_file(path, data, indent=True):
+    """Write data to a JSON file, 2-space indented unless indent=False (uses orjson when available)"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    else:
+        payload = json.dumps(data, indent=2 if indent else None).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
+def backup_file(src, dst, link=False):
+    """
+    Snapshot src at dst before it is overwritten.
+
+    Makes a full copy unless link is set. A hardlink is only a snapshot while every writer
+    replaces src (atomic_write, sed -i) rather than rewriting it in place, so pass link=True
+    only for files nothing but the API writes.
+    """
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # Cross-device, unsupported by the filesystem, or backup name already taken
+    shutil.copy2(src, dst)
+
+
+def fsync_dir(path):
+    """Flush a directory entry update (e.g. a rename) to disk; a no-op where directories can't be opened"""
+    try:
+        dir_fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass  # Some filesystems don't support fsync on directories
+    finally:
+        os.close(dir_fd)
+
+
+def atomic_write(path, content, mode=None):
+    """
+    Replace a file's content by writing a temp file beside it and renaming it into place.
+
+    The data is fsynced before the rename and the directory after it, so after a crash
+    the file holds either the old or the new content in full.
+
+    Args:
+        path: File to write
+        content: Text (written as UTF-8) or bytes
+        mode: Permission bits for the file; defaults to the existing file's, or 0o644 for a new file
+    """
+    path = Path(path)
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass  # Already renamed or never fully created
+        raise
+    fsync_dir(path.parent)
+
+
+# Parsed file contents keyed by (path, parser) -> ((st_mtime_ns, st_size), value)
+_FILE_PARSE_CACHE = {}
+
+
+def load_cached(path, parser):
+    """Parse a file with parser(path), reusing the result while its mtime and size are unchanged (shared: read-only)"""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_PARSE_CACHE.get((path, parser))
+    if cached and cached[0] == stamp:
+        return cached[1]
+    value = parser(path)
+    _FILE_PARSE_CACHE[(path, parser)] = (stamp, value)
+    return value
+
+
+def parse_properties_file(path):
+    """Parse a Java-style key=value properties file into a dict"""
+    properties = {}
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, value = line.split("=", 1)
+                properties[key.strip()] = value.strip()
+    return properties
+
+
+# Non-blank, non-comment properties lines without a '=' separator
+_PROPERTIES_BAD_LINE = re.compile(r"^(?![^\S\n]*(?:#|$))[^\n=]*$", re.MULTILINE)
+
+
+def invalid_properties_lines(content):
+    """Yield the 1-based line numbers of malformed lines in properties file content"""
+    line, pos = 1, 0
+    for match in _PROPERTIES_BAD_LINE.finditer(content):
+        line += content.count("\n", pos, match.start())
+        pos = match.start()
+        yield line
+
+
+def fast_jsonify(obj, status=200):
+    """Build a JSON response, serializing with orjson when available"""
+    if not ORJSON_AVAILABLE:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+    return app.response_class(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+def not_modified(etag):
+    """Return an empty 304 response if the request's If-None-Match matches the weak ETag, else None"""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+# (epoch second, ISO string) for the most recently formatted timestamp
+_TS_CACHE = (0, "")
+
+
+def now_iso():
+    """Current UTC time as an ISO string, cached per second (not for security-sensitive timestamps)"""
+    global _TS_CACHE
+    sec = int(time.time())
+    cached_sec, cached_iso = _TS_CACHE
+    if cached_sec == sec:
+        return cached_iso
+    iso = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+    _TS_CACHE = (sec, iso)
+    return iso
+
+
+_STAMP_LOCK = threading.Lock()
+_LAST_STAMP_NS = 0
+
+
+def backup_stamp():
+    """Unique, sortable local timestamp for backup filenames (YYYYmmdd_HHMMSS_nanoseconds)"""
+    global _LAST_STAMP_NS
+    with _STAMP_LOCK:
+        # Never hand out the same value twice, even for saves within the same clock tick
+        ns = max(time.time_ns(), _LAST_STAMP_NS + 1)
+        _LAST_STAMP_NS = ns
+    sec, frac = divmod(ns, 1_000_000_000)
+    return f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(sec))}_{frac:09d}"
+
+
 # Load API keys
 API_KEYS = {}
 if API_KEYS_FILE.exists():
     try:
-        with open(API_KEYS_FILE, "r") as f:
-            API_KEYS = json.load(f)
+        API_KEYS = load_json_file(API_KEYS_FILE)
     except (FileNotFoundError, json.JSONDecodeError):
         API_KEYS = {}
 
+# API keys file is re-checked at most once per interval and reloaded when edited outside the API
+API_KEYS_RELOAD_INTERVAL = 1.0
+_api_keys_state = {"checked": 0.0, "stamp": None, "enabled": None}
+
+
+def _api_keys_file_stamp():
+    """(path, mtime_ns, size) of the API keys file, or (path, None, None) if it is missing"""
+    try:
+        st = os.stat(API_KEYS_FILE)
+        return (API_KEYS_FILE, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (API_KEYS_FILE, None, None)
+
+
+_api_keys_state["stamp"] = _api_keys_file_stamp()
+
+
+def refresh_api_keys():
+    """Reload API_KEYS if the keys file changed on disk since it was last loaded or saved"""
+    global API_KEYS
+    now = time.monotonic()
+    if now - _api_keys_state["checked"] < API_KEYS_RELOAD_INTERVAL:
+        return
+    _api_keys_state["checked"] = now
+    stamp = _api_keys_file_stamp()
+    previous = _api_keys_state["stamp"]
+    _api_keys_state["stamp"] = stamp
+    # A different path (reconfigured file) only sets a new baseline
+    if previous is None or previous[0] != stamp[0] or previous == stamp or stamp[1] is None:
+        return
+    try:
+        API_KEYS = load_json_file(API_KEYS_FILE)
+    except (OSError, ValueError):
+        pass
+
+
+def enabled_api_keys():
+    """Frozen set of enabled API keys, rebuilt when API_KEYS is replaced or saved"""
+    cached = _api_keys_state["enabled"]
+    if cached is not None and cached[0] is API_KEYS and cached[1] == len(API_KEYS):
+        return cached[2]
+    enabled = frozenset(key for key, info in API_KEYS.items() if info.get("enabled", True))
+    _api_keys_state["enabled"] = (API_KEYS, len(API_KEYS), enabled)
+    return enabled
+
+
 # Load users
 USERS = {}
 if USERS_FILE.exists():
     try:
-        with open(USERS_FILE, "r") as f:
-            USERS = json.load(f)
+        USERS = load_json_file(USERS_FILE)
     except (FileNotFoundError, json.JSONDecodeError):
         USERS = {}
 
@@ -220,12 +599,31 @@ AUDIT_LOG_FILE = PROJECT_ROOT / "config" / "audit.log"
 SCHEDULE_FILE = PROJECT_ROOT / "config" / "command-schedule.json"
 
 
+# Serializes check-then-mutate sequences on USERS (e.g. the last-admin guard)
+_users_lock = threading.RLock()
+
+
+def _guard_last_admin(username, action):
+    """Return an error response if changing this user would leave no enabled admin, else None"""
+    if USERS[username].get("role") != "admin":
+        return None
+    enabled_admins = 0
+    for user_data in USERS.values():
+        if user_data.get("role") == "admin" and user_data.get("enabled", True):
+            enabled_admins += 1
+            if enabled_admins > 1:
+                return None
+    return (
+        jsonify({"error": f"Cannot {action} the last admin. At least one admin user must exist."}),
+        400,
+    )
+
+
 def save_users():
     """Save users to file"""
     try:
         USERS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(USERS_FILE, "w") as f:
-            json.dump(USERS, f, indent=2)
+        write_json_file(USERS_FILE, USERS)
         return True
     except Exception:
         return False
@@ -233,14 +631,13 @@ def save_users():
 
 def save_api_keys():
     """Save API keys to file"""
+    _api_keys_state["enabled"] = None
     try:
         API_KEYS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(API_KEYS_FILE, "w") as f:
-            json.dump(API_KEYS, f, indent=2)
+        write_json_file(API_KEYS_FILE, API_KEYS)
+        _api_keys_state["stamp"] = _api_keys_file_stamp()
         # Set restrictive permissions (owner read/write only) - Unix only
         try:
-            import os
-
             os.chmod(API_KEYS_FILE, 0o600)
         except (AttributeError, OSError):
             # Windows doesn't support chmod the same way, skip
@@ -267,17 +664,15 @@ def require_api_key(f):
         if not api_key:
             return jsonify({"error": "API key required"}), 401
 
-        # Check if API key is valid
-        if api_key not in API_KEYS:
+        # Check if API key is valid and enabled
+        refresh_api_keys()
+        if api_key not in enabled_api_keys():
+            if api_key in API_KEYS:
+                return jsonify({"error": "API key disabled"}), 401
             return jsonify({"error": "Invalid API key"}), 401
 
-        # Check if key is enabled
-        key_info = API_KEYS.get(api_key, {})
-        if not key_info.get("enabled", True):
-            return jsonify({"error": "API key disabled"}), 401
-
         # Store key info in request context
-        request.api_key_info = key_info
+        request.api_key_info = API_KEYS[api_key]
         # Set virtual admin user for permission checks (API keys have admin access)
         request.user = "__api_key__"
         request.user_info = {"role": "admin", "username": "__api_key__"}
@@ -286,6 +681,19 @@ def require_api_key(f):
     return decorated_function
 
 
+SCRIPT_TIMEOUT = 30
+
+# Bounded pool for long-running management scripts (start/stop/backup/...)
+_SCRIPT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="script")
+# Interactive console commands get their own workers so they never queue behind a backup
+_COMMAND_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="command")
+_INFLIGHT_SCRIPTS = {}
+_INFLIGHT_SCRIPTS_LOCK = threading.Lock()
+
+# Script invocations that can share a single in-flight execution
+COALESCED_SCRIPT_ACTIONS = {("manage.sh", "stop"), ("manage.sh", "restart")}
+
+
 def run_script(script_name, *args):
     """Run a management script and return output"""
     script_path = SCRIPTS_DIR / script_name
@@ -295,7 +703,11 @@ def run_script(script_name, *args):
 
     try:
         result = subprocess.run(
-            [str(script_path)] + list(args), capture_output=True, text=True, timeout=30, cwd=str(PROJECT_ROOT)
+            [str(script_path)] + list(args),
+            capture_output=True,
+            text=True,
+            timeout=SCRIPT_TIMEOUT,
+            cwd=str(PROJECT_ROOT),
         )
         return result.stdout, result.stderr, result.returncode
     except subprocess.TimeoutExpired:
@@ -304,10 +716,156 @@ def run_script(script_name, *args):
         return None, str(e), 500
 
 
+def _release_inflight_script(key):
+    """Forget a finished coalesced script execution"""
+    with _INFLIGHT_SCRIPTS_LOCK:
+        _INFLIGHT_SCRIPTS.pop(key, None)
+
+
+def run_script_pooled(script_name, *args, pool=None):
+    """Run a management script on the shared script pool (or the given pool).
+
+    Identical stop/restart requests issued while one is already running
+    share the in-flight execution instead of launching the script again.
+    A script still queued when the caller gives up is cancelled, so it
+    never starts after the caller was told it timed out.
+    """
+    pool = pool or _SCRIPT_POOL
+    key = (script_name,) + args
+    if key in COALESCED_SCRIPT_ACTIONS:
+        with _INFLIGHT_SCRIPTS_LOCK:
+            future = _INFLIGHT_SCRIPTS.get(key)
+            if future is None:
+                future = pool.submit(run_script, script_name, *args)
+                _INFLIGHT_SCRIPTS[key] = future
+                future.add_done_callback(lambda _f: _release_inflight_script(key))
+    else:
+        future = pool.submit(run_script, script_name, *args)
+
+    try:
+        # Allow some slack on top of the script's own timeout for queueing
+        return future.result(timeout=SCRIPT_TIMEOUT * 2)
+    except (FutureTimeoutError, CancelledError):
+        # Only a still-queued script can be cancelled; a running one ends at its own SCRIPT_TIMEOUT
+        future.cancel()
+        return None, "Script execution timeout", 504
+    except Exception as e:
+        return None, str(e), 500
+
+
+def run_command_script(script_name, *args):
+    """Run a console command script on the interactive command pool"""
+    return run_script_pooled(script_name, *args, pool=_COMMAND_POOL)
+
+
+# Native RCON: pooled connections configured from config/rcon.conf (same file as rcon-client.sh)
+RCON_CONFIG_FILE = PROJECT_ROOT / "config" / "rcon.conf"
+RCON_POOL_SIZE = 4
+_rcon_pool_state = {"stamp": None, "pool": None}
+_rcon_pool_lock = threading.Lock()
+
+
+def get_rcon_pool():
+    """Return the RCON connection pool, or None if native RCON isn't available or configured"""
+    if not RCON_AVAILABLE:
+        return None
+    try:
+        st = os.stat(RCON_CONFIG_FILE)
+        stamp = (RCON_CONFIG_FILE, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+    with _rcon_pool_lock:
+        if _rcon_pool_state["stamp"] != stamp:
+            # Config changed: drop connections made with the old settings
+            if _rcon_pool_state["pool"] is not None:
+                _rcon_pool_state["pool"].close()
+            config = load_rcon_config(RCON_CONFIG_FILE)
+            pool = None
+            if config.get("RCON_PASSWORD"):
+                try:
+                    port = int(config.get("RCON_PORT") or 25575)
+                except ValueError:
+                    port = 25575
+                pool = RconPool(
+                    config.get("RCON_HOST") or "localhost", port, config["RCON_PASSWORD"], size=RCON_POOL_SIZE
+                )
+            _rcon_pool_state.update(stamp=stamp, pool=pool)
+        return _rcon_pool_state["pool"]
+
+
+def rcon_command(command, fallback=None):
+    """
+    Send a console command over RCON.
+
+    Uses a pooled native connection when configured, otherwise (or if RCON is unreachable)
+    falls back to rcon-client.sh via the given script runner (run_script by default). A command
+    that was sent but whose response was lost fails instead, since the script would run it again.
+
+    Returns:
+        Tuple of (stdout, stderr, returncode), like run_script
+    """
+    pool = get_rcon_pool()
+    if pool is not None:
+        try:
+            return pool.command(command), "", 0
+        except RconResponseError as e:
+            return "", str(e), 1
+        except RconError:
+            pass  # Never sent: let the script try its other transports (docker exec rcon-cli, ...)
+    return (fallback or run_script)("rcon-client.sh", "command", command)
+
+
+MINECRAFT_CONTAINER = "minecraft-server"
+
+# Persistent Docker Engine API connection (used when the daemon socket is reachable)
+DOCKER = DockerClient() if DOCKER_API_AVAILABLE else None
+
+# Short-lived cache of docker results so bursts of dashboard polls share one daemon call
+DOCKER_STATUS_TTL = 0.5
+DOCKER_STATS_TTL = 0.5
+DOCKER_LOGS_TTL = 0.25
+# key -> (expires_at, result), oldest first; expired results are dropped and the size capped on insert
+DOCKER_CACHE_MAX_ENTRIES = 32
+_DOCKER_CACHE = {}
+_docker_cache_lock = threading.Lock()
+
+# Most log lines /api/logs returns (also bounds what a cached log dump can hold)
+LOGS_MAX_LINES = 5000
+
+
+def docker_api():
+    """Return the Docker API client if the daemon socket is available, else None (callers use the CLI)"""
+    if DOCKER is not None and DOCKER.available():
+        return DOCKER
+    return None
+
+
+def ttl_cached(key, ttl, fn):
+    """Return fn(), reusing a result produced for key within the last ttl seconds"""
+    now = time.monotonic()
+    cached = _DOCKER_CACHE.get(key)
+    if cached and now < cached[0]:
+        return cached[1]
+    value = fn()
+    with _docker_cache_lock:
+        for stale_key in [k for k, (expires_at, _) in _DOCKER_CACHE.items() if expires_at <= now]:
+            del _DOCKER_CACHE[stale_key]
+        _DOCKER_CACHE.pop(key, None)
+        while len(_DOCKER_CACHE) >= DOCKER_CACHE_MAX_ENTRIES:
+            del _DOCKER_CACHE[next(iter(_DOCKER_CACHE))]
+        _DOCKER_CACHE[key] = (now + ttl, value)
+    return value
+
+
+def run_docker_cached(args, ttl, timeout):
+    """Run a docker CLI command, reusing a result produced within the last ttl seconds"""
+    return ttl_cached(tuple(args), ttl, lambda: subprocess.run(args, capture_output=True, text=True, timeout=timeout))
+
+
 @app.route("/api/health", methods=["GET"])
 def health():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat(), "version": "1.0.0"})
+    return jsonify({"status": "healthy", "timestamp": now_iso(), "version": "1.0.0"})
 
 
 # User Authentication Endpoints
@@ -325,7 +883,6 @@ except ImportError:
 
 # Two-Factor Authentication
 try:
-    import base64
     import io
 
     import pyotp
@@ -416,10 +973,95 @@ def verify_totp(secret, token):
 
 
 # Audit Logging
+_AUDIT_INDEXES = {}
+
+
+def get_audit_index():
+    """Return the audit index for the current audit log file, or None if unavailable"""
+    if not AUDIT_INDEX_AVAILABLE:
+        return None
+    audit_index = _AUDIT_INDEXES.get(AUDIT_LOG_FILE)
+    if audit_index is None:
+        try:
+            AUDIT_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            audit_index = AuditIndex(AUDIT_LOG_FILE)
+        except Exception as e:
+            print(f"Audit index unavailable: {e}")
+            return None
+        _AUDIT_INDEXES[AUDIT_LOG_FILE] = audit_index
+    return audit_index
+
+
+# Audit events are appended by a background writer so requests never wait on disk I/O
+AUDIT_BATCH_SIZE = 64
+_AUDIT_QUEUE = queue.SimpleQueue()
+_audit_writer_lock = threading.Lock()
+_audit_writer_thread = None
+
+
+def _write_audit_batch(path, lines):
+    """Append a batch of serialized audit entries and update the index"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as f:
+        f.write(b"".join(lines))
+    audit_index = get_audit_index()
+    if audit_index and path == AUDIT_LOG_FILE:
+        audit_index.sync()
+
+
+def _audit_writer():
+    """Drain the audit queue, writing up to AUDIT_BATCH_SIZE entries per file append"""
+    while True:
+        items = [_AUDIT_QUEUE.get()]
+        while len(items) < AUDIT_BATCH_SIZE:
+            try:
+                items.append(_AUDIT_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        # Items are (path, line) entries or (None, Event) flush markers; keep file order per path
+        batches = {}
+        flushed = []
+        for path, item in items:
+            if path is None:
+                flushed.append(item)
+            else:
+                batches.setdefault(path, []).append(item)
+        for path, lines in batches.items():
+            try:
+                _write_audit_batch(path, lines)
+            except Exception as e:
+                print(f"Audit logging error: {e}")
+        for event in flushed:
+            event.set()
+
+
+def _ensure_audit_writer():
+    """Start the audit writer thread on first use"""
+    global _audit_writer_thread
+    if _audit_writer_thread is not None and _audit_writer_thread.is_alive():
+        return
+    with _audit_writer_lock:
+        if _audit_writer_thread is None or not _audit_writer_thread.is_alive():
+            _audit_writer_thread = threading.Thread(target=_audit_writer, name="audit-writer", daemon=True)
+            _audit_writer_thread.start()
+
+
+def flush_audit_log(timeout=5.0):
+    """Block until all audit events queued so far have been written"""
+    if _audit_writer_thread is None:
+        return True
+    done = threading.Event()
+    _AUDIT_QUEUE.put((None, done))
+    return done.wait(timeout)
+
+
+atexit.register(flush_audit_log)
+
+
 def log_audit_event(username, action, details=None, ip_address=None):
     """Log an audit event"""
     try:
-        AUDIT_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now(timezone.utc).isoformat()
         ip = ip_address or request.remote_addr if hasattr(request, "remote_addr") else "unknown"
 
@@ -431,9 +1073,13 @@ def log_audit_event(username, action, details=None, ip_address=None):
             "ip_address": ip,
         }
 
-        # Append to audit log file (JSONL format)
-        with open(AUDIT_LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        # Queue for the background writer (JSONL format)
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(log_entry) + b"\n"
+        else:
+            line = (json.dumps(log_entry) + "\n").encode("utf-8")
+        _ensure_audit_writer()
+        _AUDIT_QUEUE.put((AUDIT_LOG_FILE, line))
     except Exception as e:
         # Don't fail the request if audit logging fails
         print(f"Audit logging error: {e}")
@@ -605,7 +1251,8 @@ def require_auth(f):
         # Check API key first (for backward compatibility)
         api_key = request.headers.get("X-API-Key") or request.args.get("api_key")
         if api_key:
-            if api_key in API_KEYS and API_KEYS[api_key].get("enabled", True):
+            refresh_api_keys()
+            if api_key in enabled_api_keys():
                 request.user = "__api_key__"
                 request.user_info = {"role": "admin", "username": "__api_key__"}
                 return f(*args, **kwargs)
@@ -667,7 +1314,7 @@ def register():
         "email": email,
         "role": "admin",  # First user is admin, others default to "user"
         "enabled": True,
-        "created": datetime.now(timezone.utc).isoformat(),
+        "created": now_iso(),
     }
 
     if not save_users():
@@ -974,11 +1621,48 @@ def get_oauth_url(provider):
     return jsonify({"error": "Invalid OAuth provider"}), 400  # unreachable; makes all code paths explicit
 
 
+# Shared keep-alive HTTP session for outbound OAuth requests (created lazily)
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def get_http_session():
+    """Return the pooled requests session (raises ImportError if requests is missing)"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                http = requests.Session()
+                http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+                _HTTP_SESSION = http
+    return _HTTP_SESSION
+
+
+def _unverified_sub_email(id_token):
+    """Extract (sub, email) from an id_token without verifying its signature.
+
+    Only used for tokens received directly from the provider's token endpoint over TLS.
+    """
+    if not id_token:
+        return None, ""
+    try:
+        payload = id_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError, TypeError):
+        return None, ""
+    if not isinstance(claims, dict):
+        return None, ""
+    return claims.get("sub"), claims.get("email", "")
+
+
 @app.route("/api/auth/oauth/google/callback", methods=["POST"])
 def google_oauth_callback():
     """Handle Google OAuth callback"""
     try:
-        import requests
+        http = get_http_session()
     except ImportError:
         return jsonify({"error": "requests library required for OAuth"}), 500
 
@@ -1003,7 +1687,7 @@ def google_oauth_callback():
             "grant_type": "authorization_code",
         }
 
-        token_response = requests.post(token_url, data=token_data, timeout=10)
+        token_response = http.post(token_url, data=token_data, timeout=10)
         if token_response.status_code != 200:
             return jsonify({"error": "Failed to exchange code for token"}), 400
 
@@ -1013,17 +1697,19 @@ def google_oauth_callback():
         if not access_token:
             return jsonify({"error": "No access token received"}), 400
 
-        # Get user info from Google
-        userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-        headers = {"Authorization": f"Bearer {access_token}"}
-        userinfo_response = requests.get(userinfo_url, headers=headers, timeout=10)
+        # Prefer the identity in the id_token; only query userinfo when it is missing
+        google_id, email = _unverified_sub_email(token_json.get("id_token"))
+        if not google_id:
+            userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
+            headers = {"Authorization": f"Bearer {access_token}"}
+            userinfo_response = http.get(userinfo_url, headers=headers, timeout=10)
 
-        if userinfo_response.status_code != 200:
-            return jsonify({"error": "Failed to get user info"}), 400
+            if userinfo_response.status_code != 200:
+                return jsonify({"error": "Failed to get user info"}), 400
 
-        userinfo = userinfo_response.json()
-        google_id = userinfo.get("id")
-        email = userinfo.get("email", "")
+            userinfo = userinfo_response.json()
+            google_id = userinfo.get("id")
+            email = userinfo.get("email", "")
 
         if not google_id:
             return jsonify({"error": "Invalid user info from Google"}), 400
@@ -1057,7 +1743,7 @@ def google_oauth_callback():
                 "oauth_providers": [oauth_id],
                 "role": "admin" if len(USERS) == 0 else "user",
                 "enabled": True,
-                "created": datetime.now(timezone.utc).isoformat(),
+                "created": now_iso(),
             }
             save_users()
         else:
@@ -1082,11 +1768,68 @@ def google_oauth_callback():
         return jsonify({"error": f"OAuth callback error: {str(e)}"}), 500
 
 
+# Singleflight state for deduplicating concurrent identical OAuth link requests
+SINGLEFLIGHT_TTL = 30
+_SINGLEFLIGHT = {}
+_SF_RESULTS = {}
+_SF_LOCK = threading.Lock()
+
+
+def _singleflight_response(result):
+    """Rebuild a Flask response from a stored singleflight result"""
+    body, status, mimetype = result
+    return app.response_class(body, status=status, mimetype=mimetype)
+
+
+def singleflight(key, fn):
+    """Run fn once for concurrent callers sharing key and return the same response to all of them"""
+    with _SF_LOCK:
+        now = time.monotonic()
+        for stale_key in [k for k, (ts, _) in _SF_RESULTS.items() if now - ts > SINGLEFLIGHT_TTL]:
+            del _SF_RESULTS[stale_key]
+        if key in _SF_RESULTS:
+            return _singleflight_response(_SF_RESULTS[key][1])
+        event = _SINGLEFLIGHT.get(key)
+        leader = event is None
+        if leader:
+            event = threading.Event()
+            _SINGLEFLIGHT[key] = event
+
+    if not leader:
+        event.wait(timeout=SINGLEFLIGHT_TTL)
+        with _SF_LOCK:
+            cached = _SF_RESULTS.get(key)
+        if cached:
+            return _singleflight_response(cached[1])
+        return fn()
+
+    try:
+        response = app.make_response(fn())
+        with _SF_LOCK:
+            _SF_RESULTS[key] = (time.monotonic(), (response.get_data(), response.status_code, response.mimetype))
+        return response
+    finally:
+        with _SF_LOCK:
+            _SINGLEFLIGHT.pop(key, None)
+        event.set()
+
+
 @app.route("/api/auth/oauth/<provider>/link", methods=["POST"])
 @require_auth
 def link_oauth_account(provider):
     """Link OAuth account to existing user"""
     # Provider validity is checked in require_auth decorator
+    data = request.get_json(silent=True) or {}
+    credential = data.get("code") or data.get("id_token")
+    if not credential:
+        return _link_oauth_account(provider)
+
+    key = (request.user, provider, hashlib.sha256(str(credential).encode("utf-8")).hexdigest())
+    return singleflight(key, lambda: _link_oauth_account(provider))
+
+
+def _link_oauth_account(provider):
+    """Exchange OAuth credentials and link the provider account to the current user"""
 
     username = request.user
 
@@ -1107,7 +1850,7 @@ def link_oauth_account(provider):
                 return jsonify({"error": "Google OAuth not configured"}), 500
 
             try:
-                import requests
+                http = get_http_session()
 
                 # Exchange code for token
                 token_url = "https://oauth2.googleapis.com/token"
@@ -1119,7 +1862,7 @@ def link_oauth_account(provider):
                     "grant_type": "authorization_code",
                 }
 
-                token_response = requests.post(token_url, data=token_data, timeout=10)
+                token_response = http.post(token_url, data=token_data, timeout=10)
                 if token_response.status_code != 200:
                     return jsonify({"error": "Failed to exchange code for token"}), 400
 
@@ -1129,31 +1872,43 @@ def link_oauth_account(provider):
                 if not access_token:
                     return jsonify({"error": "No access token received"}), 400
 
-                # Get user info from Google
-                userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-                headers = {"Authorization": f"Bearer {access_token}"}
-                userinfo_response = requests.get(userinfo_url, headers=headers, timeout=10)
+                # Prefer the identity in the id_token; only query userinfo when it is missing
+                google_id, _ = _unverified_sub_email(token_json.get("id_token"))
+                if not google_id:
+                    userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
+                    headers = {"Authorization": f"Bearer {access_token}"}
+                    userinfo_response = http.get(userinfo_url, headers=headers, timeout=10)
 
-                if userinfo_response.status_code != 200:
-                    return jsonify({"error": "Failed to get user info"}), 400
+                    if userinfo_response.status_code != 200:
+                        return jsonify({"error": "Failed to get user info"}), 400
 
-                userinfo = userinfo_response.json()
-                google_id = userinfo.get("id")
+                    userinfo = userinfo_response.json()
+                    google_id = userinfo.get("id")
 
                 if not google_id:
                     return jsonify({"error": "Invalid user info from Google"}), 400
 
                 oauth_id = f"google:{google_id}"
 
+                # Re-linking an already linked account is a no-op
+                existing_providers = USERS[username].get("oauth_providers", [])
+                if oauth_id in existing_providers:
+                    return jsonify(
+                        {
+                            "success": True,
+                            "message": "Google account already linked",
+                            "oauth_providers": existing_providers,
+                        }
+                    )
+
                 # Check if this OAuth account is already linked to another user
                 for user_key, user_data_check in USERS.items():
                     if user_key != username and oauth_id in user_data_check.get("oauth_providers", []):
                         return jsonify({"error": "This account is already linked to another user"}), 400
 
                 # Link to current user
-                if oauth_id not in USERS[username].get("oauth_providers", []):
-                    USERS[username].setdefault("oauth_providers", []).append(oauth_id)
-                    save_users()
+                USERS[username].setdefault("oauth_providers", []).append(oauth_id)
+                save_users()
 
                 return jsonify(
                     {
@@ -1185,15 +1940,25 @@ def link_oauth_account(provider):
 
             oauth_id = f"apple:{apple_id}"
 
+            # Re-linking an already linked account is a no-op
+            existing_providers = USERS[username].get("oauth_providers", [])
+            if oauth_id in existing_providers:
+                return jsonify(
+                    {
+                        "success": True,
+                        "message": "Apple account already linked",
+                        "oauth_providers": existing_providers,
+                    }
+                )
+
             # Check if this OAuth account is already linked to another user
             for user_key, user_data_check in USERS.items():
                 if user_key != username and oauth_id in user_data_check.get("oauth_providers", []):
                     return jsonify({"error": "This account is already linked to another user"}), 400
 
             # Link to current user
-            if oauth_id not in USERS[username].get("oauth_providers", []):
-                USERS[username].setdefault("oauth_providers", []).append(oauth_id)
-                save_users()
+            USERS[username].setdefault("oauth_providers", []).append(oauth_id)
+            save_users()
 
             return jsonify(
                 {
@@ -1298,7 +2063,7 @@ def apple_oauth_callback():
                 "oauth_providers": [oauth_id],
                 "role": "admin" if len(USERS) == 0 else "user",
                 "enabled": True,
-                "created": datetime.now(timezone.utc).isoformat(),
+                "created": now_iso(),
             }
             save_users()
         else:
@@ -1339,7 +2104,7 @@ def list_api_keys():
                     "created": info.get("created", ""),
                 }
             )
-        return jsonify({"success": True, "keys": keys_list}), 200
+        return fast_jsonify({"success": True, "keys": keys_list})
     except Exception as e:
         return jsonify({"error": f"Failed to list API keys: {str(e)}"}), 500
 
@@ -1364,7 +2129,7 @@ def create_api_key():
             "name": name,
             "description": description,
             "enabled": True,
-            "created": datetime.now(timezone.utc).isoformat(),
+            "created": now_iso(),
         }
 
         if not save_api_keys():
@@ -1481,7 +2246,7 @@ def list_users():
                     "created": user_info.get("created", ""),
                 }
             )
-        return jsonify({"success": True, "users": users_list}), 200
+        return fast_jsonify({"success": True, "users": users_list})
     except Exception as e:
         return jsonify({"error": f"Failed to list users: {str(e)}"}), 500
 
@@ -1507,19 +2272,17 @@ def update_user_role(username):
                 400,
             )
 
-        # Prevent removing the last admin
-        if USERS[username].get("role") == "admin" and new_role != "admin":
-            admin_count = sum(1 for u in USERS.values() if u.get("role") == "admin" and u.get("enabled", True))
-            if admin_count <= 1:
-                return (
-                    jsonify({"error": "Cannot remove the last admin. At least one admin user must exist."}),
-                    400,
-                )
+        with _users_lock:
+            # Prevent removing the last admin
+            if new_role != "admin":
+                error = _guard_last_admin(username, "remove")
+                if error:
+                    return error
 
-        USERS[username]["role"] = new_role
+            USERS[username]["role"] = new_role
 
-        if not save_users():
-            return jsonify({"error": "Failed to save changes"}), 500
+            if not save_users():
+                return jsonify({"error": "Failed to save changes"}), 500
 
         return (
             jsonify(
@@ -1543,24 +2306,21 @@ def delete_user(username):
         if username not in USERS:
             return jsonify({"error": "User not found"}), 404
 
-        # Prevent deleting the last admin
-        if USERS[username].get("role") == "admin":
-            admin_count = sum(1 for u in USERS.values() if u.get("role") == "admin" and u.get("enabled", True))
-            if admin_count <= 1:
-                return (
-                    jsonify({"error": "Cannot delete the last admin. At least one admin user must exist."}),
-                    400,
-                )
+        with _users_lock:
+            # Prevent deleting the last admin
+            error = _guard_last_admin(username, "delete")
+            if error:
+                return error
 
-        # Prevent users from deleting themselves
-        current_user = getattr(request, "user", None)
-        if current_user == username:
-            return jsonify({"error": "Cannot delete your own account"}), 400
+            # Prevent users from deleting themselves
+            current_user = getattr(request, "user", None)
+            if current_user == username:
+                return jsonify({"error": "Cannot delete your own account"}), 400
 
-        del USERS[username]
+            del USERS[username]
 
-        if not save_users():
-            return jsonify({"error": "Failed to save changes"}), 500
+            if not save_users():
+                return jsonify({"error": "Failed to save changes"}), 500
 
         return jsonify({"success": True, "message": f"User '{username}' deleted"}), 200
     except Exception as e:
@@ -1593,25 +2353,26 @@ def disable_user(username):
         if username not in USERS:
             return jsonify({"error": "User not found"}), 404
 
-        # Prevent disabling the last admin
-        if USERS[username].get("role") == "admin":
-            admin_count = sum(1 for u in USERS.values() if u.get("role") == "admin" and u.get("enabled", True))
-            if admin_count <= 1:
-                return (
-                    jsonify({"error": "Cannot disable the last admin. At least one admin user must exist."}),
-                    400,
-                )
+        with _users_lock:
+            # Prevent disabling the last admin
+            error = _guard_last_admin(username, "disable")
+            if error:
+                return error
 
-        USERS[username]["enabled"] = False
+            USERS[username]["enabled"] = False
 
-        if not save_users():
-            return jsonify({"error": "Failed to save changes"}), 500
+            if not save_users():
+                return jsonify({"error": "Failed to save changes"}), 500
 
         return jsonify({"success": True, "message": "User disabled"}), 200
     except Exception as e:
         return jsonify({"error": f"Failed to disable user: {str(e)}"}), 500
 
 
+# Serialized /api/permissions bodies keyed by (role, user exists); permissions are static per role
+_PERMISSIONS_PAYLOADS = {}
+
+
 @app.route("/api/permissions", methods=["GET"])
 @require_auth
 def get_permissions():
@@ -1621,21 +2382,21 @@ def get_permissions():
         if not username:
             return jsonify({"error": "Authentication required"}), 401
 
-        user_permissions = get_user_permissions(username)
         user_role = USERS.get(username, {}).get("role", "user")
+        cache_key = (user_role, username in USERS)
+        body = _PERMISSIONS_PAYLOADS.get(cache_key)
+        if body is None:
+            payload = {
+                "success": True,
+                "permissions": get_user_permissions(username),
+                "role": user_role,
+                "all_permissions": PERMISSIONS,
+                "role_permissions": ROLE_PERMISSIONS,
+            }
+            body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode("utf-8")
+            _PERMISSIONS_PAYLOADS[cache_key] = body
 
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "permissions": user_permissions,
-                    "role": user_role,
-                    "all_permissions": PERMISSIONS,
-                    "role_permissions": ROLE_PERMISSIONS,
-                }
-            ),
-            200,
-        )
+        return app.response_class(body, status=200, mimetype="application/json")
     except Exception as e:
         return jsonify({"error": f"Failed to get permissions: {str(e)}"}), 500
 
@@ -1661,21 +2422,33 @@ def list_roles():
 @require_permission("server.view")
 def get_status():
     """Get server status"""
-    # Check if server is running
-    try:
-        result = subprocess.run(
-            ["docker", "ps", "--filter", "name=minecraft-server", "--format", "{{.Status}}"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        is_running = "Up" in result.stdout if result.returncode == 0 else False
-        status_text = result.stdout if result.returncode == 0 else "Unknown"
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        is_running = False
-        status_text = "Unable to check status"
+    # Check if server is running (Engine API socket first, docker CLI as fallback)
+    status_text = None
+    client = docker_api()
+    if client:
+        try:
+            statuses = ttl_cached(
+                ("api", "status"), DOCKER_STATUS_TTL, lambda: client.container_statuses(MINECRAFT_CONTAINER)
+            )
+            status_text = "".join(f"{status}\n" for status in statuses)
+            is_running = "Up" in status_text
+        except DockerError:
+            status_text = None
+
+    if status_text is None:
+        try:
+            result = run_docker_cached(
+                ["docker", "ps", "--filter", f"name={MINECRAFT_CONTAINER}", "--format", "{{.Status}}"],
+                ttl=DOCKER_STATUS_TTL,
+                timeout=5,
+            )
+            is_running = "Up" in result.stdout if result.returncode == 0 else False
+            status_text = result.stdout if result.returncode == 0 else "Unknown"
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            is_running = False
+            status_text = "Unable to check status"
 
-    return jsonify({"running": is_running, "status": status_text, "timestamp": datetime.now(timezone.utc).isoformat()})
+    return fast_jsonify({"running": is_running, "status": status_text, "timestamp": now_iso()})
 
 
 @app.route("/api/server/start", methods=["POST"])
@@ -1685,7 +2458,7 @@ def start_server():
     username = get_username_from_request()
     log_audit_event(username, "server.start", {"action": "start_server"})
 
-    stdout, stderr, code = run_script("manage.sh", "start")
+    stdout, stderr, code = run_script_pooled("manage.sh", "start")
 
     if code == 0:
         output = stdout.decode("utf-8", errors="replace") if isinstance(stdout, bytes) else stdout
@@ -1703,7 +2476,7 @@ def start_server():
 @require_permission("server.control")
 def stop_server():
     """Stop the server"""
-    stdout, stderr, code = run_script("manage.sh", "stop")
+    stdout, stderr, code = run_script_pooled("manage.sh", "stop")
 
     if code == 0:
         return jsonify({"success": True, "message": "Server stopping", "output": stdout}), 200
@@ -1715,7 +2488,7 @@ def stop_server():
 @require_permission("server.control")
 def restart_server():
     """Restart the server"""
-    stdout, stderr, code = run_script("manage.sh", "restart")
+    stdout, stderr, code = run_script_pooled("manage.sh", "restart")
 
     if code == 0:
         return jsonify({"success": True, "message": "Server restarting", "output": stdout}), 200
@@ -1754,7 +2527,7 @@ def send_command():
     username = get_username_from_request()
     log_audit_event(username, "server.command", {"command": sanitize_string(command[:100])})
 
-    stdout, stderr, code = run_script("rcon-client.sh", "command", command)
+    stdout, stderr, code = rcon_command(command, fallback=run_command_script)
 
     if code == 0:
         # Sanitize response before returning
@@ -1777,7 +2550,7 @@ def create_backup():
     username = get_username_from_request()
     log_audit_event(username, "backup.create", {"action": "create_backup"})
 
-    stdout, stderr, code = run_script("manage.sh", "backup")
+    stdout, stderr, code = run_script_pooled("manage.sh", "backup")
 
     if code == 0:
         output = stdout.decode("utf-8", errors="replace") if isinstance(stdout, bytes) else stdout
@@ -1792,24 +2565,38 @@ def create_backup():
 def list_backups():
     """List available backups"""
     backups_dir = PROJECT_ROOT / "backups"
-    backups = []
-
-    if backups_dir.exists():
-        for backup_file in backups_dir.glob("minecraft_backup_*.tar.gz"):
-            stat = backup_file.stat()
-            backups.append(
-                {
-                    "name": backup_file.name,
-                    "size": stat.st_size,
-                    "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "path": str(backup_file.relative_to(PROJECT_ROOT)),
-                }
-            )
+    entries = []
 
-    # Sort by creation time (newest first)
-    backups.sort(key=lambda x: x["created"], reverse=True)
+    try:
+        with os.scandir(backups_dir) as it:
+            for entry in it:
+                if _BACKUP_NAME.match(entry.name) and entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, entry.name, st.st_size))
+    except FileNotFoundError:
+        pass
+
+    # Sort by creation time (newest first) on the raw mtime, then format
+    entries.sort(reverse=True)
+    etag = hashlib.blake2b(repr(entries).encode("utf-8"), digest_size=12).hexdigest()
+    unchanged = not_modified(etag)
+    if unchanged is not None:
+        return unchanged
+
+    rel_dir = backups_dir.relative_to(PROJECT_ROOT)
+    backups = [
+        {
+            "name": name,
+            "size": size,
+            "created": datetime.fromtimestamp(mtime).isoformat(),
+            "path": str(rel_dir / name),
+        }
+        for mtime, name, size in entries
+    ]
 
-    return jsonify({"backups": backups, "count": len(backups)})
+    response = fast_jsonify({"backups": backups, "count": len(backups)})
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @app.route("/api/scheduler/schedules", methods=["GET"])
@@ -1818,11 +2605,10 @@ def list_schedules():
     """List all scheduled commands"""
     try:
         if not SCHEDULE_FILE.exists():
-            return jsonify({"success": True, "schedules": []}), 200
+            return fast_jsonify({"success": True, "schedules": []})
 
-        with open(SCHEDULE_FILE, "r") as f:
-            schedule_data = json.load(f)
-        return jsonify({"success": True, "schedules": schedule_data.get("schedules", [])}), 200
+        schedule_data = load_json_file(SCHEDULE_FILE)
+        return fast_jsonify({"success": True, "schedules": schedule_data.get("schedules", [])})
     except Exception as e:
         return jsonify({"error": f"Failed to list schedules: {str(e)}"}), 500
 
@@ -1843,12 +2629,9 @@ def create_schedule():
         # Load existing schedules
         schedule_data = {"schedules": []}
         if SCHEDULE_FILE.exists():
-            with open(SCHEDULE_FILE, "r") as f:
-                schedule_data = json.load(f)
+            schedule_data = load_json_file(SCHEDULE_FILE)
 
         # Generate ID
-        import uuid
-
         schedule_id = str(uuid.uuid4())
 
         # Create schedule entry
@@ -1857,7 +2640,7 @@ def create_schedule():
             "command": command,
             "type": schedule_type,
             "enabled": enabled,
-            "created": datetime.now(timezone.utc).isoformat(),
+            "created": now_iso(),
             "last_run": None,
         }
 
@@ -1874,8 +2657,7 @@ def create_schedule():
 
         # Save
         SCHEDULE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(SCHEDULE_FILE, "w") as f:
-            json.dump(schedule_data, f, indent=2)
+        write_json_file(SCHEDULE_FILE, schedule_data, indent=False)
 
         username = get_username_from_request()
         log_audit_event(username, "scheduler.create", {"schedule_id": schedule_id, "command": command})
@@ -1895,8 +2677,7 @@ def update_schedule(schedule_id):
         if not SCHEDULE_FILE.exists():
             return jsonify({"error": "Schedule not found"}), 404
 
-        with open(SCHEDULE_FILE, "r") as f:
-            schedule_data = json.load(f)
+        schedule_data = load_json_file(SCHEDULE_FILE)
 
         schedules = schedule_data.get("schedules", [])
         schedule = None
@@ -1923,8 +2704,7 @@ def update_schedule(schedule_id):
             schedule["day_of_week"] = data["day_of_week"]
 
         # Save
-        with open(SCHEDULE_FILE, "w") as f:
-            json.dump(schedule_data, f, indent=2)
+        write_json_file(SCHEDULE_FILE, schedule_data, indent=False)
 
         username = get_username_from_request()
         log_audit_event(username, "scheduler.update", {"schedule_id": schedule_id})
@@ -1942,15 +2722,15 @@ def delete_schedule(schedule_id):
         if not SCHEDULE_FILE.exists():
             return jsonify({"error": "Schedule not found"}), 404
 
-        with open(SCHEDULE_FILE, "r") as f:
-            schedule_data = json.load(f)
+        schedule_data = load_json_file(SCHEDULE_FILE)
 
         schedules = schedule_data.get("schedules", [])
-        schedule_data["schedules"] = [s for s in schedules if s.get("id") != schedule_id]
+        remaining = [s for s in schedules if s.get("id") != schedule_id]
 
-        # Save
-        with open(SCHEDULE_FILE, "w") as f:
-            json.dump(schedule_data, f, indent=2)
+        # Save (an unknown id still succeeds, but leaves the file untouched)
+        if len(remaining) != len(schedules):
+            schedule_data["schedules"] = remaining
+            write_json_file(SCHEDULE_FILE, schedule_data, indent=False)
 
         username = get_username_from_request()
         log_audit_event(username, "scheduler.delete", {"schedule_id": schedule_id})
@@ -1960,6 +2740,62 @@ def delete_schedule(schedule_id):
         return jsonify({"error": f"Failed to delete schedule: {str(e)}"}), 500
 
 
+def tail_lines(path, n, chunk_size=64 * 1024):
+    """Return the last n non-empty lines of a file (bytes, oldest first), reading backwards in chunks"""
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b""  # Start of the file-wise first line read so far, which may continue in the next chunk back
+        blocks = []  # Complete lines of each chunk, newest chunk first
+        found = 0
+        while position > 0 and found < n:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            # Only the new chunk (plus the carried-over fragment) is split
+            pieces = (f.read(read_size) + partial).split(b"\n")
+            partial = pieces[0]
+            block = [line for line in pieces[1:] if line.strip()]
+            blocks.append(block)
+            found += len(block)
+        if position == 0 and partial.strip():
+            blocks.append([partial])
+        lines = [line for block in reversed(blocks) for line in block]
+        return lines[-n:]
+
+
+# Parsed-entry count of the audit log up to "offset" (the end of its last complete line); advanced as the
+# append-only log grows and recounted from the start if the file is replaced or truncated
+_audit_count_state = {"key": None, "offset": 0, "count": 0}
+_audit_count_lock = threading.Lock()
+
+
+def count_audit_entries():
+    """Number of parseable entries in the audit log, reading only what was appended since the last call"""
+    with _audit_count_lock:
+        st = os.stat(AUDIT_LOG_FILE)
+        key = (str(AUDIT_LOG_FILE), st.st_dev, st.st_ino)
+        state = _audit_count_state
+        if state["key"] != key or st.st_size < state["offset"]:
+            state.update(key=key, offset=0, count=0)
+        if st.st_size > state["offset"]:
+            with open(AUDIT_LOG_FILE, "rb") as f:
+                f.seek(state["offset"])
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Still being written; counted once complete
+                    state["offset"] += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        _json_loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    state["count"] += 1
+        return state["count"]
+
+
 @app.route("/api/audit/logs", methods=["GET"])
 @require_permission("logs.view")
 def get_audit_logs():
@@ -1970,28 +2806,58 @@ def get_audit_logs():
         action_filter = request.args.get("action")
         username_filter = request.args.get("username")
 
+        # Include events still waiting in the writer queue
+        flush_audit_log()
+
+        audit_index = get_audit_index()
+        if audit_index:
+            try:
+                total, logs = audit_index.query(action_filter, username_filter, limit, offset)
+                return (
+                    jsonify({"success": True, "logs": logs, "total": total, "limit": limit, "offset": offset}),
+                    200,
+                )
+            except Exception as e:
+                # Fall back to scanning the log file
+                print(f"Audit index query failed: {e}")
+
+        # Unfiltered: the log is append-only and chronological, so only the newest lines need reading
+        if not action_filter and not username_filter:
+            logs = []
+            total = 0
+            if AUDIT_LOG_FILE.exists() and offset >= 0 and limit > 0:
+                for line in reversed(tail_lines(AUDIT_LOG_FILE, offset + limit)):
+                    try:
+                        logs.append(_json_loads(line))
+                    except json.JSONDecodeError:
+                        continue
+                logs = logs[offset : offset + limit]
+                total = count_audit_entries()
+            return (
+                jsonify({"success": True, "logs": logs, "total": total, "limit": limit, "offset": offset}),
+                200,
+            )
+
         logs = []
         if AUDIT_LOG_FILE.exists():
-            with open(AUDIT_LOG_FILE, "r", encoding="utf-8") as f:
+            with open(AUDIT_LOG_FILE, "rb") as f:
                 for line in f:
-                    if line.strip():
-                        try:
-                            log_entry = json.loads(line.strip())
-                            # Apply filters
-                            if action_filter and log_entry.get("action") != action_filter:
-                                continue
-                            if username_filter and log_entry.get("username") != username_filter:
-                                continue
-                            logs.append(log_entry)
-                        except json.JSONDecodeError:
-                            continue
-
-        # Sort by timestamp (newest first)
-        logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-
-        # Apply pagination
+                    try:
+                        log_entry = _json_loads(line)
+                    except json.JSONDecodeError:
+                        # Blank or malformed line
+                        continue
+                    # Apply filters
+                    if action_filter and log_entry.get("action") != action_filter:
+                        continue
+                    if username_filter and log_entry.get("username") != username_filter:
+                        continue
+                    logs.append(log_entry)
+
+        # Select the newest offset+limit entries (same order as a stable descending sort) and paginate
         total = len(logs)
-        logs = logs[offset : offset + limit]
+        top = heapq.nlargest(max(offset + limit, 0), logs, key=lambda x: x.get("timestamp", ""))
+        logs = top[offset : offset + limit]
 
         return (
             jsonify(
@@ -2009,6 +2875,58 @@ def get_audit_logs():
         return jsonify({"error": f"Failed to get audit logs: {str(e)}"}), 500
 
 
+# Backup filename validation: traversal characters, and the minecraft_backup_*.tar.gz format
+_UNSAFE_FILENAME = re.compile(r"\.\.|[/\\]")
+# Same match as the "minecraft_backup_*.tar.gz" glob, so every listed backup can be restored or deleted
+_BACKUP_NAME = re.compile(r"minecraft_backup_.*\.tar\.gz\Z", re.DOTALL)
+
+
+@contextmanager
+def _open_backup_stream(backup_path):
+    """Open a .tar.gz backup for sequential (non-seeking) reading, using parallel inflation when available"""
+    if RAPIDGZIP_AVAILABLE:
+        with rapidgzip.open(str(backup_path), parallelization=os.cpu_count()) as gz:
+            with tarfile.open(fileobj=gz, mode="r|") as tar:
+                yield tar
+    else:
+        with tarfile.open(backup_path, "r|gz") as tar:
+            yield tar
+
+
+def tree_hash(directory):
+    """Hash the (relative path, size, mtime) of every file under directory, for cheap change detection"""
+    entries = []
+    stack = [(str(directory), "")]
+    while stack:
+        path, rel = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                rel_name = f"{rel}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_name + "/"))
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    entries.append((rel_name, st.st_size, st.st_mtime_ns))
+    digest = hashlib.blake2b(digest_size=32)
+    for rel_name, size, mtime_ns in sorted(entries):
+        digest.update(f"{rel_name}\0{size}\0{mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _matching_pre_restore_snapshot(backups_dir, data_hash):
+    """Return the most recent pre-restore snapshot whose sidecar .hash matches data_hash, if any"""
+    snapshots = sorted(backups_dir.glob("pre_restore_*.tar.gz"), reverse=True)
+    if not snapshots:
+        return None
+    latest = snapshots[0]
+    try:
+        if Path(f"{latest}.hash").read_text().strip() == data_hash:
+            return latest
+    except OSError:
+        pass
+    return None
+
+
 @app.route("/api/backups/<path:filename>/restore", methods=["POST"])
 @require_permission("backup.restore")
 def restore_backup(filename):
@@ -2017,7 +2935,7 @@ def restore_backup(filename):
     log_audit_event(username, "backup.restore", {"filename": filename})
 
     # Check for path traversal attacks first
-    if ".." in filename or "/" in filename or "\\" in filename:
+    if _UNSAFE_FILENAME.search(filename):
         return jsonify({"error": "Invalid backup filename"}), 400
 
     backups_dir = PROJECT_ROOT / "backups"
@@ -2028,7 +2946,7 @@ def restore_backup(filename):
         return jsonify({"error": "Backup not found"}), 404
 
     # Validate backup file format
-    if not filename.startswith("minecraft_backup_") or not filename.endswith(".tar.gz"):
+    if not _BACKUP_NAME.match(filename):
         return jsonify({"error": "Invalid backup file format"}), 400
 
     data_dir = PROJECT_ROOT / "data"
@@ -2039,27 +2957,28 @@ def restore_backup(filename):
         # Stop server before restore
         run_script("manage.sh", "stop")
 
-        # Create a backup of current state before restoring
-        current_backup = backups_dir / f"pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tar.gz"
+        # Create a backup of current state before restoring (streamed, fast compression)
+        current_backup = backups_dir / f"pre_restore_{backup_stamp()}.tar.gz"
         if data_dir.exists() and any(data_dir.iterdir()):
-            import tarfile
-
-            with tarfile.open(current_backup, "w:gz") as tar:
-                tar.add(data_dir, arcname=".")
-
-        # Extract backup — validate members first to prevent path traversal (tarslip)
-        import tarfile
-
-        def _safe_members(tf, dest):
-            resolved_dest = Path(dest).resolve()
-            for member in tf.getmembers():
+            # Unchanged since the last pre-restore snapshot: hardlink it instead of re-compressing the world
+            data_hash = tree_hash(data_dir)
+            previous = _matching_pre_restore_snapshot(backups_dir, data_hash)
+            if previous is not None:
+                os.link(previous, current_backup)
+            else:
+                with gzip.open(current_backup, "wb", compresslevel=1) as gz:
+                    with tarfile.open(fileobj=gz, mode="w|") as tar:
+                        tar.add(data_dir, arcname=".")
+            Path(f"{current_backup}.hash").write_text(data_hash)
+
+        # Extract backup in a single streaming pass — validate each member to prevent path traversal (tarslip)
+        resolved_dest = data_dir.resolve()
+        with _open_backup_stream(backup_path) as tar:
+            for member in tar:
                 member_path = (resolved_dest / member.name).resolve()
                 if not member_path.is_relative_to(resolved_dest):
                     raise ValueError(f"Unsafe path in archive member: {member.name}")
-                yield member
-
-        with tarfile.open(backup_path, "r:gz") as tar:
-            tar.extractall(path=data_dir, members=_safe_members(tar, data_dir))
+                tar.extract(member, path=data_dir)
 
         return jsonify(
             {
@@ -2077,7 +2996,7 @@ def restore_backup(filename):
 def delete_backup(filename):
     """Delete a backup"""
     # Check for path traversal attacks first
-    if ".." in filename or "/" in filename or "\\" in filename:
+    if _UNSAFE_FILENAME.search(filename):
         return jsonify({"error": "Invalid backup filename"}), 400
 
     backups_dir = PROJECT_ROOT / "backups"
@@ -2088,7 +3007,7 @@ def delete_backup(filename):
         return jsonify({"error": "Backup not found"}), 404
 
     # Validate backup file format
-    if not filename.startswith("minecraft_backup_") or not filename.endswith(".tar.gz"):
+    if not _BACKUP_NAME.match(filename):
         return jsonify({"error": "Invalid backup file format"}), 400
 
     try:
@@ -2102,37 +3021,45 @@ def delete_backup(filename):
 @require_permission("logs.view")
 def get_logs():
     """Get server logs"""
-    lines = request.args.get("lines", 100, type=int)
+    lines = min(max(request.args.get("lines", 100, type=int), 1), LOGS_MAX_LINES)
 
-    _, stderr, _ = run_script("manage.sh", "logs")
+    # Get last N lines from Docker logs (Engine API socket first, docker CLI as fallback)
+    logs = None
+    client = docker_api()
+    if client:
+        try:
+            logs = ttl_cached(
+                ("api", "logs", lines), DOCKER_LOGS_TTL, lambda: client.container_logs(MINECRAFT_CONTAINER, tail=lines)
+            )
+        except DockerError:
+            logs = None
 
-    # Get last N lines from Docker logs
-    try:
-        result = subprocess.run(
-            ["docker", "logs", "--tail", str(lines), "minecraft-server"], capture_output=True, text=True, timeout=10
-        )
-        logs = result.stdout if result.returncode == 0 else stderr
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        logs = stderr or "Unable to retrieve logs"
+    if logs is None:
+        try:
+            result = run_docker_cached(
+                ["docker", "logs", "--tail", str(lines), MINECRAFT_CONTAINER], ttl=DOCKER_LOGS_TTL, timeout=10
+            )
+            logs = result.stdout if result.returncode == 0 else result.stderr or "Unable to retrieve logs"
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            logs = "Unable to retrieve logs"
 
-    return jsonify({"logs": logs.split("\n"), "lines": len(logs.split("\n"))})
+    log_lines = logs.split("\n")
+    return jsonify({"logs": log_lines, "lines": len(log_lines)})
 
 
 @app.route("/api/players", methods=["GET"])
 @require_permission("players.view")
 def get_players():
     """Get list of online players"""
-    stdout, _, _ = run_script("rcon-client.sh", "command", "list")
+    stdout, _, _ = rcon_command("list")
 
     # Parse player list from RCON response
     players = []
     if stdout:
-        # Extract player names from RCON response
-        import re
-
-        match = re.search(r"online:\s*(.+)", stdout)
-        if match:
-            player_list = match.group(1).strip()
+        # Extract player names from RCON response ("... players online: a, b, c")
+        _, sep, tail = stdout.partition("online:")
+        if sep:
+            player_list = tail.split("\n", 1)[0]
             players = [p.strip() for p in player_list.split(",") if p.strip()]
 
     return jsonify({"players": players, "count": len(players)})
@@ -2147,10 +3074,9 @@ def get_whitelist():
         if not whitelist_file.exists():
             return jsonify({"success": True, "players": []}), 200
 
-        with open(whitelist_file, "r") as f:
-            whitelist = json.load(f)
+        whitelist = load_cached(whitelist_file, load_json_file)
 
-        return jsonify({"success": True, "players": whitelist}), 200
+        return fast_jsonify({"success": True, "players": whitelist})
     except Exception as e:
         return jsonify({"error": f"Failed to get whitelist: {str(e)}"}), 500
 
@@ -2197,10 +3123,9 @@ def get_banned():
         if not banned_file.exists():
             return jsonify({"success": True, "players": []}), 200
 
-        with open(banned_file, "r") as f:
-            banned = json.load(f)
+        banned = load_cached(banned_file, load_json_file)
 
-        return jsonify({"success": True, "players": banned}), 200
+        return fast_jsonify({"success": True, "players": banned})
     except Exception as e:
         return jsonify({"error": f"Failed to get ban list: {str(e)}"}), 500
 
@@ -2251,10 +3176,9 @@ def get_ops():
         if not ops_file.exists():
             return jsonify({"success": True, "operators": []}), 200
 
-        with open(ops_file, "r") as f:
-            ops = json.load(f)
+        ops = load_cached(ops_file, load_json_file)
 
-        return jsonify({"success": True, "operators": ops}), 200
+        return fast_jsonify({"success": True, "operators": ops})
     except Exception as e:
         return jsonify({"error": f"Failed to get operators: {str(e)}"}), 500
 
@@ -2302,13 +3226,7 @@ def get_server_properties():
         if not props_file.exists():
             return jsonify({"error": "server.properties not found"}), 404
 
-        properties = {}
-        with open(props_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    properties[key.strip()] = value.strip()
+        properties = load_cached(props_file, parse_properties_file)
 
         return jsonify({"success": True, "properties": properties}), 200
     except Exception as e:
@@ -2410,8 +3328,6 @@ def create_command_schedule():
 
         # Call Python script to add schedule
         script_path = SCRIPTS_DIR / "command-scheduler.py"
-        import sys
-
         result = subprocess.run(
             [sys.executable, str(script_path), "add", command, schedule_type],
             input=json.dumps(schedule_data),
@@ -2576,8 +3492,6 @@ def create_announcement():
             str(enabled),
         )
         if code == 0:
-            import json
-
             announcement = json.loads(stdout)
             return jsonify({"success": True, "announcement": announcement}), 200
         else:
@@ -2645,19 +3559,28 @@ def get_metrics():
 
     metrics = {}
 
-    # Try to get Docker stats
+    # Try to get Docker stats (Engine API socket first, docker CLI as fallback)
+    client = docker_api()
+    if client:
+        try:
+            metrics = ttl_cached(
+                ("api", "stats"), DOCKER_STATS_TTL, lambda: client.container_stats(MINECRAFT_CONTAINER)
+            )
+            return jsonify({"metrics": metrics, "timestamp": now_iso()})
+        except DockerError:
+            pass  # Fall back to the docker CLI
+
     try:
-        result = subprocess.run(
+        result = run_docker_cached(
             [
                 "docker",
                 "stats",
-                "minecraft-server",
+                MINECRAFT_CONTAINER,
                 "--no-stream",
                 "--format",
                 "{{.CPUPerc}},{{.MemUsage}},{{.MemPerc}}",
             ],
-            capture_output=True,
-            text=True,
+            ttl=DOCKER_STATS_TTL,
             timeout=5,
         )
         if result.returncode == 0 and result.stdout:
@@ -2669,7 +3592,7 @@ def get_metrics():
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass  # Metrics are best-effort; missing values are acceptable
 
-    return jsonify({"metrics": metrics, "timestamp": datetime.now(timezone.utc).isoformat()})
+    return jsonify({"metrics": metrics, "timestamp": now_iso()})
 
 
 @app.route("/api/analytics/collect", methods=["POST"])
@@ -2840,7 +3763,7 @@ def generate_custom_report():
         processor = AnalyticsProcessor()
 
         report = {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": now_iso(),
             "period_hours": hours,
             "requested_metrics": metrics,
         }
@@ -2864,6 +3787,10 @@ def generate_custom_report():
         return jsonify({"error": f"Failed to generate report: {str(e)}"}), 500
 
 
+# Lines of `world-manager.sh list` output that mention a world and carry an active/available marker
+_WORLD_LINE = re.compile(r"^(?=.*(?i:world))(?=.*(?:ACTIVE|○|✓)).*$", re.MULTILINE)
+
+
 @app.route("/api/worlds", methods=["GET"])
 @require_permission("worlds.view")
 def list_worlds():
@@ -2873,14 +3800,13 @@ def list_worlds():
     # Parse world list (basic implementation)
     worlds = []
     if stdout:
-        for line in stdout.split("\n"):
-            if "world" in line.lower() and ("ACTIVE" in line or "○" in line or "✓" in line):
-                # Extract world name (simplified parsing)
-                parts = line.split()
-                for part in parts:
-                    if part.startswith("world") or part.isalnum():
-                        worlds.append(part)
-                        break
+        # Single scan for world lines; only matching lines are tokenized
+        for match in _WORLD_LINE.finditer(stdout):
+            # Extract world name (simplified parsing)
+            for part in match.group().split():
+                if part.startswith("world") or part.isalnum():
+                    worlds.append(part)
+                    break
 
     return jsonify({"worlds": worlds, "count": len(worlds)})
 
@@ -2927,6 +3853,28 @@ CONFIG_ALLOWED_PATHS = {
     "ddns.conf": PROJECT_ROOT / "config" / "ddns.conf",
 }
 
+# Config files other programs rewrite in place (the Minecraft server, ddns-updater.sh): their backups
+# must be full copies, since a hardlink would change along with the file
+CONFIG_WRITTEN_IN_PLACE = {"server.properties", "ddns.conf"}
+
+# (allowed paths dict, project root, ((name, abs path, relative path str), ...)) derived from CONFIG_ALLOWED_PATHS
+_CONFIG_FILES = None
+
+
+def get_config_files():
+    """Return (name, absolute path, relative path string) for each allowed config file, computed once"""
+    global _CONFIG_FILES
+    cached = _CONFIG_FILES
+    if cached is None or cached[0] is not CONFIG_ALLOWED_PATHS or cached[1] != PROJECT_ROOT:
+        files = tuple(
+            (name, path, str(path.relative_to(PROJECT_ROOT)) if path else "")
+            for name, path in CONFIG_ALLOWED_PATHS.items()
+        )
+        cached = (CONFIG_ALLOWED_PATHS, PROJECT_ROOT, files)
+        _CONFIG_FILES = cached
+    return cached[2]
+
+
 # File Browser - Allowed directories (for security)
 ALLOWED_FILE_PATHS = [
     PROJECT_ROOT / "data",
@@ -2936,25 +3884,52 @@ ALLOWED_FILE_PATHS = [
 ]
 
 
+def _resolve_allowed_roots(paths):
+    """Resolve allowed directories once, as strings with a trailing separator for prefix checks"""
+    roots = []
+    for allowed_path in paths:
+        try:
+            roots.append(str(allowed_path.resolve()) + os.sep)
+        except (ValueError, OSError):
+            continue
+    return tuple(roots)
+
+
+_ALLOWED_RESOLVED = _resolve_allowed_roots(ALLOWED_FILE_PATHS)
+
+
 @app.route("/api/config/files", methods=["GET"])
 @require_permission("config.view")
 def list_config_files():
     """List available configuration files"""
     files = []
-    for name, path in CONFIG_ALLOWED_PATHS.items():
-        exists = path.exists() if path else False
-        size = path.stat().st_size if exists and path.is_file() else 0
+    for name, path, rel_path in get_config_files():
+        try:
+            st = os.stat(path) if path else None
+        except OSError:
+            st = None
         files.append(
             {
                 "name": name,
-                "path": str(path.relative_to(PROJECT_ROOT)) if path else "",
-                "exists": exists,
-                "size": size,
+                "path": rel_path,
+                "exists": st is not None,
+                "size": st.st_size if st is not None and stat.S_ISREG(st.st_mode) else 0,
             }
         )
     return jsonify({"files": files})
 
 
+# Internal nginx location that serves PROJECT_ROOT (e.g. "/_internal_files/"); empty disables X-Accel-Redirect
+CONFIG_ACCEL_REDIRECT = os.environ.get("CONFIG_ACCEL_REDIRECT", "")
+CONFIG_ACCEL_MIN_SIZE = 64 * 1024
+
+
+def _prefers_plain_text():
+    """Check whether the client asked for text/plain over JSON"""
+    accept = request.accept_mimetypes
+    return accept["text/plain"] > accept["application/json"]
+
+
 @app.route("/api/config/files/<path:filename>", methods=["GET"])
 @require_permission("config.view")
 def get_config_file(filename):
@@ -2981,10 +3956,21 @@ def get_config_file(filename):
     if not file_path.exists():
         return jsonify({"error": "File not found"}), 404
 
+    # Large files requested as plain text are handed to the reverse proxy to stream with sendfile
+    if CONFIG_ACCEL_REDIRECT and _prefers_plain_text():
+        try:
+            if file_path.stat().st_size > CONFIG_ACCEL_MIN_SIZE:
+                rel_path = file_path.relative_to(PROJECT_ROOT).as_posix()
+                response = app.response_class("", mimetype="text/plain")
+                response.headers["X-Accel-Redirect"] = f"{CONFIG_ACCEL_REDIRECT.rstrip('/')}/{rel_path}"
+                return response
+        except (OSError, ValueError):
+            pass  # Fall back to the JSON response
+
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
-        return jsonify(
+        return fast_jsonify(
             {
                 "name": filename,
                 "path": str(file_path.relative_to(PROJECT_ROOT)),
@@ -3023,80 +4009,64 @@ def save_config_file(filename):
                     data_dir.mkdir(parents=True, exist_ok=True)
                 file_path = data_dir / "server.properties"
 
-    # Create backup before saving
-    backup_dir = PROJECT_ROOT / "backups" / "config"
-    backup_dir.mkdir(parents=True, exist_ok=True)
-
-    if file_path.exists():
-        backup_path = backup_dir / f"{filename}.{datetime.now().strftime('%Y%m%d_%H%M%S')}.backup"
-        try:
-            import shutil
-
-            shutil.copy2(file_path, backup_path)
-        except Exception as e:
-            return jsonify({"error": f"Failed to create backup: {str(e)}"}), 500
-
     # Validate content (basic validation)
     content = data["content"]
 
     # Validate based on file type
     if filename.endswith(".properties"):
         # Basic properties file validation
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
-            if line and not line.startswith("#") and "=" not in line:
+        for i in invalid_properties_lines(content):
+            return (
+                jsonify(
+                    {
+                        "error": f"Invalid properties format at line {i}",
+                        "line": i,
+                    }
+                ),
+                400,
+            )
+    elif filename.endswith(".yml") or filename.endswith(".yaml"):
+        # Basic YAML validation (skipped if YAML library not available)
+        if YAML_AVAILABLE:
+            try:
+                yaml.load(content, Loader=YamlSafeLoader)
+            except yaml.YAMLError as e:
                 return (
                     jsonify(
                         {
-                            "error": f"Invalid properties format at line {i}",
-                            "line": i,
+                            "error": f"Invalid YAML format: {str(e)}",
                         }
                     ),
                     400,
                 )
-    elif filename.endswith(".yml") or filename.endswith(".yaml"):
-        # Basic YAML validation
-        try:
-            import yaml
 
-            yaml.safe_load(content)
-        except ImportError:
-            pass  # YAML library not available, skip validation
-        except yaml.YAMLError as e:
-            return (
-                jsonify(
-                    {
-                        "error": f"Invalid YAML format: {str(e)}",
-                    }
-                ),
-                400,
-            )
+    # Create backup before saving
+    backup_dir = PROJECT_ROOT / "backups" / "config"
+    backup_dir.mkdir(parents=True, exist_ok=True)
+
+    backup_path = None
+    if file_path.exists():
+        backup_path = backup_dir / f"{filename}.{backup_stamp()}.backup"
+        try:
+            backup_file(file_path, backup_path, link=filename not in CONFIG_WRITTEN_IN_PLACE)
+        except Exception as e:
+            return jsonify({"error": f"Failed to create backup: {str(e)}"}), 500
 
-    # Save file
+    # Save file (the original is only replaced once the new content is fully written)
     try:
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        atomic_write(file_path, content)
 
         return jsonify(
             {
                 "success": True,
                 "message": "File saved successfully",
-                "backup": str(backup_path.relative_to(PROJECT_ROOT)) if file_path.exists() else None,
+                "backup": str(backup_path.relative_to(PROJECT_ROOT)) if backup_path else None,
             }
         )
     except Exception as e:
-        # Restore from backup on failure
-        if file_path.exists() and "backup_path" in locals() and backup_path.exists():
-            try:
-                import shutil
-
-                shutil.copy2(backup_path, file_path)
-            except Exception:
-                pass  # Restore attempt is best-effort
         return jsonify({"error": f"Failed to save file: {str(e)}"}), 500
 
 
@@ -3117,31 +4087,26 @@ def validate_config_file(filename):
 
     # Validate based on file type
     if filename.endswith(".properties"):
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            if line_stripped and not line_stripped.startswith("#"):
-                if "=" not in line_stripped:
-                    errors.append(
-                        {
-                            "line": i,
-                            "message": "Missing '=' separator",
-                        }
-                    )
-    elif filename.endswith(".yml") or filename.endswith(".yaml"):
-        try:
-            import yaml
-
-            yaml.safe_load(content)
-        except ImportError:
-            warnings.append({"message": "YAML validation unavailable"})
-        except yaml.YAMLError as e:
+        for i in invalid_properties_lines(content):
             errors.append(
                 {
-                    "line": getattr(e, "problem_mark", {}).line if hasattr(e, "problem_mark") else 0,
-                    "message": str(e),
+                    "line": i,
+                    "message": "Missing '=' separator",
                 }
             )
+    elif filename.endswith(".yml") or filename.endswith(".yaml"):
+        if not YAML_AVAILABLE:
+            warnings.append({"message": "YAML validation unavailable"})
+        else:
+            try:
+                yaml.load(content, Loader=YamlSafeLoader)
+            except yaml.YAMLError as e:
+                errors.append(
+                    {
+                        "line": getattr(e, "problem_mark", {}).line if hasattr(e, "problem_mark") else 0,
+                        "message": str(e),
+                    }
+                )
 
     return jsonify(
         {
@@ -3225,20 +4190,30 @@ def get_ddns_config():
 
 
 # File Browser Endpoints
+def project_relpath(path):
+    """Path relative to PROJECT_ROOT as a string, by prefix slicing instead of Path.relative_to"""
+    path = os.fspath(path)
+    root_prefix = os.fspath(PROJECT_ROOT) + os.sep
+    if path.startswith(root_prefix):
+        return path[len(root_prefix) :]
+    return str(Path(path).relative_to(PROJECT_ROOT))
+
+
+@lru_cache(maxsize=4096)
+def _is_resolved_path_allowed(resolved):
+    """Prefix check of an already-resolved path against the allowed roots (pure, so safe to cache)"""
+    resolved += os.sep
+    return any(resolved.startswith(root) for root in _ALLOWED_RESOLVED)
+
+
 def is_path_allowed(file_path):
     """Check if a file path is within allowed directories"""
+    # Resolution is never cached: symlinks can change between requests
     try:
-        resolved_path = Path(file_path).resolve()
-        for allowed_path in ALLOWED_FILE_PATHS:
-            try:
-                allowed_resolved = allowed_path.resolve()
-                if resolved_path.is_relative_to(allowed_resolved):
-                    return True
-            except (ValueError, OSError):
-                continue
-        return False
+        resolved = os.path.realpath(file_path)
     except (ValueError, OSError):
         return False
+    return _is_resolved_path_allowed(resolved)
 
 
 @app.route("/api/files/list", methods=["GET"])
@@ -3255,7 +4230,7 @@ def list_files():
                     roots.append(
                         {
                             "name": allowed_path.name,
-                            "path": str(allowed_path.relative_to(PROJECT_ROOT)),
+                            "path": project_relpath(allowed_path),
                             "type": "directory",
                             "size": 0,
                         }
@@ -3274,32 +4249,40 @@ def list_files():
             return jsonify({"error": "Path is not a directory"}), 400
 
         # List directory contents
-        files = []
         try:
-            for item in file_path.iterdir():
-                try:
-                    stat = item.stat()
-                    files.append(
-                        {
-                            "name": item.name,
-                            "path": str(item.relative_to(PROJECT_ROOT)),
-                            "type": "directory" if item.is_dir() else "file",
-                            "size": stat.st_size if item.is_file() else 0,
-                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        }
+            # One scandir pass; each entry is stat'ed once (following symlinks, as before)
+            rel_dir = project_relpath(file_path)
+            rel_prefix = rel_dir + os.sep
+            entries = []
+            with os.scandir(file_path) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    is_dir = stat.S_ISDIR(st.st_mode)
+                    entries.append(
+                        (
+                            # Sort: directories first, then files, both alphabetically
+                            (not is_dir, entry.name.lower()),
+                            {
+                                "name": entry.name,
+                                "path": rel_prefix + entry.name,
+                                "type": "directory" if is_dir else "file",
+                                "size": st.st_size if stat.S_ISREG(st.st_mode) else 0,
+                                "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
+                            },
+                        )
                     )
-                except (OSError, PermissionError):
-                    continue
-
-            # Sort: directories first, then files, both alphabetically
-            files.sort(key=lambda x: (x["type"] != "directory", x["name"].lower()))
+            entries.sort(key=lambda item: item[0])
+            files = [info for _, info in entries]
 
             return (
                 jsonify(
                     {
                         "success": True,
                         "files": files,
-                        "path": str(file_path.relative_to(PROJECT_ROOT)),
+                        "path": rel_dir,
                     }
                 ),
                 200,
@@ -3310,6 +4293,13 @@ def list_files():
         return jsonify({"error": f"Failed to list files: {str(e)}"}), 500
 
 
+# Recently read file contents, keyed on (path, inode, mtime_ns, size) so edits are always picked up
+READ_FILE_MAX_BYTES = 1024 * 1024
+READ_FILE_CACHE_SIZE = 32
+_READ_FILE_CACHE = OrderedDict()
+_read_file_cache_lock = threading.Lock()
+
+
 @app.route("/api/files/read", methods=["GET"])
 @require_permission("config.view")
 def read_file():
@@ -3323,32 +4313,50 @@ def read_file():
         if not is_path_allowed(file_path):
             return jsonify({"error": "Path not allowed"}), 403
 
-        if not file_path.exists():
+        # One open + fstat + pread: the stat result drives every check and the read size
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
             return jsonify({"error": "File not found"}), 404
-
-        if not file_path.is_file():
-            return jsonify({"error": "Path is not a file"}), 400
-
-        # Check file size (limit to 1MB for safety)
-        if file_path.stat().st_size > 1024 * 1024:
-            return jsonify({"error": "File too large (max 1MB)"}), 400
-
         try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-            return (
-                jsonify(
-                    {
-                        "success": True,
-                        "content": content,
-                        "path": str(file_path.relative_to(PROJECT_ROOT)),
-                        "size": file_path.stat().st_size,
-                    }
-                ),
-                200,
-            )
-        except UnicodeDecodeError:
-            return jsonify({"error": "File is not a text file"}), 400
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                return jsonify({"error": "Path is not a file"}), 400
+
+            # Check file size (limit to 1MB for safety)
+            if st.st_size > READ_FILE_MAX_BYTES:
+                return jsonify({"error": "File too large (max 1MB)"}), 400
+
+            etag = f"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"
+            unchanged = not_modified(etag)
+            if unchanged is not None:
+                return unchanged
+
+            key = (str(file_path), st.st_ino, st.st_mtime_ns, st.st_size)
+            with _read_file_cache_lock:
+                content = _READ_FILE_CACHE.get(key)
+                if content is not None:
+                    _READ_FILE_CACHE.move_to_end(key)
+            if content is None:
+                # Read outside the lock; a concurrent reader of the same file stores identical content
+                content = os.pread(fd, st.st_size, 0).decode("utf-8", errors="replace")
+                with _read_file_cache_lock:
+                    _READ_FILE_CACHE[key] = content
+                    while len(_READ_FILE_CACHE) > READ_FILE_CACHE_SIZE:
+                        _READ_FILE_CACHE.popitem(last=False)
+        finally:
+            os.close(fd)
+
+        response = jsonify(
+            {
+                "success": True,
+                "content": content,
+                "path": project_relpath(file_path),
+                "size": st.st_size,
+            }
+        )
+        response.set_etag(etag, weak=True)
+        return response, 200
     except Exception as e:
         return jsonify({"error": f"Failed to read file: {str(e)}"}), 500
 
@@ -3374,43 +4382,30 @@ def write_file():
         if file_path.exists():
             backup_dir = PROJECT_ROOT / "backups" / "file-edits"
             backup_dir.mkdir(parents=True, exist_ok=True)
-            backup_path = backup_dir / f"{file_path.name}.{datetime.now().strftime('%Y%m%d_%H%M%S')}.backup"
+            backup_path = backup_dir / f"{file_path.name}.{backup_stamp()}.backup"
             try:
-                import shutil
-
-                shutil.copy2(file_path, backup_path)
+                backup_file(file_path, backup_path)
             except Exception:
                 pass  # Backup copy is optional; failure is non-fatal
 
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write file
+        # Write file (atomically, so a failed write leaves the original untouched)
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            atomic_write(file_path, content)
             return (
                 jsonify(
                     {
                         "success": True,
                         "message": "File saved successfully",
-                        "path": str(file_path.relative_to(PROJECT_ROOT)),
-                        "backup": (
-                            str(backup_path.relative_to(PROJECT_ROOT)) if backup_path and backup_path.exists() else None
-                        ),
+                        "path": project_relpath(file_path),
+                        "backup": project_relpath(backup_path) if backup_path and backup_path.exists() else None,
                     }
                 ),
                 200,
             )
         except Exception as e:
-            # Restore from backup on failure
-            if backup_path and backup_path.exists():
-                try:
-                    import shutil
-
-                    shutil.copy2(backup_path, file_path)
-                except Exception:
-                    pass  # Restore attempt is best-effort
             return jsonify({"error": f"Failed to write file: {str(e)}"}), 500
     except Exception as e:
         return jsonify({"error": f"Failed to write file: {str(e)}"}), 500
@@ -3439,8 +4434,6 @@ def delete_file():
 
         try:
             if file_path.is_dir():
-                import shutil
-
                 shutil.rmtree(file_path)
             else:
                 file_path.unlink()
@@ -3456,46 +4449,54 @@ def delete_file():
 def upload_file():
     """Upload a file"""
     try:
-        if "file" not in request.files:
-            return jsonify({"error": "No file provided"}), 400
+        # Reject oversized requests before reading the body
+        if request.content_length and request.content_length > UPLOAD_MAX_BYTES + 64 * 1024:
+            return jsonify({"error": "File too large (max 10MB)"}), 413
 
-        file = request.files["file"]
-        path_param = request.form.get("path", "")
+        # Spool files are removed on every path; a successful upload has already renamed its spool away
+        try:
+            try:
+                files = request.files
+            except RequestEntityTooLarge:
+                return jsonify({"error": "File too large (max 10MB)"}), 413
 
-        if not path_param:
-            return jsonify({"error": "Path required"}), 400
+            if "file" not in files:
+                return jsonify({"error": "No file provided"}), 400
 
-        if file.filename == "":
-            return jsonify({"error": "No file selected"}), 400
+            file = files["file"]
+            path_param = request.form.get("path", "")
 
-        # Check file size (limit to 10MB)
-        file.seek(0, 2)  # Seek to end
-        file_size = file.tell()
-        file.seek(0)  # Reset
-        if file_size > 10 * 1024 * 1024:
-            return jsonify({"error": "File too large (max 10MB)"}), 400
+            if not path_param:
+                return jsonify({"error": "Path required"}), 400
 
-        from werkzeug.utils import secure_filename
+            if file.filename == "":
+                return jsonify({"error": "No file selected"}), 400
 
-        safe_name = secure_filename(file.filename)
-        if not safe_name:
-            return jsonify({"error": "Invalid filename"}), 400
-        file_path = (PROJECT_ROOT / path_param / safe_name).resolve()
-        if not is_path_allowed(file_path):
-            return jsonify({"error": "Path not allowed"}), 403
+            safe_name = secure_filename(file.filename)
+            if not safe_name:
+                return jsonify({"error": "Invalid filename"}), 400
+            file_path = (PROJECT_ROOT / path_param / safe_name).resolve()
+            if not is_path_allowed(file_path):
+                return jsonify({"error": "Path not allowed"}), 403
 
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure parent directory exists
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save file
-        file.save(str(file_path))
+            # Move the spooled upload into place (ApiRequest spools every file part; a rename, so an
+            # existing file is replaced whole and no second copy of the data is made)
+            file.stream.close()
+            os.chmod(file.stream.path, 0o644)
+            shutil.move(file.stream.path, str(file_path))
+        finally:
+            for spool in request.__dict__.get("upload_spools", []):
+                spool.discard()
 
         return (
             jsonify(
                 {
                     "success": True,
                     "message": "File uploaded successfully",
-                    "path": str(file_path.relative_to(PROJECT_ROOT)),
+                    "path": project_relpath(file_path),
                 }
             ),
             200,
@@ -3509,8 +4510,6 @@ def upload_file():
 def download_file():
     """Download a file"""
     try:
-        from flask import send_file
-
         path_param = request.args.get("path", "")
         if not path_param:
             return jsonify({"error": "Path required"}), 400
@@ -3519,13 +4518,24 @@ def download_file():
         if not is_path_allowed(file_path):
             return jsonify({"error": "Path not allowed"}), 403
 
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             return jsonify({"error": "File not found"}), 404
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return jsonify({"error": "Path is not a file"}), 400
 
-        return send_file(str(file_path), as_attachment=True)
+        # Conditional (Range / If-None-Match / If-Modified-Since) response from the single stat above;
+        # the body is served through wsgi.file_wrapper, or by the front-end proxy with USE_X_SENDFILE
+        return send_file(
+            file_path,
+            as_attachment=True,
+            conditional=True,
+            etag=f"{st.st_mtime_ns:x}-{st.st_size:x}",
+            last_modified=st.st_mtime,
+            max_age=0,
+        )
     except Exception as e:
         return jsonify({"error": f"Failed to download file: {str(e)}"}), 500
 
@@ -3545,19 +4555,12 @@ def save_ddns_config():
         # Create backup if file exists
         backup_path = None
         if config_file.exists():
-            backup_path = config_file.with_suffix(f".conf.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            import shutil
+            backup_path = config_file.with_suffix(f".conf.backup.{backup_stamp()}")
+            backup_file(config_file, backup_path)
 
-            shutil.copy2(config_file, backup_path)
-
-        # Write new content
+        # Write new content with restrictive permissions (600)
         config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(content)
-
-        # Set restrictive permissions (600)
-        import os
-
-        os.chmod(config_file, 0o600)
+        atomic_write(config_file, content, mode=0o600)
 
         return jsonify(
             {
@@ -3572,9 +4575,6 @@ def save_ddns_config():
 
 # WebSocket event handlers for real-time log streaming
 if SOCKETIO_AVAILABLE:
-    import time
-    from collections import deque
-
     # Store active log stream connections
     active_log_streams = set()
 
@@ -3582,7 +4582,7 @@ if SOCKETIO_AVAILABLE:
         """Get last N lines of server logs"""
         try:
             result = subprocess.run(
-                ["docker", "logs", "--tail", str(lines), "minecraft-server"], capture_output=True, text=True, timeout=5
+                ["docker", "logs", "--tail", str(lines), MINECRAFT_CONTAINER], capture_output=True, text=True, timeout=5
             )
             if result.returncode == 0:
                 return result.stdout.split("\n")
@@ -3590,37 +4590,99 @@ if SOCKETIO_AVAILABLE:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return []
 
-    def stream_logs_task(sid, api_key):
-        """Background task to stream logs to connected client"""
-        if api_key not in API_KEYS:
-            socketio.emit("error", {"message": "Invalid API key"}, room=sid)
-            return
-
-        # Send initial logs
-        initial_logs = get_log_tail(200)
-        socketio.emit("logs", {"logs": initial_logs, "type": "initial"}, room=sid)
-
-        last_lines = deque(initial_logs[-50:] if len(initial_logs) > 50 else initial_logs, maxlen=50)
-
-        # Stream new logs
-        while sid in active_log_streams:
-            try:
-                current_logs = get_log_tail(50)
-                if current_logs and current_logs != list(last_lines):
-                    # Find new lines
-                    new_lines = []
-                    for log in current_logs:
-                        if log not in last_lines and log.strip():
-                            new_lines.append(log)
-
-                    if new_lines:
-                        socketio.emit("logs", {"logs": new_lines, "type": "update"}, room=sid)
-                        last_lines.extend(new_lines)
-
-                time.sleep(1)  # Check every second
-            except Exception as e:
-                socketio.emit("error", {"message": f"Log streaming error: {str(e)}"}, room=sid)
-                break
+    # All log stream clients share one room fed by a single `docker logs -f` follower
+    LOG_ROOM = "logs"
+    _log_follower = {"proc": None, "running": False}
+    _log_follower_lock = threading.Lock()
+
+    # New lines are coalesced into one emit per LOG_FLUSH_INTERVAL (or LOG_FLUSH_LINES lines);
+    # under sustained overload the oldest unsent lines are dropped rather than growing memory
+    LOG_FLUSH_INTERVAL = 0.1
+    LOG_FLUSH_LINES = 64
+    _pending_log_lines = deque(maxlen=1024)
+    _log_flush = {"scheduled": False}
+    _log_flush_lock = threading.Lock()
+
+    def flush_log_lines():
+        """Emit all pending log lines to the log room as a single batch"""
+        with _log_flush_lock:
+            batch = list(_pending_log_lines)
+            _pending_log_lines.clear()
+            _log_flush["scheduled"] = False
+        if batch:
+            socketio.emit("logs", {"logs": batch, "type": "update"}, room=LOG_ROOM)
+
+    def flush_log_lines_later():
+        """Background task: flush pending log lines after the batching interval"""
+        socketio.sleep(LOG_FLUSH_INTERVAL)
+        flush_log_lines()
+
+    def queue_log_line(line):
+        """Buffer a log line for the next batched emit"""
+        with _log_flush_lock:
+            _pending_log_lines.append(line)
+            if len(_pending_log_lines) < LOG_FLUSH_LINES:
+                if not _log_flush["scheduled"]:
+                    _log_flush["scheduled"] = True
+                    socketio.start_background_task(flush_log_lines_later)
+                return
+        flush_log_lines()
+
+    def follow_logs_task():
+        """Background task: follow the container log and fan each new line out to the log room"""
+        # First attach starts at the live end; reattaches resume from when the last stream ended,
+        # so lines written while the container restarted are not lost
+        since = None
+        try:
+            while active_log_streams:
+                start = ["--tail", "0"] if since is None else ["--since", f"{since:.6f}"]
+                try:
+                    proc = subprocess.Popen(
+                        ["docker", "logs", "-f", *start, MINECRAFT_CONTAINER],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        bufsize=1,
+                    )
+                except FileNotFoundError:
+                    socketio.emit("error", {"message": "Log streaming error: docker not found"}, room=LOG_ROOM)
+                    return
+                _log_follower["proc"] = proc
+                for line in proc.stdout:
+                    if not active_log_streams:
+                        break
+                    line = line.rstrip("\n")
+                    if line.strip():
+                        queue_log_line(line)
+                since = time.time()
+                proc.terminate()
+                proc.wait()
+                # Container restarted or log stream ended; reattach after a short pause
+                socketio.sleep(1)
+        except Exception as e:
+            socketio.emit("error", {"message": f"Log streaming error: {str(e)}"}, room=LOG_ROOM)
+        finally:
+            with _log_follower_lock:
+                _log_follower["proc"] = None
+                _log_follower["running"] = False
+
+    def send_log_backfill(sid):
+        """Background task: send the most recent log lines to a newly connected client"""
+        socketio.emit("logs", {"logs": get_log_tail(200), "type": "initial"}, room=sid)
+
+    def ensure_log_follower():
+        """Start the shared log follower if it is not already running"""
+        with _log_follower_lock:
+            if _log_follower["running"]:
+                return
+            _log_follower["running"] = True
+        socketio.start_background_task(follow_logs_task)
+
+    def stop_log_follower():
+        """Stop the shared log follower once the last client has left"""
+        proc = _log_follower["proc"]
+        if not active_log_streams and proc is not None and proc.poll() is None:
+            proc.terminate()
 
     @socketio.on("connect")
     def handle_connect(auth):
@@ -3643,11 +4705,11 @@ if SOCKETIO_AVAILABLE:
             socketio.disconnect(request.sid)
             return False
 
-        # Add to active streams
+        # Backfill recent lines, then join the shared live stream
+        socketio.start_background_task(send_log_backfill, request.sid)
+        join_room(LOG_ROOM)
         active_log_streams.add(request.sid)
-
-        # Start log streaming task
-        socketio.start_background_task(stream_logs_task, request.sid, api_key)
+        ensure_log_follower()
         socketio.emit("connected", {"message": "Connected to log stream"}, room=request.sid)
         return True  # connection accepted
 
@@ -3656,6 +4718,8 @@ if SOCKETIO_AVAILABLE:
         """Handle WebSocket disconnection"""
         if request.sid in active_log_streams:
             active_log_streams.remove(request.sid)
+            leave_room(LOG_ROOM)
+            stop_log_follower()
 
     @socketio.on("request_logs")
     def handle_request_logs(data):
@@ -3675,7 +4739,7 @@ if SOCKETIO_AVAILABLE:
         # Check if user has permission (api_key already validated in connect)
         # Execute command via RCON
         try:
-            stdout, stderr, code = run_script("rcon-client.sh", "command", command)
+            stdout, stderr, code = rcon_command(command)
             if code == 0:
                 socketio.emit(
                     "command_response", {"command": command, "response": stdout, "success": True}, room=request.sid
@@ -4,13 +4,32 @@ Analytics Processing Engine
 Processes collected analytics data to generate insights, trends, predictions, and anomaly detection
 """
 
+import bisect
+import hashlib
+import heapq
+import itertools
 import json
+import math
+import operator
+import os
+import re
 import statistics
 import sys
-from collections import defaultdict
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+# Optional fast JSON support
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+    _json_loads = json.loads
 
 # Add project root to path
 SCRIPT_DIR = Path(__file__).parent.absolute()
@@ -20,6 +39,82 @@ sys.path.insert(0, str(PROJECT_DIR))
 ANALYTICS_DIR = PROJECT_DIR / "analytics"
 OUTPUT_DIR = PROJECT_DIR / "analytics" / "processed"
 
+# Record payload getter (C-level, no default dict built per record)
+_get_data = operator.itemgetter("data")
+
+# Data files a report is computed from (its cache is keyed on their stats)
+REPORT_DATA_TYPES = ("performance", "players", "player_events")
+
+# Leading "timestamp" key as written by analytics-collector.sh ({"timestamp":<epoch>,...}); lets
+# out-of-window records be skipped without parsing them
+_LEADING_TIMESTAMP = re.compile(rb'\s*\{\s*"timestamp"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]')
+
+
+def dump_json(data) -> bytes:
+    """Serialize data as 2-space indented JSON bytes (uses orjson when available)"""
+    if ORJSON_AVAILABLE:
+        # Int dict keys (hourly_distribution) become strings, as with the json module
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def extract_column(data: List[Dict], value_key: str) -> List[float]:
+    """Extract one numeric field from each record's data dict (missing values count as 0)"""
+    try:
+        # Records share one schema, so index directly with C-level getters and only fall back to
+        # the tolerant .get() chain when some record lacks the field
+        return list(map(float, map(operator.itemgetter(value_key), map(_get_data, data))))
+    except (KeyError, TypeError):
+        return [float(record.get("data", {}).get(value_key, 0)) for record in data]
+
+
+def extract_columns(data: List[Dict], keys: Tuple[str, ...]) -> List[List[float]]:
+    """Extract several numeric fields in a single pass over the records, one list per key"""
+    if len(keys) < 2 or not data:
+        return [extract_column(data, key) for key in keys]
+    try:
+        rows = zip(*map(operator.itemgetter(*keys), map(_get_data, data)))
+        return [list(map(float, column)) for column in rows]
+    except (KeyError, TypeError):
+        pass
+
+    columns = [[] for _ in keys]
+    appends = [column.append for column in columns]
+    for record in data:
+        fields = record.get("data", {})
+        for append, key in zip(appends, keys):
+            append(float(fields.get(key, 0)))
+    return columns
+
+
+def ols_slope(values: List[float], sum_y: float) -> float:
+    """
+    Least-squares slope of values against their index 0..n-1, in closed form.
+
+    With x = 0..n-1 the x sums are known (x_mean = (n-1)/2, sum((x - x_mean)^2) = n(n^2-1)/12),
+    so only sum(y) and sum(x*y) are needed: two C-level passes instead of per-element Python arithmetic.
+    """
+    n = len(values)
+    if n < 2:
+        return 0
+    sum_xy = math.fsum(map(operator.mul, range(n), values))
+    return (sum_xy - (n - 1) / 2 * sum_y) / (n * (n * n - 1) / 12)
+
+
+def mean_stdev(values: List[float]) -> Tuple[float, float]:
+    """
+    Mean and sample standard deviation, as statistics.mean/stdev but in two C-level passes.
+
+    math.fsum is exactly rounded, so summing squared deviations this way is as accurate as
+    Welford's update without a Python-level loop.
+    """
+    n = len(values)
+    mean = math.fsum(values) / n
+    if n < 2:
+        return mean, 0.0
+    squares = math.fsum(map(pow, map(operator.sub, values, itertools.repeat(mean)), itertools.repeat(2)))
+    return mean, math.sqrt(squares / (n - 1))
+
 
 class AnalyticsProcessor:
     """Process analytics data and generate insights"""
@@ -28,35 +123,90 @@ class AnalyticsProcessor:
         self.analytics_dir = ANALYTICS_DIR
         self.output_dir = OUTPUT_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Widest window to load whenever a file is (re)read, so shorter periods are served from memory
+        self.max_window_hours = 0
+        # data_type -> (file stat key, window hours, sorted timestamps, records sorted by timestamp)
+        self._data_cache = {}
+        # (data_type, keys) -> (cached records list the columns were extracted from, columns)
+        self._column_cache = {}
 
     def load_analytics_data(self, data_type: str, hours: int = 24) -> List[Dict]:
         """Load analytics data from JSONL files"""
         file_path = self.analytics_dir / f"{data_type}.jsonl"
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             return []
 
+        # Reuse the last parse of an unchanged file if it covered at least this window
+        stat_key = (st.st_mtime_ns, st.st_size)
         cutoff_time = datetime.now().timestamp() - (hours * 3600)
+        cached = self._data_cache.get(data_type)
+        if cached is None or cached[0] != stat_key or cached[1] < hours:
+            window = max(hours, self.max_window_hours)
+            timestamps, records = self._parse_analytics_file(file_path, datetime.now().timestamp() - (window * 3600))
+            cached = (stat_key, window, timestamps, records)
+            self._data_cache[data_type] = cached
+
+        _, _, timestamps, records = cached
+        return records[bisect.bisect_left(timestamps, cutoff_time) :]
+
+    def load_metric_columns(self, data_type: str, keys: Tuple[str, ...], hours: int = 24) -> Tuple[List, List]:
+        """
+        Load records and their metric columns for a window.
+
+        Columns are extracted once over the whole cached parse and sliced per window, so the
+        report periods share a single projection instead of re-walking the records each time.
+        """
+        records = self.load_analytics_data(data_type, hours)
+        cached = self._data_cache.get(data_type)
+        if cached is None:
+            return records, [[] for _ in keys]
+
+        all_records = cached[3]
+        entry = self._column_cache.get((data_type, keys))
+        if entry is None or entry[0] is not all_records:
+            entry = (all_records, extract_columns(all_records, keys))
+            self._column_cache[(data_type, keys)] = entry
+
+        start = len(all_records) - len(records)
+        return records, [column[start:] for column in entry[1]]
+
+    def _parse_analytics_file(self, file_path: Path, cutoff_time: float) -> Tuple[List, List[Dict]]:
+        """Parse the records of a JSONL file at or after cutoff_time, returning (timestamps, records) sorted by time"""
         data = []
+        timestamps = []
 
         try:
-            with open(file_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                        if record.get("timestamp", 0) >= cutoff_time:
-                            data.append(record)
-                    except json.JSONDecodeError:
-                        continue
+            # Read the file in one call and split in C rather than iterating the buffered reader line by
+            # line; the parser takes UTF-8 bytes directly and tolerates surrounding whitespace
+            with open(file_path, "rb") as f:
+                lines = f.read().split(b"\n")
+            for line in lines:
+                if not line or line.isspace():
+                    continue
+                match = _LEADING_TIMESTAMP.match(line)
+                if match is not None and float(match.group(1)) < cutoff_time:
+                    continue
+                try:
+                    record = _json_loads(line)
+                except ValueError:  # JSONDecodeError (stdlib and orjson) or invalid UTF-8
+                    continue
+                timestamp = record.get("timestamp", 0)
+                if timestamp >= cutoff_time:
+                    data.append(record)
+                    timestamps.append(timestamp)
         except FileNotFoundError:
             pass
 
-        return sorted(data, key=lambda x: x.get("timestamp", 0))
+        # Append-only files are already in time order: a C-level pairwise check avoids the sort
+        if all(map(operator.le, timestamps, itertools.islice(timestamps, 1, None))):
+            return timestamps, data
+        order = sorted(range(len(data)), key=timestamps.__getitem__)
+        return [timestamps[i] for i in order], [data[i] for i in order]
 
-    def calculate_trends(self, data: List[Dict], value_key: str) -> Dict:
-        """Calculate trends (slope, direction) from time series data"""
+    def calculate_trends(self, data: List[Dict], value_key: str, values: Optional[List[float]] = None) -> Dict:
+        """Calculate trends (slope, direction) from time series data (values: pre-extracted column)"""
         if len(data) < 2:
             # For single data point, return basic info
             if len(data) == 1:
@@ -72,23 +222,15 @@ class AnalyticsProcessor:
                 }
             return {"direction": "stable", "slope": 0, "change_percent": 0}
 
-        values = [float(record.get("data", {}).get(value_key, 0)) for record in data]
+        if values is None:
+            values = extract_column(data, value_key)
         if not values or all(v == 0 for v in values):
             return {"direction": "stable", "slope": 0, "change_percent": 0}
 
         # Simple linear regression for trend
         n = len(values)
-        x = list(range(n))
-        x_mean = sum(x) / n
-        y_mean = sum(values) / n
-
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
-            slope = 0
-        else:
-            slope = numerator / denominator
+        sum_y = math.fsum(values)
+        slope = ols_slope(values, sum_y)
 
         # Calculate percentage change
         if values[0] != 0:
@@ -103,32 +245,42 @@ class AnalyticsProcessor:
             "slope": slope,
             "change_percent": round(change_percent, 2),
             "current": values[-1],
-            "average": round(statistics.mean(values), 2),
+            "average": round(sum_y / n, 2),
             "min": round(min(values), 2),
             "max": round(max(values), 2),
         }
 
-    def detect_anomalies(self, data: List[Dict], value_key: str, threshold: float = 2.0) -> List[Dict]:
+    def detect_anomalies(
+        self, data: List[Dict], value_key: str, threshold: float = 2.0, values: Optional[List[float]] = None
+    ) -> List[Dict]:
         """Detect anomalies using statistical methods (Z-score)"""
         if len(data) < 3:
             return []
 
-        values = [float(record.get("data", {}).get(value_key, 0)) for record in data]
+        if values is None:
+            values = extract_column(data, value_key)
         if not values:
             return []
 
-        mean = statistics.mean(values)
-        if len(values) > 1:
-            stdev = statistics.stdev(values)
-        else:
-            stdev = 0
+        mean, stdev = mean_stdev(values)
 
         if stdev == 0:
             return []
 
+        # |value - mean| / stdev > threshold  <=>  value outside [low, high]. The candidate indices are
+        # selected by C-level comparisons (map/compress, no Python frame per value), so only the
+        # usually tiny set of outliers is visited in Python
+        low = mean - threshold * stdev
+        high = mean + threshold * stdev
+        positions = range(len(values))
+        candidates = heapq.merge(
+            itertools.compress(positions, map(low.__gt__, values)),
+            itertools.compress(positions, map(high.__lt__, values)),
+        )
         anomalies = []
-        for i, (record, value) in enumerate(zip(data, values)):
-            z_score = abs((value - mean) / stdev) if stdev > 0 else 0
+        for i in candidates:
+            record, value = data[i], values[i]
+            z_score = abs((value - mean) / stdev)
             if z_score > threshold:
                 anomalies.append(
                     {
@@ -142,28 +294,33 @@ class AnalyticsProcessor:
 
         return anomalies
 
-    def predict_future(self, data: List[Dict], value_key: str, hours_ahead: int = 1) -> Dict:
-        """Simple linear prediction for future values"""
+    def predict_future(
+        self,
+        data: List[Dict],
+        value_key: str,
+        hours_ahead: int = 1,
+        values: Optional[List[float]] = None,
+        slope: Optional[float] = None,
+    ) -> Dict:
+        """Linear prediction for future values (slope: least-squares slope already computed by calculate_trends)"""
         if len(data) < 2:
             return {"predicted": 0, "confidence": 0}
 
-        values = [float(record.get("data", {}).get(value_key, 0)) for record in data]
-        if not values:
+        if values is None:
+            values = extract_column(data, value_key)
+        if len(values) < 2:
             return {"predicted": 0, "confidence": 0}
 
-        # Simple moving average with trend
-        recent_values = values[-min(10, len(values)) :]
-        avg = statistics.mean(recent_values)
+        if slope is None:
+            slope = ols_slope(values, math.fsum(values))
+        # Extrapolate the fitted trend from the last value
+        predicted = values[-1] + slope * hours_ahead
 
-        # Calculate trend per data point (for linear extrapolation)
-        if len(values) >= 2:
-            # Calculate trend as change per data point
-            trend_per_point = (values[-1] - values[0]) / (len(values) - 1) if len(values) > 1 else 0
-            # For prediction, use the last value and extrapolate
-            predicted = values[-1] + (trend_per_point * hours_ahead)
-        else:
-            trend_per_point = 0
-            predicted = avg
+        # Goodness of fit in closed form: R^2 = slope^2 * Sxx / SS_tot, with Sxx = n(n^2-1)/12 for x = 0..n-1
+        n = len(values)
+        _, stdev = mean_stdev(values)
+        ss_tot = stdev * stdev * (n - 1)
+        r_squared = min(1.0, slope * slope * (n * (n * n - 1) / 12) / ss_tot) if ss_tot else 1.0
 
         # Confidence based on data quality
         confidence = min(100, max(0, (len(data) / 100) * 100))
@@ -171,7 +328,8 @@ class AnalyticsProcessor:
         return {
             "predicted": round(predicted, 2),
             "confidence": round(confidence, 1),
-            "trend": round(trend_per_point, 2),
+            "trend": round(slope, 2),
+            "r_squared": round(r_squared, 3),
         }
 
     def analyze_player_behavior(self, hours: int = 24) -> Dict:
@@ -186,19 +344,27 @@ class AnalyticsProcessor:
             if isinstance(players, list):
                 unique_players.update(players)
 
-        # Analyze peak hours
-        hourly_activity = defaultdict(int)
+        # Analyze peak hours on a fixed 24-slot histogram indexed by hour
+        hourly_activity = [0] * 24
+        # Local hour per 15-minute bucket: UTC offsets and DST switches fall on quarter hours, so every
+        # timestamp in a bucket has the same local hour and fromtimestamp runs once per bucket
+        bucket_hours = {}
         for record in player_data:
             try:
-                dt = datetime.fromtimestamp(record.get("timestamp", 0))
-                hour = dt.hour
+                timestamp = record.get("timestamp", 0)
+                bucket = timestamp // 900
+                hour = bucket_hours.get(bucket)
+                if hour is None:
+                    hour = bucket_hours[bucket] = datetime.fromtimestamp(timestamp).hour
                 players = record.get("data", [])
                 player_count = len(players) if isinstance(players, list) else 0
                 hourly_activity[hour] += player_count
             except (ValueError, TypeError):
                 continue
 
-        peak_hour = max(hourly_activity.items(), key=lambda x: x[1])[0] if hourly_activity else 0
+        # Hours that had samples (including ones where nobody was online); ties go to the earliest hour
+        active_hours = sorted(set(bucket_hours.values()))
+        peak_hour = max(active_hours, key=hourly_activity.__getitem__) if active_hours else 0
 
         # Calculate average session duration (simplified)
         # In production, would track individual player sessions
@@ -207,34 +373,37 @@ class AnalyticsProcessor:
         return {
             "unique_players": len(unique_players),
             "peak_hour": peak_hour,
-            "hourly_distribution": dict(hourly_activity),
+            "hourly_distribution": {hour: hourly_activity[hour] for hour in active_hours},
             "average_session_duration_minutes": avg_session_duration,
             "total_events": len(event_data),
         }
 
     def analyze_performance_trends(self, hours: int = 24) -> Dict:
         """Analyze server performance trends"""
-        perf_data = self.load_analytics_data("performance", hours)
+        # Metric columns are shared across trend/anomaly/prediction and across report periods
+        perf_data, (tps_values, cpu_values, memory_values) = self.load_metric_columns(
+            "performance", ("tps", "cpu", "memory"), hours
+        )
 
         if not perf_data:
             return {}
 
-        tps_values = [float(r.get("data", {}).get("tps", 0)) for r in perf_data]
-        cpu_values = [float(r.get("data", {}).get("cpu", 0)) for r in perf_data]
-        memory_values = [float(r.get("data", {}).get("memory", 0)) for r in perf_data]
-
-        tps_trend = self.calculate_trends(perf_data, "tps")
-        cpu_trend = self.calculate_trends(perf_data, "cpu")
-        memory_trend = self.calculate_trends(perf_data, "memory")
+        tps_trend = self.calculate_trends(perf_data, "tps", values=tps_values)
+        cpu_trend = self.calculate_trends(perf_data, "cpu", values=cpu_values)
+        memory_trend = self.calculate_trends(perf_data, "memory", values=memory_values)
 
         # Detect anomalies
-        tps_anomalies = self.detect_anomalies(perf_data, "tps", threshold=1.4)
-        cpu_anomalies = self.detect_anomalies(perf_data, "cpu", threshold=1.5)
-        memory_anomalies = self.detect_anomalies(perf_data, "memory", threshold=1.5)
+        tps_anomalies = self.detect_anomalies(perf_data, "tps", threshold=1.4, values=tps_values)
+        cpu_anomalies = self.detect_anomalies(perf_data, "cpu", threshold=1.5, values=cpu_values)
+        memory_anomalies = self.detect_anomalies(perf_data, "memory", threshold=1.5, values=memory_values)
 
         # Predictions
-        tps_prediction = self.predict_future(perf_data, "tps", hours_ahead=1)
-        memory_prediction = self.predict_future(perf_data, "memory", hours_ahead=1)
+        tps_prediction = self.predict_future(
+            perf_data, "tps", hours_ahead=1, values=tps_values, slope=tps_trend["slope"]
+        )
+        memory_prediction = self.predict_future(
+            perf_data, "memory", hours_ahead=1, values=memory_values, slope=memory_trend["slope"]
+        )
 
         return {
             "tps": {
@@ -259,8 +428,68 @@ class AnalyticsProcessor:
             },
         }
 
+    def _report_cache_state(self, hours: int):
+        """Return (cache file, fingerprint of the input files' stats and the period) for a report"""
+        fingerprint = hashlib.blake2b(str(hours).encode(), digest_size=16)
+        for data_type in REPORT_DATA_TYPES:
+            try:
+                st = (self.analytics_dir / f"{data_type}.jsonl").stat()
+                fingerprint.update(f"|{data_type}:{st.st_mtime_ns}:{st.st_size}".encode())
+            except FileNotFoundError:
+                fingerprint.update(f"|{data_type}:-".encode())
+        return self.output_dir / "cache" / f"report_{hours}h.json", fingerprint.hexdigest()
+
+    def _report_valid_until(self, hours: int) -> float:
+        """Time at which the oldest in-window record ages out of the period, changing the report"""
+        valid_until = math.inf
+        for data_type in REPORT_DATA_TYPES:
+            data = self.load_analytics_data(data_type, hours)
+            if data:
+                try:
+                    valid_until = min(valid_until, float(data[0].get("timestamp", 0)) + hours * 3600)
+                except (TypeError, ValueError):
+                    return 0
+        return valid_until
+
     def generate_report(self, hours: int = 24) -> Dict:
-        """Generate comprehensive analytics report"""
+        """Generate comprehensive analytics report, reusing the cached one while its inputs are unchanged"""
+        cache_file, fingerprint = self._report_cache_state(hours)
+        try:
+            cached = _json_loads(cache_file.read_bytes())
+            valid_until = cached["valid_until"]  # None: valid until the inputs change
+            if cached["fingerprint"] == fingerprint and (
+                valid_until is None or datetime.now().timestamp() < valid_until
+            ):
+                report = cached["report"]
+                report["generated_at"] = datetime.now().isoformat()
+                return report
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # No usable cache entry; build the report
+
+        report = self._build_report(hours)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            valid_until = self._report_valid_until(hours)
+            entry = {
+                "fingerprint": fingerprint,
+                "valid_until": None if math.isinf(valid_until) else valid_until,
+                "report": report,
+            }
+            # Write beside the cache file and rename over it, so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{cache_file.name}.", dir=str(cache_file.parent))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(dump_json(entry))
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass  # Caching is best-effort
+        return report
+
+    def _build_report(self, hours: int) -> Dict:
+        """Compute the analytics report for the last `hours` hours"""
         report = {
             "generated_at": datetime.now().isoformat(),
             "period_hours": hours,
@@ -311,8 +540,8 @@ class AnalyticsProcessor:
     def save_report(self, report: Dict, filename: str = "latest_report.json"):
         """Save report to file"""
         file_path = self.output_dir / filename
-        with open(file_path, "w") as f:
-            json.dump(report, f, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(dump_json(report))
         return str(file_path)
 
 
@@ -322,6 +551,8 @@ def main():
 
     # Generate reports for different time periods
     periods = [1, 6, 24, 168]  # 1 hour, 6 hours, 24 hours, 1 week
+    # Parse each file once for the widest period and slice the shorter ones from memory
+    processor.max_window_hours = max(periods)
     reports = {}
 
     for hours in periods:
@@ -335,7 +566,7 @@ def main():
     # Save all reports
     processor.save_report(reports, "all_reports.json")
 
-    print(json.dumps(latest_report, indent=2))
+    sys.stdout.buffer.write(dump_json(latest_report) + b"\n")
 
 
 if __name__ == "__main__":
@@ -4,12 +4,21 @@ Command Scheduler - Manages scheduled server commands
 Enhanced with cron expressions, conditional execution, and event triggers
 """
 
+import heapq
 import json
+import math
+import os
 import re
+import signal
+import stat
 import subprocess
 import sys
+import tempfile
+import time
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 
 # Optional croniter for cron expressions
@@ -21,44 +30,239 @@ except ImportError:
     CRONITER_AVAILABLE = False
     croniter = None
 
+# Optional fast JSON support
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+    _json_loads = json.loads
+
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT.absolute()))
+
+# Optional native RCON client (shared with the API server)
+try:
+    from api.rcon import RconError, RconPool, RconResponseError, load_rcon_config
+
+    RCON_AVAILABLE = True
+except ImportError:
+    RCON_AVAILABLE = False
+
+    class RconError(Exception):
+        pass
+
+    class RconResponseError(RconError):
+        pass
+
+
 SCHEDULE_FILE = PROJECT_ROOT / "config" / "command-schedule.json"
+RCON_CONFIG_FILE = PROJECT_ROOT / "config" / "rcon.conf"
+SCHEDULE_LOG_FILE = PROJECT_ROOT / "config" / "command-schedule.log"
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 
+# Last parsed schedule file, keyed on (path, mtime_ns, size), and the min-heap of its schedules'
+# (next run time, position) pairs ("heap": None until built by a run)
+_SCHEDULE_CACHE = {"key": None, "data": None, "heap": None}
+
+# RCON connections reused by every command ("client" is False once found unusable, until "retry_at")
+RCON_RETRY_INTERVAL = 60.0
+_RCON = {"client": None, "retry_at": 0.0}
+
+# Most commands of one run sent to the server at the same time (and RCON connections kept open)
+MAX_PARALLEL_COMMANDS = 4
+
+# Last player count read from the server, shared by the templates and conditions of one tick
+PLAYER_COUNT_TTL = 5.0
+_PLAYER_COUNT_CACHE = {"value": 0, "checked": -math.inf}
+
+# "There are X of a max of Y players online" (response to the "list" command)
+_PLAYER_COUNT_RE = re.compile(r"There are (\d+) of")
+# Template variables substituted into scheduled commands
+_TEMPLATE_VARIABLE_RE = re.compile(r"\{(time|date|datetime|player_count)\}")
+
+
+@lru_cache(maxsize=256)
+def parse_timestamp(value):
+    """Parse an ISO 8601 timestamp (accepting a trailing Z); repeated values are parsed once per process"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=256)
+def run_minute_of_day(run_time):
+    """Minutes after midnight of an "HH:MM" run_time; each distinct value is parsed once per process"""
+    hour, minute = map(int, run_time.split(":"))
+    return hour * 60 + minute
+
+
+def last_run_timestamp(schedule):
+    """
+    Epoch of a schedule's last run, or None if it has never run.
+
+    Uses the numeric last_run_ts written alongside last_run, parsing the ISO last_run only for
+    entries saved before it existed.
+    """
+    last_run = schedule.get("last_run")
+    if not last_run:
+        return None
+    last_run_ts = schedule.get("last_run_ts")
+    if last_run_ts is None:
+        last_run_ts = parse_timestamp(last_run).timestamp()
+    return last_run_ts
+
+
+def _schedule_file_key():
+    """Cache key for the schedule file: (path, mtime_ns, size), or None if it doesn't exist"""
+    try:
+        st = SCHEDULE_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (str(SCHEDULE_FILE), st.st_mtime_ns, st.st_size)
+
 
 def load_schedule():
-    """Load scheduled commands from file"""
-    if SCHEDULE_FILE.exists():
-        try:
-            with open(SCHEDULE_FILE, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"schedules": []}
-    return {"schedules": []}
+    """Load scheduled commands from file (reusing the last parse while the file is unchanged)"""
+    key = _schedule_file_key()
+    if key is None:
+        return {"schedules": []}
+    if _SCHEDULE_CACHE["key"] == key:
+        return _SCHEDULE_CACHE["data"]
+    try:
+        data = _json_loads(SCHEDULE_FILE.read_bytes())
+    except (ValueError, FileNotFoundError):  # JSONDecodeError (stdlib and orjson) or invalid UTF-8
+        return {"schedules": []}
+    _SCHEDULE_CACHE["key"] = key
+    _SCHEDULE_CACHE["data"] = data
+    _SCHEDULE_CACHE["heap"] = None
+    return data
 
 
 def save_schedule(schedule_data):
-    """Save scheduled commands to file"""
+    """Save scheduled commands to file (compact JSON, written to a temp file and renamed into place)"""
     SCHEDULE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(SCHEDULE_FILE, "w") as f:
-        json.dump(schedule_data, f, indent=2)
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(schedule_data)
+    else:
+        payload = json.dumps(schedule_data, separators=(",", ":")).encode("utf-8")
+    try:
+        mode = stat.S_IMODE(SCHEDULE_FILE.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    # A crash or a concurrent reader (the API) never sees a half-written file
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{SCHEDULE_FILE.name}.", suffix=".tmp", dir=str(SCHEDULE_FILE.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, SCHEDULE_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass  # Already renamed or never fully created
+        raise
+    _SCHEDULE_CACHE["key"] = _schedule_file_key()
+    _SCHEDULE_CACHE["data"] = schedule_data
+    _SCHEDULE_CACHE["heap"] = None
     return True
 
 
+def get_rcon_client():
+    """Return the shared RCON client, or None if native RCON isn't available, configured or reachable"""
+    if _RCON["client"] is False and time.monotonic() >= _RCON["retry_at"]:
+        _RCON["client"] = None  # A long-running scheduler tries again once the server may be back
+    if _RCON["client"] is None:
+        _RCON["client"] = False
+        _RCON["retry_at"] = time.monotonic() + RCON_RETRY_INTERVAL
+        if RCON_AVAILABLE:
+            config = load_rcon_config(RCON_CONFIG_FILE)
+            if config.get("RCON_PASSWORD"):
+                try:
+                    port = int(config.get("RCON_PORT") or 25575)
+                except ValueError:
+                    port = 25575
+                # Pooled connections: reused across commands and replaced if they have gone stale
+                _RCON["client"] = RconPool(
+                    config.get("RCON_HOST") or "localhost", port, config["RCON_PASSWORD"], size=MAX_PARALLEL_COMMANDS
+                )
+    return _RCON["client"] or None
+
+
+def rcon_command(command):
+    """
+    Send a command over the run's persistent RCON connection.
+
+    Returns:
+        The server's response, or None if native RCON is unavailable (callers fall back to rcon-client.sh)
+
+    Raises:
+        RconResponseError: If the command was sent but its response was lost (it may have run, so it
+            must not be retried through rcon-client.sh)
+    """
+    client = get_rcon_client()
+    if client is None:
+        return None
+    try:
+        return client.command(command)
+    except RconResponseError:
+        raise
+    except RconError:
+        # Unreachable over RCON; let rcon-client.sh try its other transports until the retry interval passes
+        client.close()
+        _RCON["client"] = False
+        _RCON["retry_at"] = time.monotonic() + RCON_RETRY_INTERVAL
+        return None
+
+
+def run_with_group_timeout(args, timeout):
+    """
+    Run a command in the project root and capture its text output, like subprocess.run.
+
+    The command gets its own process group, and on timeout the whole group is killed, so tools the
+    script started (mcrcon, nc) can't outlive it and pile up across ticks.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command didn't finish within timeout seconds
+    """
+    with subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=str(PROJECT_ROOT),
+        start_new_session=True,
+    ) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)  # New session: the group id is the child's pid
+            except ProcessLookupError:
+                pass
+            process.communicate()
+            raise
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
 def execute_command(command):
     """Execute a server command via RCON"""
+    try:
+        response = rcon_command(command)
+    except RconResponseError as e:
+        return False, str(e)
+    if response is not None:
+        return True, response
     try:
         rcon_script = SCRIPTS_DIR / "rcon-client.sh"
         if not rcon_script.exists():
             return False, "RCON client script not found"
 
-        result = subprocess.run(
-            [str(rcon_script), "command", command],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(PROJECT_ROOT),
-        )
+        result = run_with_group_timeout([str(rcon_script), "command", command], timeout=30)
         if result.returncode == 0:
             return True, result.stdout
         else:
@@ -74,66 +278,122 @@ def check_and_run_schedules():
     schedule_data = load_schedule()
     schedules = schedule_data.get("schedules", [])
     current_time = datetime.now(timezone.utc)
-
-    for schedule in schedules:
-        # Check if it's time to run
-        if should_run_schedule(schedule, current_time):
+    now_ts = current_time.timestamp()
+    now_iso = current_time.isoformat()  # Shared by every log entry and last_run written this tick
+    log_entries = []  # Written to the execution log together once the run ends
+
+    # Min-heap of (earliest possible run time, position), built once per parse of the schedule file: a tick
+    # pops only the schedules whose time has come, so conditions (which may query the server) are not
+    # evaluated and run times not recomputed for the rest
+    heap = _SCHEDULE_CACHE["heap"] if _SCHEDULE_CACHE["data"] is schedule_data else None
+    if heap is None:
+        heap = []
+        for index, schedule in enumerate(schedules):
+            # Disabled schedules (often most of the file) never enter the heap
+            if not schedule.get("enabled", True):
+                continue
+            next_run = compute_next_run(schedule, current_time)
+            if next_run is not None:
+                heap.append((next_run, index))
+        heapq.heapify(heap)
+    due = []
+    while heap and heap[0][0] <= now_ts:
+        due.append(heapq.heappop(heap)[1])
+    # Bound for the next check: anything due now has already been looked at this minute
+    next_minute = current_time + timedelta(minutes=1)
+
+    ran = False
+    try:
+        # Check every due schedule first, in due order, then send their commands together
+        to_run = []
+        for index in due:
+            schedule = schedules[index]
+            # Check if it's time to run
             command = schedule.get("command")
-            if command:
+            if command and should_run_schedule(schedule, current_time):
                 # Handle command templates with variables
-                command = process_command_template(command, current_time)
-
-                success, output = execute_command(command)
-                # Log execution
-                log_execution(schedule.get("id"), command, success, output, current_time)
-                # Update last_run
-                schedule["last_run"] = current_time.isoformat()
-                schedule["run_count"] = schedule.get("run_count", 0) + 1
+                to_run.append((schedule, process_command_template(command, current_time)))
+
+        # Schedules are independent, so the run takes as long as its slowest command rather than their sum;
+        # results come back in due order
+        commands = [command for _, command in to_run]
+        if len(commands) > 1:
+            get_rcon_client()  # Set up the shared connection pool before the workers use it
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_COMMANDS, len(commands))) as executor:
+                results = list(executor.map(execute_command, commands))
+        else:
+            results = [execute_command(command) for command in commands]
+
+        for (schedule, command), (success, output) in zip(to_run, results):
+            # Log execution
+            log_entries.append(format_log_entry(schedule.get("id"), command, success, output, now_iso))
+            # Update last_run
+            schedule["last_run"] = now_iso
+            schedule["last_run_ts"] = now_ts
+            schedule["run_count"] = schedule.get("run_count", 0) + 1
+            ran = True
+
+            # Handle one-time schedules
+            if schedule.get("type") == "once":
+                schedule["enabled"] = False
+    finally:
+        if log_entries:
+            write_execution_log(b"".join(log_entries))
+        # Requeue what was popped at its next run time (schedules that can no longer run drop out)
+        for index in due:
+            next_run = compute_next_run(schedules[index], next_minute)
+            if next_run is not None:
+                heapq.heappush(heap, (next_run, index))
+
+    # Save updated schedule data (an idle tick leaves the file, and its cached parse, untouched)
+    if ran:
+        save_schedule(schedule_data)
+    if _SCHEDULE_CACHE["data"] is schedule_data:
+        _SCHEDULE_CACHE["heap"] = heap
+
+
+def run_daemon():
+    """Run due schedules at the start of every minute, keeping the parsed schedule and run times between ticks"""
+    while True:
+        check_and_run_schedules()
+        time.sleep(60 - time.time() % 60)
 
-                # Handle one-time schedules
-                if schedule.get("type") == "once":
-                    schedule["enabled"] = False
 
-    # Save updated schedule data
-    save_schedule(schedule_data)
+_TEMPLATE_VARIABLES = {
+    "time": lambda current_time: current_time.strftime("%H:%M"),
+    "date": lambda current_time: current_time.strftime("%Y-%m-%d"),
+    "datetime": lambda current_time: current_time.isoformat(),
+    # Only queried from the server when a command actually uses it
+    "player_count": lambda current_time: str(get_player_count()),
+}
 
 
 def process_command_template(command, current_time):
-    """Process command templates with variables"""
-    # Replace {time} with current time
-    command = command.replace("{time}", current_time.strftime("%H:%M"))
-    command = command.replace("{date}", current_time.strftime("%Y-%m-%d"))
-
-    # Replace {player_count} with actual player count
-    player_count = get_player_count()
-    command = command.replace("{player_count}", str(player_count))
+    """Process command templates with variables ({time}, {date}, {datetime}, {player_count})"""
+    # One pass over the command; other braces (e.g. tellraw JSON components) are left as they are
+    return _TEMPLATE_VARIABLE_RE.sub(lambda match: _TEMPLATE_VARIABLES[match.group(1)](current_time), command)
 
-    # Replace {datetime} with full datetime
-    command = command.replace("{datetime}", current_time.isoformat())
 
-    return command
+def get_player_count(force=False):
+    """Get current player count from server (reused for PLAYER_COUNT_TTL seconds unless force is set)"""
+    if not force and time.monotonic() - _PLAYER_COUNT_CACHE["checked"] < PLAYER_COUNT_TTL:
+        return _PLAYER_COUNT_CACHE["value"]
+    try:
+        output = rcon_command("list")
+        if output is None:
+            rcon_script = SCRIPTS_DIR / "rcon-client.sh"
+            if not rcon_script.exists():
+                return 0
 
+            result = run_with_group_timeout([str(rcon_script), "command", "list"], timeout=10)
+            output = result.stdout if result.returncode == 0 else ""
 
-def get_player_count():
-    """Get current player count from server"""
-    try:
-        rcon_script = SCRIPTS_DIR / "rcon-client.sh"
-        if not rcon_script.exists():
-            return 0
-
-        result = subprocess.run(
-            [str(rcon_script), "command", "list"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=str(PROJECT_ROOT),
-        )
-
-        if result.returncode == 0 and result.stdout:
-            # Parse "There are X of a max of Y players online"
-            match = re.search(r"There are (\d+) of", result.stdout)
+        if output:
+            match = _PLAYER_COUNT_RE.search(output)
             if match:
-                return int(match.group(1))
+                _PLAYER_COUNT_CACHE["value"] = int(match.group(1))
+                _PLAYER_COUNT_CACHE["checked"] = time.monotonic()
+                return _PLAYER_COUNT_CACHE["value"]
     except Exception:
         pass
     return 0
@@ -176,6 +436,66 @@ def check_condition(condition, current_time):
     return True  # Default: condition met
 
 
+def _next_minute_at(current_time, days_ahead, hour, minute, period_days):
+    """Epoch of HH:MM UTC `days_ahead` days from current_time, moved on by period_days once that minute has passed"""
+    candidate = current_time.replace(hour=hour, minute=minute, second=0, microsecond=0) + timedelta(days=days_ahead)
+    if current_time >= candidate + timedelta(minutes=1):
+        candidate += timedelta(days=period_days)
+    return candidate.timestamp()
+
+
+def latest_cron_time(schedule, current_time, last_run):
+    """First cron time within the minute before current_time (or later) that is after last_run"""
+    base_time = current_time - timedelta(minutes=1)
+    if last_run:
+        base_time = max(base_time, datetime.fromtimestamp(last_run_timestamp(schedule), timezone.utc))
+    return croniter(schedule["cron_expression"], base_time).get_next(datetime)
+
+
+def compute_next_run(schedule, current_time):
+    """
+    Earliest UTC epoch at which should_run_schedule could return True for a schedule.
+
+    A lower bound only: the full check (conditions, last_run) still runs once it is reached.
+    Returns None for schedules that can never run, and -inf when the time must be checked every tick.
+    """
+    if not schedule.get("enabled", True):
+        return None
+
+    schedule_type = schedule.get("type")
+    last_run = schedule.get("last_run")
+    try:
+        if schedule_type == "interval":
+            if not last_run:
+                return -math.inf
+            return last_run_timestamp(schedule) + schedule.get("interval_minutes", 60) * 60
+
+        if schedule_type == "daily":
+            hour, minute = divmod(run_minute_of_day(schedule.get("run_time", "00:00")), 60)
+            return _next_minute_at(current_time, 0, hour, minute, 1)
+
+        if schedule_type == "weekly":
+            hour, minute = divmod(run_minute_of_day(schedule.get("run_time", "00:00")), 60)
+            days_ahead = (schedule.get("day_of_week", 0) - current_time.weekday()) % 7
+            return _next_minute_at(current_time, days_ahead, hour, minute, 7)
+
+        if schedule_type == "once":
+            if last_run or not schedule.get("run_datetime"):
+                return None
+            # Runs within a minute either side of run_datetime
+            return parse_timestamp(schedule["run_datetime"]).timestamp() - 60
+
+        if schedule_type == "cron":
+            if not CRONITER_AVAILABLE or not schedule.get("cron_expression"):
+                return None
+            # Runs at the first cron time after last_run that has not yet dropped out of the one-minute window
+            return latest_cron_time(schedule, current_time, last_run).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return -math.inf  # Malformed timing fields: leave the verdict to should_run_schedule
+
+    return None
+
+
 def should_run_schedule(schedule, current_time):
     """Check if a schedule should run now"""
     # Check if enabled
@@ -194,43 +514,27 @@ def should_run_schedule(schedule, current_time):
         # Run every X minutes/hours
         interval_minutes = schedule.get("interval_minutes", 60)
         if last_run:
-            last_run_time = datetime.fromisoformat(last_run.replace("Z", "+00:00"))
-            time_diff = (current_time - last_run_time).total_seconds() / 60
+            time_diff = (current_time.timestamp() - last_run_timestamp(schedule)) / 60
             return time_diff >= interval_minutes
         else:
             return True  # Never run, run now
 
     elif schedule_type == "daily":
         # Run at specific time daily
-        run_time = schedule.get("run_time", "00:00")
-        hour, minute = map(int, run_time.split(":"))
-        current_hour = current_time.hour
-        current_minute = current_time.minute
-
-        if last_run:
-            last_run_time = datetime.fromisoformat(last_run.replace("Z", "+00:00"))
-            # Only run if it's the right time and we haven't run today
-            if current_hour == hour and current_minute == minute:
-                return last_run_time.date() < current_time.date()
+        if current_time.hour * 60 + current_time.minute != run_minute_of_day(schedule.get("run_time", "00:00")):
             return False
-        else:
-            return current_hour == hour and current_minute == minute
+        # Only run if we haven't run today (UTC days since the epoch)
+        return not last_run or last_run_timestamp(schedule) // 86400 < current_time.timestamp() // 86400
 
     elif schedule_type == "weekly":
         # Run on specific day at specific time
         day_of_week = schedule.get("day_of_week", 0)  # 0=Monday, 6=Sunday
-        run_time = schedule.get("run_time", "00:00")
-        hour, minute = map(int, run_time.split(":"))
-
-        if current_time.weekday() == day_of_week:
-            if last_run:
-                last_run_time = datetime.fromisoformat(last_run.replace("Z", "+00:00"))
-                # Only run if right time and we haven't run this week
-                if current_time.hour == hour and current_time.minute == minute:
-                    return (current_time - last_run_time).days >= 7
-                return False
-            else:
-                return current_time.hour == hour and current_time.minute == minute
+        if current_time.weekday() != day_of_week:
+            return False
+        if current_time.hour * 60 + current_time.minute != run_minute_of_day(schedule.get("run_time", "00:00")):
+            return False
+        # Only run if we haven't run this week
+        return not last_run or current_time.timestamp() - last_run_timestamp(schedule) >= 7 * 86400
 
     elif schedule_type == "cron":
         # Cron expression (requires croniter)
@@ -242,12 +546,8 @@ def should_run_schedule(schedule, current_time):
             return False
 
         try:
-            base_time = last_run_time if last_run else current_time
-            cron = croniter(cron_expr, base_time)
-            next_run = cron.get_next(datetime)
-            # Run if next scheduled time is within current minute
-            time_diff = abs((next_run - current_time).total_seconds())
-            return time_diff < 60
+            # Run once per cron time: the first one in the last minute that came after the last run
+            return latest_cron_time(schedule, current_time, last_run) <= current_time
         except Exception:
             return False
 
@@ -258,7 +558,7 @@ def should_run_schedule(schedule, current_time):
             return False
 
         try:
-            run_datetime = datetime.fromisoformat(run_datetime_str.replace("Z", "+00:00"))
+            run_datetime = parse_timestamp(run_datetime_str)
             if last_run:
                 return False  # Already run
             # Run if current time is within 1 minute of scheduled time
@@ -270,22 +570,41 @@ def should_run_schedule(schedule, current_time):
     return False
 
 
-def log_execution(schedule_id, command, success, output, timestamp):
-    """Log command execution"""
-    log_file = PROJECT_ROOT / "config" / "command-schedule.log"
+def format_log_entry(schedule_id, command, success, output, timestamp):
+    """Serialize one execution log entry as a JSON line (bytes); timestamp is a datetime or ISO string"""
     log_entry = {
-        "timestamp": timestamp.isoformat(),
+        "timestamp": timestamp if isinstance(timestamp, str) else timestamp.isoformat(),
         "schedule_id": schedule_id,
         "command": command,
         "success": success,
         "output": output[:500] if output else "",  # Limit output length
     }
-    with open(log_file, "a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(log_entry) + b"\n"
+    return (json.dumps(log_entry) + "\n").encode("utf-8")
+
+
+def write_execution_log(payload):
+    """Append already serialized log lines to the execution log in a single O_APPEND write"""
+    SCHEDULE_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(SCHEDULE_LOG_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        # One write per batch: lines from concurrent runs never interleave
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
 
 
-def add_schedule(command, schedule_type, **kwargs):
-    """Add a new scheduled command"""
+def log_execution(schedule_id, command, success, output, timestamp=None):
+    """Log command execution"""
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc)
+    write_execution_log(format_log_entry(schedule_id, command, success, output, timestamp))
+
+
+def add_schedule(command, schedule_type, now=None, **kwargs):
+    """Add a new scheduled command (batch callers can pass one `now` for all the schedules they add)"""
+    now = now or datetime.now(timezone.utc)
     schedule_data = load_schedule()
     schedules = schedule_data.get("schedules", [])
 
@@ -295,7 +614,7 @@ def add_schedule(command, schedule_type, **kwargs):
         "command": command,
         "type": schedule_type,
         "enabled": kwargs.get("enabled", True),
-        "created": datetime.now(timezone.utc).isoformat(),
+        "created": now.isoformat(),
         "run_count": 0,
     }
 
@@ -352,7 +671,7 @@ def enable_schedule(schedule_id, enabled=True):
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: command-scheduler.py {run|list|add|remove|enable|disable}")
+        print("Usage: command-scheduler.py {run|daemon|list|add|remove|enable|disable}")
         sys.exit(1)
 
     action = sys.argv[1]
@@ -360,6 +679,12 @@ if __name__ == "__main__":
     if action == "run":
         check_and_run_schedules()
 
+    elif action == "daemon":
+        try:
+            run_daemon()
+        except KeyboardInterrupt:
+            pass
+
     elif action == "list":
         schedules = list_schedules()
         print(json.dumps({"schedules": schedules}, indent=2))
@@ -3,7 +3,11 @@ Pytest configuration for API tests
 """
 
 import json
+import re
+import socket
+import struct
 import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,6 +21,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from api.server import app  # noqa: E402
 
 # Imports must come after sys.path modification
+from tests.api.contract_test_utils import load_openapi_schema  # noqa: E402
 from tests.api.factories import (
     create_api_key_data,  # noqa: E402
     create_backup_metadata,
@@ -24,11 +29,14 @@ from tests.api.factories import (
     create_user_data,
 )
 
+# Flask context cleanup errors (expected with threaded tests) that are not reported as teardown failures
+_CONTEXT_ERROR_RE = re.compile(r"Working outside of request context|flask\.request_ctx|ContextVar")
 
-@pytest.fixture
-def test_api_keys_file(tmp_path):
-    """Create temporary API keys file for testing"""
-    keys_file = tmp_path / "api-keys.json"
+
+@pytest.fixture(scope="session")
+def test_api_keys_file(tmp_path_factory):
+    """Create temporary API keys file once per test session (treat it as read-only)"""
+    keys_file = tmp_path_factory.mktemp("apikeys") / "api-keys.json"
     test_key = "test-api-key-123456789012345678901234567890"
     keys_data = {
         test_key: {
@@ -46,20 +54,27 @@ def test_api_keys_file(tmp_path):
 def mock_api_keys(monkeypatch, test_api_keys_file):
     """Mock API keys for testing"""
     keys_file, test_key = test_api_keys_file
+    payload = keys_file.read_bytes()
 
     # Mock the API_KEYS_FILE path
     import api.server as api_module
 
     monkeypatch.setattr(api_module, "API_KEYS_FILE", keys_file)
 
-    # Reload API keys
-    if keys_file.exists():
-        with open(keys_file, "r") as f:
-            api_module.API_KEYS = json.load(f)
-    else:
-        api_module.API_KEYS = {}
+    # Fresh dict per test, so keys created or revoked by one test do not leak into the next
+    monkeypatch.setattr(api_module, "API_KEYS", json.loads(payload))
+
+    yield test_key
+
+    # The file is shared by the whole session; undo any save_api_keys() writes
+    if keys_file.read_bytes() != payload:
+        keys_file.write_bytes(payload)
+
 
-    return test_key
+@pytest.fixture(scope="session")
+def openapi_schema():
+    """OpenAPI schema loaded once per test session (treat it as read-only)"""
+    return load_openapi_schema()
 
 
 @pytest.fixture
@@ -204,6 +219,96 @@ def isolated_test_env(tmp_path, monkeypatch):
     return test_env
 
 
+class FakeRconServer:
+    """
+    Source RCON server that echoes commands like Minecraft (and never answers "hang").
+
+    Like the vanilla server it reads one packet per recv and drops the connection when a read
+    does not hold exactly one packet.
+    """
+
+    def __init__(self, password):
+        self.password = password
+        self.connections = 0
+        self.executed = []
+        self.open_connections = []
+        self.unblock = threading.Event()
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen()
+        self.port = self.listener.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            self.connections += 1
+            self.open_connections.append(conn)
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    @staticmethod
+    def _send(conn, request_id, packet_type, body):
+        payload = struct.pack("<ii", request_id, packet_type) + body.encode() + b"\x00\x00"
+        conn.sendall(struct.pack("<i", len(payload)) + payload)
+
+    def _handle(self, conn):
+        with conn:
+            try:
+                self._exchange(conn)
+            except OSError:
+                pass  # Client or test closed the connection
+
+    def _exchange(self, conn):
+        while True:
+            data = conn.recv(1460)
+            if len(data) < 10:
+                return
+            (length,) = struct.unpack("<i", data[:4])
+            if length != len(data) - 4:
+                return  # Vanilla closes the connection rather than parse a stream
+            payload = data[4:]
+            request_id, packet_type = struct.unpack("<ii", payload[:8])
+            body = payload[8:-2].decode()
+            if packet_type == 3:
+                self._send(conn, request_id if body == self.password else -1, 2, "")
+            elif packet_type == 2:
+                self.executed.append(body)
+                if body == "hang":
+                    self.unblock.wait(5)  # Stuck running the command, like a busy server
+                    continue
+                response = "x" * 10000 if body == "help" else f"ran: {body}"
+                # Long responses are split into 4096-byte packets
+                for start in range(0, len(response), 4096):
+                    self._send(conn, request_id, 0, response[start : start + 4096])
+            else:
+                self._send(conn, request_id, 0, f"Unknown request {packet_type:x}")
+
+    def drop_connections(self):
+        """Close every open connection, as a restarting server would"""
+        for conn in self.open_connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.open_connections = []
+
+    def close(self):
+        self.unblock.set()
+        self.listener.close()
+        self.drop_connections()
+
+
+@pytest.fixture
+def rcon_server():
+    """Start a fake RCON server"""
+    server = FakeRconServer("secret")
+    yield server
+    server.close()
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook to suppress Flask context cleanup errors during teardown"""
@@ -213,18 +318,9 @@ def pytest_runtest_makereport(item, call):
     # Suppress context errors during teardown for concurrent tests
     if call.when == "teardown" and report.failed:
         if call.excinfo:
-            exc_type = call.excinfo.type
-            exc_value = str(call.excinfo.value)
             # Suppress Flask context cleanup errors (expected with threaded tests)
-            if exc_type in (RuntimeError, LookupError):
-                if any(
-                    msg in exc_value
-                    for msg in [
-                        "Working outside of request context",
-                        "flask.request_ctx",
-                        "ContextVar",
-                    ]
-                ):
+            if call.excinfo.type in (RuntimeError, LookupError):
+                if _CONTEXT_ERROR_RE.search(str(call.excinfo.value)):
                     # Mark as passed since these are cleanup-only errors
                     report.outcome = "passed"
                     report.wasxfail = None
@@ -4,14 +4,29 @@ Helpers for validating API contracts against OpenAPI schema
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError, validators
+
+# Optional code-generating validator (compiles each schema to a specialized Python function)
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+    fastjsonschema = None
+
+# id(schema) -> (schema, response index, request index, compiled validators), so a test passing its own
+# schema dict gets its own tables; bounded since each entry keeps its schema alive
+_INDEX_CACHE: Dict[int, tuple] = {}
+_INDEX_CACHE_SIZE = 8
 
 
 def load_openapi_schema(schema_path: Optional[Path] = None) -> Dict[str, Any]:
-    """Load OpenAPI schema from file"""
+    """Load OpenAPI schema from file (parsed once per file version and shared; treat it as read-only)"""
     if schema_path is None:
         # Default to api/openapi.yaml location
         project_root = Path(__file__).parent.parent.parent
@@ -20,22 +35,110 @@ def load_openapi_schema(schema_path: Optional[Path] = None) -> Dict[str, Any]:
     if not schema_path.exists():
         raise FileNotFoundError(f"OpenAPI schema not found: {schema_path}")
 
+    # Prefer a JSON copy of the spec (make openapi-json) while it is at least as new as the YAML:
+    # json parses far faster than PyYAML
+    json_path = schema_path.with_suffix(".json")
+    if schema_path.suffix != ".json" and json_path.exists():
+        if json_path.stat().st_mtime_ns >= schema_path.stat().st_mtime_ns:
+            schema_path = json_path
+
+    resolved = schema_path.resolve()
+    return _parse_schema_file(str(resolved), resolved.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_schema_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a schema file; cached per (path, mtime) so every test reuses one parse"""
+    if path.endswith(".json"):
+        with open(path, "r") as f:
+            return json.load(f)
+
     # For now, return empty dict if YAML parsing not available
     # In production, use PyYAML or similar
     try:
         import yaml
 
-        with open(schema_path, "r") as f:
+        with open(path, "r") as f:
             return yaml.safe_load(f)
     except ImportError:
         # Fallback: try JSON
         try:
-            with open(schema_path, "r") as f:
+            with open(path, "r") as f:
                 return json.load(f)
         except json.JSONDecodeError:
             return {}
 
 
+def _build_response_index(schema: Dict[str, Any]) -> Dict[tuple, Dict[str, Any]]:
+    """Flatten paths -> method -> responses -> status -> JSON schema into {(endpoint, method, status): schema}"""
+    index = {}
+    for endpoint, path_spec in (schema.get("paths") or {}).items():
+        for method, method_spec in (path_spec or {}).items():
+            if not isinstance(method_spec, dict):
+                continue
+            for status, response_spec in (method_spec.get("responses") or {}).items():
+                response_schema = ((response_spec or {}).get("content") or {}).get("application/json", {}).get("schema")
+                if response_schema:
+                    index[(endpoint, method.lower(), str(status))] = response_schema
+    return index
+
+
+def _build_request_index(schema: Dict[str, Any]) -> Dict[tuple, Dict[str, Any]]:
+    """Flatten paths -> method -> requestBody -> JSON schema into {(endpoint, method): schema}"""
+    index = {}
+    for endpoint, path_spec in (schema.get("paths") or {}).items():
+        for method, method_spec in (path_spec or {}).items():
+            if not isinstance(method_spec, dict):
+                continue
+            request_body = method_spec.get("requestBody") or {}
+            request_schema = (request_body.get("content") or {}).get("application/json", {}).get("schema")
+            if request_schema:
+                index[(endpoint, method.lower())] = request_schema
+    return index
+
+
+def _schema_indexes(schema: Dict[str, Any]) -> tuple:
+    """Response/request indexes and the validator cache for a schema, built on first use"""
+    entry = _INDEX_CACHE.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        if len(_INDEX_CACHE) >= _INDEX_CACHE_SIZE:
+            _INDEX_CACHE.clear()
+        entry = (schema, _build_response_index(schema), _build_request_index(schema), {})
+        _INDEX_CACHE[id(schema)] = entry
+    return entry
+
+
+def _compile(subschema: Dict[str, Any]):
+    """Build a function that raises ValidationError for an instance not matching subschema"""
+    if FASTJSONSCHEMA_AVAILABLE:
+        try:
+            # Formats are not asserted, matching the jsonschema fallback (no FormatChecker)
+            check = fastjsonschema.compile(subschema, use_formats=False)
+        except Exception:
+            pass  # Constructs fastjsonschema can't compile (e.g. $refs outside the subschema): use jsonschema
+        else:
+
+            def validate_fast(instance: Any) -> None:
+                try:
+                    check(instance)
+                except fastjsonschema.JsonSchemaValueException as e:
+                    raise ValidationError(e.message) from e
+
+            return validate_fast
+
+    cls = validators.validator_for(subschema)
+    cls.check_schema(subschema)
+    return cls(subschema).validate
+
+
+def _validate(instance: Any, subschema: Dict[str, Any], compiled: Dict[int, Any]) -> None:
+    """jsonschema.validate, but checking and compiling each subschema only once"""
+    validate = compiled.get(id(subschema))
+    if validate is None:
+        validate = compiled[id(subschema)] = _compile(subschema)
+    validate(instance)
+
+
 def validate_response_schema(
     response_data: Dict[str, Any],
     endpoint: str,
@@ -56,25 +159,15 @@ def validate_response_schema(
         return True, None  # Skip validation if schema not available
 
     try:
-        # Find the path and method in schema
-        paths = schema.get("paths", {})
-        path_spec = paths.get(endpoint, {})
-        method_spec = path_spec.get(method.lower(), {})
-
-        # Get response schema for status code
-        responses = method_spec.get("responses", {})
-        response_spec = responses.get(str(status_code), {})
-
-        # Get content schema
-        content = response_spec.get("content", {})
-        json_content = content.get("application/json", {})
-        response_schema = json_content.get("schema", {})
+        # Find the response schema for the path, method and status code
+        _, response_index, _, compiled = _schema_indexes(schema)
+        response_schema = response_index.get((endpoint, method.lower(), str(status_code)))
 
         if not response_schema:
             return True, None  # No schema defined, skip validation
 
         # Validate against JSON Schema
-        validate(instance=response_data, schema=response_schema)
+        _validate(response_data, response_schema, compiled)
         return True, None
 
     except ValidationError as e:
@@ -103,22 +196,15 @@ def validate_request_schema(
         return True, None  # Skip validation if schema not available
 
     try:
-        # Find the path and method in schema
-        paths = schema.get("paths", {})
-        path_spec = paths.get(endpoint, {})
-        method_spec = path_spec.get(method.lower(), {})
-
-        # Get request body schema
-        request_body = method_spec.get("requestBody", {})
-        content = request_body.get("content", {})
-        json_content = content.get("application/json", {})
-        request_schema = json_content.get("schema", {})
+        # Find the request body schema for the path and method
+        _, _, request_index, compiled = _schema_indexes(schema)
+        request_schema = request_index.get((endpoint, method.lower()))
 
         if not request_schema:
             return True, None  # No schema defined, skip validation
 
         # Validate against JSON Schema
-        validate(instance=request_data, schema=request_schema)
+        _validate(request_data, request_schema, compiled)
         return True, None
 
     except ValidationError as e:
@@ -1,18 +1,65 @@
 """
 Test Data Factories
 Reusable factories for creating test data
+
+Names, seeds and UUIDs only need to be unique, so they come from a module-level random.Random;
+generate_api_key produces credentials and stays on secrets.
 """
 
+import random
 import secrets
-import string
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
 
+# Non-cryptographic source for test data uniqueness
+_rng = random.Random()
+
+
+# Timestamp shared by fixtures built within _NOW_TTL seconds of each other
+_NOW_TTL = 0.05
+_NOW_CACHE = {"at": None, "iso": None, "checked": float("-inf")}
+
+
+def _now() -> datetime:
+    """Current UTC time, reused across a burst of factory calls."""
+    checked = time.monotonic()
+    if checked - _NOW_CACHE["checked"] > _NOW_TTL:
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        _NOW_CACHE.update(at=now, iso=_iso_z(now), checked=checked)
+    return _NOW_CACHE["at"]
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601 with a Z suffix, reused across a burst of factory calls."""
+    _now()
+    return _NOW_CACHE["iso"]
+
+
+def _iso_z(moment: datetime) -> str:
+    """Format a UTC datetime as e.g. 2025-01-15T12:00:00Z."""
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _rand_hex(nbytes: int) -> str:
+    """Random hex string of nbytes bytes (test data only, not for secrets)."""
+    return _rng.getrandbits(nbytes * 8).to_bytes(nbytes, "big").hex()
+
+
+# Version (4) and RFC 4122 variant bits of a random UUID
+_UUID4_CLEAR = ~((0xF << 76) | (0xC << 60))
+_UUID4_SET = (0x4 << 76) | (0x8 << 60)
+
+
+def _rand_uuid() -> str:
+    """Random version 4 UUID string, hyphenated as in whitelist/ban files (test data only)."""
+    h = f"{_rng.getrandbits(128) & _UUID4_CLEAR | _UUID4_SET:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 
 def generate_api_key(length: int = 40) -> str:
-    """Generate a random API key."""
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    """Generate a random alphanumeric (hex) API key."""
+    return secrets.token_hex((length + 1) // 2)[:length]
 
 
 def create_user_data(
@@ -24,7 +71,7 @@ def create_user_data(
 ) -> Dict:
     """Create test user data."""
     if username is None:
-        username = f"testuser_{secrets.token_hex(4)}"
+        username = f"testuser_{_rand_hex(4)}"
     if password is None:
         password = "testpassword123"
     if email is None:
@@ -38,7 +85,7 @@ def create_api_key_data(
 ) -> Dict:
     """Create test API key data."""
     if name is None:
-        name = f"test-key-{secrets.token_hex(4)}"
+        name = f"test-key-{_rand_hex(4)}"
     if description is None:
         description = "Test API key"
     if key is None:
@@ -49,7 +96,7 @@ def create_api_key_data(
         "name": name,
         "description": description,
         "enabled": enabled,
-        "created": datetime.now(timezone.utc).isoformat() + "Z",
+        "created": _now_iso(),
     }
 
 
@@ -67,7 +114,7 @@ def create_backup_metadata(
         "name": backup_name,
         "size": size,
         "world": world_name,
-        "created": datetime.now(timezone.utc).isoformat() + "Z",
+        "created": _now_iso(),
         "type": "manual",
     }
 
@@ -91,28 +138,24 @@ def create_whitelist_entry(username: str, uuid: Optional[str] = None) -> Dict:
     """Create test whitelist entry."""
     if uuid is None:
         # Standard UUID format: 8-4-4-4-12 hex characters (36 chars total)
-        import uuid as uuid_lib
-
-        uuid = str(uuid_lib.uuid4())
+        uuid = _rand_uuid()
 
     return {"uuid": uuid, "name": username}
 
 
 def create_ban_entry(username: str, reason: str = "Test ban", expires: Optional[str] = None) -> Dict:
     """Create test ban entry."""
-    now = datetime.now(timezone.utc)
+    now = _now()
     if expires is None:
-        expires = (now + timedelta(days=1)).isoformat() + "Z"
+        expires = _iso_z(now + timedelta(days=1))
 
     # Use standard UUID format
-    import uuid as uuid_lib
-
-    uuid = str(uuid_lib.uuid4())
+    uuid = _rand_uuid()
 
     return {
         "uuid": uuid,
         "name": username,
-        "created": now.isoformat() + "Z",
+        "created": _now_iso(),
         "source": "Server",
         "expires": expires,
         "reason": reason,
@@ -124,22 +167,22 @@ def create_world_data(
 ) -> Dict:
     """Create test world data."""
     if world_name is None:
-        world_name = f"test_world_{secrets.token_hex(4)}"
+        world_name = f"test_world_{_rand_hex(4)}"
     if seed is None:
-        seed = secrets.randbelow(1000000)
+        seed = _rng.randrange(1000000)
 
     return {
         "name": world_name,
         "type": world_type,
         "seed": seed,
-        "created": datetime.now(timezone.utc).isoformat() + "Z",
+        "created": _now_iso(),
     }
 
 
 def create_plugin_data(plugin_name: Optional[str] = None, version: str = "1.0.0", enabled: bool = True) -> Dict:
     """Create test plugin data."""
     if plugin_name is None:
-        plugin_name = f"TestPlugin_{secrets.token_hex(4)}"
+        plugin_name = f"TestPlugin_{_rand_hex(4)}"
 
     return {
         "name": plugin_name,
@@ -6,91 +6,96 @@ Helpers for load testing and performance measurement
 import statistics
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Optional
 
 
 class PerformanceTimer:
-    """Context manager for timing operations"""
+    """Context manager for timing operations (integer nanosecond clock)"""
 
     def __init__(self, label: str = "Operation"):
         self.label = label
         self.start_time = None
         self.end_time = None
-        self.duration = None
+        self.duration_ns = None
 
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_time = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.perf_counter()
-        self.duration = self.end_time - self.start_time
+        self.end_time = time.perf_counter_ns()
+        self.duration_ns = self.end_time - self.start_time
         return False
 
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration in seconds, or None while the timer is running"""
+        return None if self.duration_ns is None else self.duration_ns / 1e9
+
     def get_duration(self) -> float:
         """Get duration in seconds"""
-        if self.duration is None:
+        if self.duration_ns is None:
             raise ValueError("Timer not completed")
-        return self.duration
+        return self.duration_ns / 1e9
 
 
 def measure_execution_time(func: Callable, *args, **kwargs) -> float:
     """Measure execution time of a function"""
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     func(*args, **kwargs)
-    end = time.perf_counter()
-    return end - start
+    return (time.perf_counter_ns() - start) / 1e9
 
 
 def run_load_test(func: Callable, num_requests: int = 100, num_threads: int = 10, *args, **kwargs) -> Dict[str, Any]:
     """Run load test on a function"""
-    results = {
-        "total_requests": num_requests,
-        "num_threads": num_threads,
-        "durations": [],
-        "success_count": 0,
-        "error_count": 0,
-        "errors": [],
-    }
 
     def run_request():
+        # Workers share no state: each reports (duration in ns, None) or (None, error) back to this thread
         try:
-            start = time.perf_counter()
-            result = func(*args, **kwargs)
-            duration = time.perf_counter() - start
-            results["durations"].append(duration)
-            results["success_count"] += 1
-            return result
+            start = time.perf_counter_ns()
+            func(*args, **kwargs)
+            return time.perf_counter_ns() - start, None
         except Exception as e:
-            results["error_count"] += 1
-            results["errors"].append(str(e))
-            return None
+            return None, str(e)
 
-    start_time = time.perf_counter()
+    durations_ns: List[int] = []
+    errors: List[str] = []
+    start_time = time.perf_counter_ns()
 
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
         futures = [executor.submit(run_request) for _ in range(num_requests)]
         for future in as_completed(futures):
-            future.result()
-
-    end_time = time.perf_counter()
-
-    # Calculate statistics
-    durations: list[float] = results["durations"]
-    if durations:
-        results["total_time"] = end_time - start_time
-        results["avg_duration"] = statistics.mean(durations)
-        results["min_duration"] = min(durations)
-        results["max_duration"] = max(durations)
-        results["median_duration"] = statistics.median(durations)
+            duration_ns, error = future.result()
+            if error is None:
+                durations_ns.append(duration_ns)
+            else:
+                errors.append(error)
+
+    end_time = time.perf_counter_ns()
+
+    results = {
+        "total_requests": num_requests,
+        "num_threads": num_threads,
+        "durations": [duration / 1e9 for duration in durations_ns],  # Seconds
+        "success_count": len(durations_ns),
+        "error_count": len(errors),
+        "errors": errors,
+    }
+
+    # Calculate statistics on the integer nanosecond durations, converting to seconds once
+    results["total_time"] = (end_time - start_time) / 1e9
+    if durations_ns:
+        results["avg_duration"] = sum(durations_ns) / len(durations_ns) / 1e9
+        results["min_duration"] = min(durations_ns) / 1e9
+        results["max_duration"] = max(durations_ns) / 1e9
+        results["median_duration"] = statistics.median(durations_ns) / 1e9
         results["requests_per_second"] = num_requests / results["total_time"]
 
-        if len(durations) > 1:
-            results["std_dev"] = statistics.stdev(durations)
+        if len(durations_ns) > 1:
+            results["std_dev"] = statistics.stdev(results["durations"])
         else:
             results["std_dev"] = 0
     else:
-        results["total_time"] = end_time - start_time
         results["avg_duration"] = 0
         results["min_duration"] = 0
         results["max_duration"] = 0
@@ -9,6 +9,7 @@ import json
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -120,6 +121,53 @@ class TestDataLoading:
         assert len(data) == 3
         assert all(r["timestamp"] >= old_record["timestamp"] for r in data)
 
+    def test_load_analytics_data_reuses_widest_window(self, processor, sample_data):
+        """Test shorter windows are sliced from the cached parse until the file changes"""
+        file_path = processor.analytics_dir / "performance.jsonl"
+        with open(file_path, "w") as f:
+            for record in sample_data:
+                f.write(json.dumps(record) + "\n")
+        processor.max_window_hours = 168
+
+        assert len(processor.load_analytics_data("performance", hours=24)) == 3
+        with patch.object(processor, "_parse_analytics_file") as mock_parse:
+            recent = processor.load_analytics_data("performance", hours=1)
+            mock_parse.assert_not_called()
+        assert [r["timestamp"] for r in recent] == [r["timestamp"] for r in sample_data[1:]]
+
+        with open(file_path, "a") as f:
+            f.write(json.dumps({"timestamp": sample_data[-1]["timestamp"], "data": {"tps": 19.0}}) + "\n")
+        assert len(processor.load_analytics_data("performance", hours=24)) == 4
+
+    def test_load_metric_columns_sliced_per_window(self, processor, sample_data):
+        """Test metric columns are extracted once per parse and sliced to each window"""
+        with open(processor.analytics_dir / "performance.jsonl", "w") as f:
+            for record in sample_data:
+                f.write(json.dumps(record) + "\n")
+        processor.max_window_hours = 168
+
+        records, (tps,) = processor.load_metric_columns("performance", ("tps",), hours=24)
+        assert tps == [float(r["data"]["tps"]) for r in records]
+        with patch.object(analytics_processor_module, "extract_columns") as mock_extract:
+            records, (tps,) = processor.load_metric_columns("performance", ("tps",), hours=1)
+            mock_extract.assert_not_called()
+        assert tps == [float(r["data"]["tps"]) for r in records] and len(tps) == len(sample_data) - 1
+
+        assert processor.load_metric_columns("missing", ("tps", "cpu")) == ([], [[], []])
+
+    def test_load_analytics_data_filters_any_key_order(self, processor):
+        """Test the time window applies whether or not timestamp is the leading key"""
+        now = int(datetime.now().timestamp())
+        file_path = processor.analytics_dir / "performance.jsonl"
+        with open(file_path, "w") as f:
+            f.write(f'{{"timestamp":{now - 90000},"data":{{}}}}\n')
+            f.write(f'{{"data":{{}},"timestamp":{now - 90000}}}\n')
+            f.write(f'{{"timestamp":{now}.5,"data":{{"tps":20}}}}\n')
+            f.write(f'{{"datetime":"now","timestamp":{now}}}\n')
+
+        data = processor.load_analytics_data("performance", hours=24)
+        assert [r["timestamp"] for r in data] == [now, now + 0.5]
+
     def test_load_analytics_data_handles_invalid_json(self, processor):
         """Test handling of invalid JSON lines"""
         file_path = processor.analytics_dir / "performance.jsonl"
@@ -206,6 +254,22 @@ class TestTrendCalculation:
         assert abs(trend["slope"]) < 0.01
         assert trend["change_percent"] == 0
 
+    def test_calculate_trends_least_squares_slope(self, processor):
+        """Test slope matches an ordinary least-squares fit over the sample index"""
+        values = [3.0, 7.0, 4.0, 9.0, 12.0, 10.0]
+        data = [{"timestamp": i, "data": {"cpu": v}} for i, v in enumerate(values)]
+
+        n = len(values)
+        x_mean = (n - 1) / 2
+        y_mean = sum(values) / n
+        expected = sum((i - x_mean) * (v - y_mean) for i, v in enumerate(values)) / sum(
+            (i - x_mean) ** 2 for i in range(n)
+        )
+
+        trend = processor.calculate_trends(data, "cpu")
+        assert trend["slope"] == pytest.approx(expected)
+        assert trend["average"] == round(y_mean, 2)
+
     def test_calculate_trends_empty_data(self, processor):
         """Test trend calculation with empty data"""
         trend = processor.calculate_trends([], "tps")
@@ -292,6 +356,16 @@ class TestAnomalyDetection:
             high_anomalies = [a for a in anomalies if a["severity"] == "high"]
             assert len(high_anomalies) > 0 or anomalies[0]["z_score"] > 3.0
 
+    def test_mean_stdev_matches_statistics(self):
+        """Test the fused mean/stdev agrees with the statistics module"""
+        import statistics
+
+        values = [1e6 + v for v in (0.5, 1.25, -3.0, 7.75, 2.0, -0.5)]
+        mean, stdev = analytics_processor_module.mean_stdev(values)
+        assert mean == pytest.approx(statistics.mean(values))
+        assert stdev == pytest.approx(statistics.stdev(values))
+        assert analytics_processor_module.mean_stdev([4.0]) == (4.0, 0.0)
+
     def test_detect_anomalies_insufficient_data(self, processor):
         """Test anomaly detection with insufficient data"""
         data = [
@@ -393,6 +467,18 @@ class TestPredictions:
 
         assert prediction_many["confidence"] >= prediction_few["confidence"]
 
+    def test_predict_future_least_squares_fit(self, processor):
+        """Test prediction extrapolates the least-squares slope and reports its R^2"""
+        data = [{"timestamp": i, "data": {"memory": v}} for i, v in enumerate([1000, 1100, 1200, 1300])]
+        prediction = processor.predict_future(data, "memory", hours_ahead=2)
+        assert prediction["predicted"] == 1500
+        assert prediction["trend"] == 100
+        assert prediction["r_squared"] == 1.0
+
+        noisy = processor.predict_future(data, "memory", values=[1000.0, 1200.0, 1100.0, 1300.0], slope=80.0)
+        assert noisy["predicted"] == 1380
+        assert 0 < noisy["r_squared"] < 1
+
     def test_predict_future_insufficient_data(self, processor):
         """Test prediction with insufficient data"""
         data = [
@@ -640,6 +726,43 @@ class TestReportGeneration:
             saved_report = json.load(f)
         assert saved_report["period_hours"] == report["period_hours"]
 
+    def test_generate_report_cached_until_inputs_change(self, processor, sample_data):
+        """Test an unchanged data set reuses the cached report across processor instances"""
+        perf_file = processor.analytics_dir / "performance.jsonl"
+        with open(perf_file, "w") as f:
+            for record in sample_data:
+                f.write(json.dumps(record) + "\n")
+
+        report = processor.generate_report(hours=24)
+
+        fresh = AnalyticsProcessor()
+        fresh.analytics_dir = processor.analytics_dir
+        fresh.output_dir = processor.output_dir
+        with patch.object(fresh, "_build_report") as mock_build:
+            cached = fresh.generate_report(hours=24)
+            mock_build.assert_not_called()
+        assert cached["performance"] == report["performance"]
+        # Stored as plain JSON, not an executable pickle
+        cache_file, _ = fresh._report_cache_state(24)
+        assert json.loads(cache_file.read_bytes())["report"]["period_hours"] == 24
+
+        with open(perf_file, "a") as f:
+            f.write(json.dumps({"timestamp": sample_data[-1]["timestamp"], "data": {"tps": 5.0}}) + "\n")
+        assert fresh.generate_report(hours=24)["performance"]["tps"]["current"] == 5.0
+
+    def test_generate_report_cache_expires_with_window(self, processor, sample_data):
+        """Test the cached report is rebuilt once its oldest record leaves the window"""
+        perf_file = processor.analytics_dir / "performance.jsonl"
+        with open(perf_file, "w") as f:
+            for record in sample_data:
+                f.write(json.dumps(record) + "\n")
+
+        with patch.object(processor, "_report_valid_until", return_value=0):
+            processor.generate_report(hours=1)
+        with patch.object(processor, "_build_report", return_value={}) as mock_build:
+            processor.generate_report(hours=1)
+            mock_build.assert_called_once_with(1)
+
 
 class TestPerformanceTrends:
     """Tests for performance trend analysis"""
@@ -661,6 +784,20 @@ class TestPerformanceTrends:
         assert "current" in trends["tps"]
         assert "average" in trends["tps"]
 
+    def test_extract_columns_single_pass(self, sample_data):
+        """Test metric columns are extracted together, missing values as 0"""
+        records = sample_data + [{"timestamp": 0, "data": {"tps": 18}}]
+        tps, cpu, memory = analytics_processor_module.extract_columns(records, ("tps", "cpu", "memory"))
+
+        assert tps == [20.0, 19.5, 20.0, 18.0]
+        assert cpu == [50.0, 55.0, 52.0, 0.0]
+        assert memory == analytics_processor_module.extract_column(records, "memory")
+        assert analytics_processor_module.extract_columns(sample_data, ("tps", "cpu")) == [
+            [20.0, 19.5, 20.0],
+            [50.0, 55.0, 52.0],
+        ]
+        assert analytics_processor_module.extract_column([{"timestamp": 0}, {"data": {"tps": 1}}], "tps") == [0.0, 1.0]
+
     def test_analyze_performance_trends_anomalies(self, processor):
         """Test anomaly detection in performance trends"""
         base_time = int(datetime.now().timestamp())
@@ -63,6 +63,54 @@ class TestStatusEndpoint:
         )
         assert response.status_code == 401
 
+    def test_status_with_disabled_key(self, client, monkeypatch):
+        """Status endpoint rejects a disabled API key"""
+        import api.server as api_module
+
+        monkeypatch.setattr(api_module, 'API_KEYS', {'disabled-key': {'name': 'old', 'enabled': False}})
+        response = client.get('/api/status', headers={'X-API-Key': 'disabled-key'})
+        assert response.status_code == 401
+
+    def test_api_keys_reloaded_when_file_changes(self, client, tmp_path, monkeypatch):
+        """Keys added to the keys file outside the API are picked up"""
+        import api.server as api_module
+
+        keys_file = tmp_path / 'api-keys.json'
+        keys_file.write_text('{}')
+        monkeypatch.setattr(api_module, 'API_KEYS_FILE', keys_file)
+        monkeypatch.setattr(api_module, 'API_KEYS', {})
+        monkeypatch.setattr(api_module, 'API_KEYS_RELOAD_INTERVAL', 0)
+        api_module.refresh_api_keys()  # Record the new file as the baseline
+
+        keys_file.write_text(json.dumps({'new-key': {'name': 'cli', 'enabled': True}}))
+        api_module.refresh_api_keys()
+        assert 'new-key' in api_module.enabled_api_keys()
+
+
+class TestApiConfig:
+    """Tests for config/api.conf parsing"""
+
+    def test_load_api_config(self, tmp_path):
+        """KEY=value lines are read case-sensitively, comments and blank lines skipped"""
+        from api.server import load_api_config
+
+        config_file = tmp_path / 'api.conf'
+        config_file.write_text('# API settings\nAPI_PORT=9090\n\nAPI_HOST=0.0.0.0\nSECRET_KEY=a%b=c\n')
+        assert load_api_config(config_file) == {'API_PORT': '9090', 'API_HOST': '0.0.0.0', 'SECRET_KEY': 'a%b=c'}
+        assert load_api_config(tmp_path / 'missing.conf') == {}
+
+    def test_load_api_config_tolerates_odd_lines(self, tmp_path):
+        """Indented, key-less and section lines never merge into or hide other settings"""
+        from api.server import load_api_config
+
+        config_file = tmp_path / 'api.conf'
+        config_file.write_text('API_PORT=8080\n  API_HOST=x\n=x\n[section]\nSECRET_KEY=s\n')
+        config = load_api_config(config_file)
+        assert config['API_PORT'] == '8080'
+        assert config['API_HOST'] == 'x'
+        assert config['SECRET_KEY'] == 's'
+        assert '[section]' not in config
+
 
 class TestServerControl:
     """Tests for server control endpoints"""
@@ -82,6 +130,31 @@ class TestServerControl:
         response = client.post('/api/server/restart')
         assert response.status_code == 401
 
+    def test_timed_out_script_never_starts_late(self, monkeypatch):
+        """A script still queued when its caller times out is cancelled instead of running later"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        import api.server as api_module
+
+        release = threading.Event()
+        started = []
+        monkeypatch.setattr(api_module, 'run_script', lambda script_name, *args: started.append(args))
+        monkeypatch.setattr(api_module, 'SCRIPT_TIMEOUT', 0.05)
+
+        # A long backup holds the only worker
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            busy = pool.submit(release.wait, 5)
+            assert api_module.run_script_pooled('manage.sh', 'start', pool=pool) == (
+                None, 'Script execution timeout', 504
+            )
+            release.set()
+            busy.result(5)
+        finally:
+            pool.shutdown(wait=True)
+        assert started == []
+
 
 class TestServerCommand:
     """Tests for /api/server/command endpoint"""
@@ -106,6 +179,27 @@ class TestServerCommand:
         assert response.status_code in [400, 401]
 
 
+class TestScheduleEndpoints:
+    """Tests for /api/scheduler/schedules endpoints"""
+
+    def test_delete_unknown_schedule_succeeds_without_rewrite(self, client, mock_api_keys, tmp_path, monkeypatch):
+        """Deleting an unknown id returns 200 and leaves the schedule file untouched"""
+        import api.server as api_module
+
+        schedule_file = tmp_path / 'command-schedule.json'
+        original = json.dumps({'schedules': [{'id': 'keep'}]}, indent=2)
+        schedule_file.write_text(original)
+        monkeypatch.setattr(api_module, 'SCHEDULE_FILE', schedule_file)
+
+        response = client.delete('/api/scheduler/schedules/missing', headers={'X-API-Key': mock_api_keys})
+        assert response.status_code == 200
+        assert schedule_file.read_text() == original
+
+        response = client.delete('/api/scheduler/schedules/keep', headers={'X-API-Key': mock_api_keys})
+        assert response.status_code == 200
+        assert json.loads(schedule_file.read_text()) == {'schedules': []}
+
+
 class TestBackupEndpoints:
     """Tests for backup endpoints"""
 
@@ -137,6 +231,33 @@ class TestLogsEndpoint:
         # May fail if server not running, but should not be 401
         assert response.status_code != 401
 
+    def test_logs_lines_parameter_clamped(self, client, mock_api_keys, monkeypatch):
+        """Huge or negative lines values are clamped before reaching docker"""
+        import api.server as api_module
+
+        calls = []
+        result = type('Result', (), {'returncode': 0, 'stdout': 'a\nb', 'stderr': ''})()
+        monkeypatch.setattr(api_module, 'docker_api', lambda: None)
+        monkeypatch.setattr(api_module, 'run_docker_cached', lambda args, **kwargs: calls.append(args) or result)
+
+        for lines in ('999999999', '-5'):
+            client.get(f'/api/logs?lines={lines}', headers={'X-API-Key': mock_api_keys})
+        assert [args[3] for args in calls] == [str(api_module.LOGS_MAX_LINES), '1']
+
+    def test_docker_result_cache_bounded(self, monkeypatch):
+        """Cached docker results are capped in number and dropped once expired"""
+        import api.server as api_module
+
+        monkeypatch.setattr(api_module, '_DOCKER_CACHE', {})
+        for lines in range(100):
+            api_module.ttl_cached(('api', 'logs', lines), 60, lambda: 'logs')
+        assert len(api_module._DOCKER_CACHE) == api_module.DOCKER_CACHE_MAX_ENTRIES
+        assert ('api', 'logs', 99) in api_module._DOCKER_CACHE
+
+        api_module.ttl_cached('fresh', 0, lambda: 'x')
+        api_module.ttl_cached('other', 60, lambda: 'y')
+        assert 'fresh' not in api_module._DOCKER_CACHE
+
 
 class TestPlayersEndpoint:
     """Tests for /api/players endpoint"""
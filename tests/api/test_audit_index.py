@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the audit log index
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.audit_index import AuditIndex
+
+
+def write_entries(log_file, entries, mode="a"):
+    """Append audit entries to a JSONL log file"""
+    with open(log_file, mode, encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def make_entry(i, action="server.start", username="admin"):
+    """Create an audit entry with an increasing timestamp"""
+    return {
+        "timestamp": f"2024-01-27T12:00:{i:02d}+00:00",
+        "username": username,
+        "action": action,
+        "details": {"n": i},
+        "ip_address": "127.0.0.1",
+    }
+
+
+@pytest.fixture
+def audit_log(tmp_path):
+    """Create an audit log with mixed entries"""
+    log_file = tmp_path / "audit.log"
+    write_entries(
+        log_file,
+        [
+            make_entry(i, action="server.start" if i % 2 else "backup.create", username=f"user{i % 3}")
+            for i in range(10)
+        ],
+    )
+    return log_file
+
+
+class TestAuditIndex:
+    """Tests for AuditIndex"""
+
+    def test_query_returns_newest_first(self, audit_log):
+        """Entries are returned newest first with the total count"""
+        total, entries = AuditIndex(audit_log).query(limit=3)
+        assert total == 10
+        assert [e["details"]["n"] for e in entries] == [9, 8, 7]
+
+    def test_query_filters_and_paginates(self, audit_log):
+        """Action/username filters and offset are applied"""
+        index = AuditIndex(audit_log)
+        total, entries = index.query(action="server.start", limit=2, offset=1)
+        assert total == 5
+        assert [e["details"]["n"] for e in entries] == [7, 5]
+
+        total, entries = index.query(username="user0")
+        assert total == 4
+        assert all(e["username"] == "user0" for e in entries)
+
+    def test_sync_indexes_appended_entries(self, audit_log):
+        """New lines are picked up incrementally"""
+        index = AuditIndex(audit_log)
+        assert index.query()[0] == 10
+
+        write_entries(audit_log, [make_entry(42)])
+        total, entries = index.query(limit=1)
+        assert total == 11
+        assert entries[0]["details"]["n"] == 42
+
+    def test_sync_rebuilds_after_truncation(self, audit_log):
+        """A truncated or rewritten log is re-indexed from scratch"""
+        index = AuditIndex(audit_log)
+        assert index.query()[0] == 10
+
+        write_entries(audit_log, [make_entry(1)], mode="w")
+        total, entries = index.query()
+        assert total == 1
+        assert entries[0]["details"]["n"] == 1
+
+    def test_skips_invalid_lines(self, tmp_path):
+        """Malformed lines are ignored"""
+        log_file = tmp_path / "audit.log"
+        log_file.write_text("not json\n" + json.dumps(make_entry(5)) + "\n")
+        total, entries = AuditIndex(log_file).query()
+        assert total == 1
+        assert entries[0]["details"]["n"] == 5
+
+
+class TestAuditWriter:
+    """Tests for the background audit log writer"""
+
+    def test_queued_events_are_written_in_order(self, tmp_path, monkeypatch):
+        """Events logged in a burst are all appended once flushed"""
+        import api.server as api_module
+
+        log_file = tmp_path / "audit.log"
+        monkeypatch.setattr(api_module, "AUDIT_LOG_FILE", log_file)
+
+        with api_module.app.test_request_context("/"):
+            for i in range(100):
+                api_module.log_audit_event("admin", "server.start", {"n": i})
+
+        assert api_module.flush_audit_log()
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["details"]["n"] for line in lines] == list(range(100))
+
+
+class TestTailLines:
+    """Tests for reading the newest audit log lines"""
+
+    def test_tail_lines_spans_chunks(self, tmp_path):
+        """Lines split across read chunks are reassembled"""
+        from api.server import tail_lines
+
+        log_file = tmp_path / "audit.log"
+        write_entries(log_file, [make_entry(i) for i in range(50)])
+
+        lines = tail_lines(log_file, 5, chunk_size=64)
+        assert [json.loads(line)["details"]["n"] for line in lines] == [45, 46, 47, 48, 49]
+        assert len(tail_lines(log_file, 500, chunk_size=64)) == 50
+
+    def test_unfiltered_total_counts_entries_incrementally(self, client, mock_api_keys, tmp_path, monkeypatch):
+        """The unfiltered total counts parseable entries and only reads lines appended since last time"""
+        import api.server as api_module
+
+        log_file = tmp_path / "audit.log"
+        write_entries(log_file, [make_entry(i) for i in range(5)])
+        with open(log_file, "a") as f:
+            f.write("\nnot json\n")
+        monkeypatch.setattr(api_module, "AUDIT_LOG_FILE", log_file)
+        monkeypatch.setattr(api_module, "get_audit_index", lambda: None)
+        monkeypatch.setattr(api_module, "_audit_count_state", {"key": None, "offset": 0, "count": 0})
+
+        def total():
+            response = client.get("/api/audit/logs?limit=2", headers={"X-API-Key": mock_api_keys})
+            return response.get_json()["total"]
+
+        assert total() == 5
+        offset = api_module._audit_count_state["offset"]
+        assert offset == log_file.stat().st_size
+        write_entries(log_file, [make_entry(i) for i in range(5, 8)])
+        parsed = []
+        json_loads = api_module._json_loads
+        monkeypatch.setattr(api_module, "_json_loads", lambda line: parsed.append(line) or json_loads(line))
+        assert total() == 8
+        # Two newest entries for the page, three appended ones for the count
+        assert len(parsed) == 2 + 3
@@ -24,16 +24,6 @@ def client():
         yield client
 
 
-@pytest.fixture
-def mock_api_keys(monkeypatch):
-    """Mock API keys for testing"""
-    test_key = "test-api-key-123456789012345678901234567890"
-    import api.server as api_module
-
-    api_module.API_KEYS = {test_key: {"name": "test-key", "enabled": True, "created": "2025-01-15T00:00:00Z"}}
-    return test_key
-
-
 @pytest.fixture
 def temp_backup_environment(tmp_path, monkeypatch):
     """Create temporary backup environment"""
@@ -53,6 +43,42 @@ def temp_backup_environment(tmp_path, monkeypatch):
     return backups_dir, data_dir, backup_file
 
 
+class TestBackupList:
+    """Tests for GET /api/backups endpoint"""
+
+    def test_list_backups_newest_first(self, client, mock_api_keys, temp_backup_environment):
+        """Only backup archives are listed, newest first"""
+        import os
+
+        backups_dir, _, backup_file = temp_backup_environment
+        newer = backups_dir / "minecraft_backup_20250116_120000.tar.gz"
+        newer.write_bytes(b"newer backup")
+        (backups_dir / "pre_restore_20250116_120000.tar.gz").write_bytes(b"snapshot")
+        os.utime(backup_file, (1_700_000_000, 1_700_000_000))
+        os.utime(newer, (1_700_000_100, 1_700_000_100))
+
+        response = client.get("/api/backups", headers={"X-API-Key": mock_api_keys})
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert [b["name"] for b in data["backups"]] == [newer.name, backup_file.name]
+        assert data["backups"][0]["size"] == len(b"newer backup")
+        assert data["backups"][0]["path"] == f"backups/{newer.name}"
+
+    def test_list_backups_not_modified(self, client, mock_api_keys, temp_backup_environment):
+        """Listing returns 304 until a backup is added"""
+        backups_dir, _, _ = temp_backup_environment
+        headers = {"X-API-Key": mock_api_keys}
+
+        etag = client.get("/api/backups", headers=headers).headers["ETag"]
+        assert client.get("/api/backups", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+        (backups_dir / "minecraft_backup_20250116_120000.tar.gz").write_bytes(b"new")
+        response = client.get("/api/backups", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert json.loads(response.data)["count"] == 2
+
+
 class TestBackupRestore:
     """Tests for POST /api/backups/<filename>/restore endpoint"""
 
@@ -99,6 +125,40 @@ class TestBackupRestore:
             assert call_args[0][0] == "manage.sh"
             assert call_args[0][1] == "stop"
 
+    @patch("api.server.run_script")
+    def test_restore_backup_reuses_unchanged_snapshot(
+        self, mock_run_script, client, mock_api_keys, temp_backup_environment
+    ):
+        """Pre-restore snapshot is hardlinked when the data dir is unchanged since the last one"""
+        import io
+        import tarfile
+
+        import api.server as api_module
+
+        backups_dir, data_dir, backup_file = temp_backup_environment
+        mock_run_script.return_value = (None, None, 0)
+
+        with tarfile.open(backup_file, "w:gz") as tar:
+            info = tarfile.TarInfo("restored.txt")
+            info.size = 4
+            tar.addfile(info, io.BytesIO(b"data"))
+
+        (data_dir / "level.dat").write_bytes(b"world")
+        previous = backups_dir / "pre_restore_20000101_000000.tar.gz"
+        previous.write_bytes(b"previous snapshot")
+        PathLib(f"{previous}.hash").write_text(api_module.tree_hash(data_dir))
+
+        response = client.post(
+            f"/api/backups/{backup_file.name}/restore",
+            headers={"X-API-Key": mock_api_keys},
+        )
+
+        assert response.status_code == 200
+        snapshot = backups_dir.parent / json.loads(response.data)["pre_restore_backup"]
+        assert snapshot != previous
+        assert snapshot.stat().st_ino == previous.stat().st_ino
+        assert (data_dir / "restored.txt").read_bytes() == b"data"
+
 
 class TestBackupDelete:
     """Tests for DELETE /api/backups/<filename> endpoint"""
@@ -124,6 +184,20 @@ class TestBackupDelete:
         )
         assert response.status_code == 400
 
+    def test_delete_listed_backup_with_unusual_name(self, client, mock_api_keys, temp_backup_environment):
+        """Any backup the listing shows can be deleted, even with spaces, "+" or ":" in its name"""
+        backups_dir, _, _ = temp_backup_environment
+        headers = {"X-API-Key": mock_api_keys}
+        backup = backups_dir / "minecraft_backup_2025-01-15 12:00+01.tar.gz"
+        backup.write_bytes(b"backup")
+
+        names = [b["name"] for b in client.get("/api/backups", headers=headers).get_json()["backups"]]
+        assert backup.name in names
+
+        response = client.delete(f"/api/backups/{backup.name}", headers=headers)
+        assert response.status_code == 200
+        assert not backup.exists()
+
     def test_delete_backup_success(self, client, mock_api_keys, temp_backup_environment, monkeypatch):
         """Delete backup successfully removes backup file"""
         backups_dir, data_dir, backup_file = temp_backup_environment
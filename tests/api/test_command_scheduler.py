@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Unit Tests: Command Scheduler
+Tests for schedule due-time calculation and the run loop
+"""
+
+import importlib.util
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+
+# Import command-scheduler.py (hyphenated filename requires importlib)
+scheduler_module_path = SCRIPTS_DIR / "command-scheduler.py"
+spec = importlib.util.spec_from_file_location("command_scheduler", scheduler_module_path)
+scheduler = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(scheduler)
+
+
+@pytest.fixture
+def schedule_files(tmp_path, monkeypatch):
+    """Point the scheduler at temporary schedule and log files"""
+    monkeypatch.setattr(scheduler, "SCHEDULE_FILE", tmp_path / "command-schedule.json")
+    monkeypatch.setattr(scheduler, "SCHEDULE_LOG_FILE", tmp_path / "command-schedule.log")
+    return tmp_path
+
+
+class TestComputeNextRun:
+    """Tests for compute_next_run"""
+
+    def test_daily_before_and_after_run_time(self):
+        """Test daily schedules are due at today's run minute until it passes, then tomorrow's"""
+        schedule = {"type": "daily", "run_time": "18:30"}
+        morning = datetime(2025, 1, 15, 9, 0, tzinfo=timezone.utc)
+        during = datetime(2025, 1, 15, 18, 30, 45, tzinfo=timezone.utc)
+        evening = datetime(2025, 1, 15, 18, 31, tzinfo=timezone.utc)
+
+        today = datetime(2025, 1, 15, 18, 30, tzinfo=timezone.utc).timestamp()
+        assert scheduler.compute_next_run(schedule, morning) == today
+        assert scheduler.compute_next_run(schedule, during) == today
+        assert scheduler.compute_next_run(schedule, evening) == today + 86400
+
+    def test_weekly_targets_day_of_week(self):
+        """Test weekly schedules are due on the configured weekday"""
+        schedule = {"type": "weekly", "day_of_week": 4, "run_time": "03:00"}
+        wednesday = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+        friday = datetime(2025, 1, 17, 3, 0, tzinfo=timezone.utc).timestamp()
+        assert scheduler.compute_next_run(schedule, wednesday) == friday
+
+    def test_interval_and_disabled(self):
+        """Test interval schedules are due interval_minutes after the last run; disabled ones never"""
+        last_run = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+        now = last_run + timedelta(minutes=5)
+        schedule = {"type": "interval", "interval_minutes": 30, "last_run": last_run.isoformat()}
+
+        assert scheduler.compute_next_run(schedule, now) == last_run.timestamp() + 1800
+        assert scheduler.compute_next_run({"type": "interval"}, now) == float("-inf")
+        assert scheduler.compute_next_run({**schedule, "enabled": False}, now) is None
+
+    def test_numeric_last_run_preferred(self, monkeypatch):
+        """Test the numeric last_run_ts is used without parsing last_run"""
+        last_run = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+        schedule = {"type": "interval", "interval_minutes": 30, "last_run": last_run.isoformat()}
+        assert scheduler.last_run_timestamp(schedule) == last_run.timestamp()
+
+        monkeypatch.setattr(scheduler, "parse_timestamp", lambda value: pytest.fail("last_run parsed"))
+        schedule["last_run_ts"] = last_run.timestamp()
+        assert scheduler.compute_next_run(schedule, last_run) == last_run.timestamp() + 1800
+        assert not scheduler.should_run_schedule(schedule, last_run + timedelta(minutes=29))
+        assert scheduler.should_run_schedule(schedule, last_run + timedelta(minutes=30))
+
+    def test_daily_and_weekly_fire_at_run_minute(self):
+        """Test daily and weekly schedules fire only in their run minute, once per day or week"""
+        friday = datetime(2025, 1, 17, 3, 0, 30, tzinfo=timezone.utc)
+        daily = {"type": "daily", "run_time": "03:00"}
+        weekly = {"type": "weekly", "day_of_week": 4, "run_time": "03:00"}
+
+        for schedule in (daily, weekly):
+            assert scheduler.should_run_schedule(schedule, friday)
+            assert not scheduler.should_run_schedule(schedule, friday + timedelta(minutes=1))
+            assert not scheduler.should_run_schedule({**schedule, "last_run": friday.isoformat()}, friday)
+        assert scheduler.should_run_schedule(daily, friday + timedelta(days=1))
+        assert not scheduler.should_run_schedule(weekly, friday + timedelta(days=1))
+        assert scheduler.run_minute_of_day("18:30") == 18 * 60 + 30
+
+    @pytest.mark.skipif(not scheduler.CRONITER_AVAILABLE, reason="croniter not installed")
+    def test_cron_due_at_next_fire_time(self):
+        """Test cron schedules are due at their next cron time after the last run"""
+        now = datetime(2025, 1, 15, 12, 10, tzinfo=timezone.utc)
+        schedule = {"type": "cron", "cron_expression": "30 * * * *"}
+
+        half_past = datetime(2025, 1, 15, 12, 30, tzinfo=timezone.utc).timestamp()
+        assert scheduler.compute_next_run(schedule, now) == half_past
+        last_run = datetime(2025, 1, 15, 12, 30, tzinfo=timezone.utc).isoformat()
+        assert scheduler.compute_next_run({**schedule, "last_run": last_run}, now) == half_past + 3600
+        assert scheduler.compute_next_run({**schedule, "cron_expression": "61 * * * *"}, now) == float("-inf")
+        assert scheduler.compute_next_run({"type": "cron"}, now) is None
+
+    @pytest.mark.skipif(not scheduler.CRONITER_AVAILABLE, reason="croniter not installed")
+    def test_cron_runs_once_per_period(self):
+        """Test a cron schedule checked every minute runs exactly once per cron time"""
+        schedule = {"type": "cron", "cron_expression": "*/5 * * * *"}
+        start = datetime(2025, 1, 15, 12, 0, 0, 500000, tzinfo=timezone.utc)
+
+        runs = []
+        for minute in range(1, 21):
+            tick = start + timedelta(minutes=minute)
+            due = scheduler.compute_next_run(schedule, tick)
+            if due <= tick.timestamp() and scheduler.should_run_schedule(schedule, tick):
+                runs.append(tick.strftime("%H:%M"))
+                schedule["last_run"] = tick.isoformat()
+                schedule["last_run_ts"] = tick.timestamp()
+
+        assert runs == ["12:05", "12:10", "12:15", "12:20"]
+
+
+class TestRunSchedules:
+    """Tests for check_and_run_schedules"""
+
+    def test_only_due_schedules_are_checked(self, schedule_files, monkeypatch):
+        """Test schedules that are not due skip their conditions and commands"""
+        now = datetime.now(timezone.utc)
+        not_due = {
+            "id": "later",
+            "type": "interval",
+            "command": "say later",
+            "interval_minutes": 60,
+            "last_run": now.isoformat(),
+            "condition": {"type": "player_count", "operator": ">", "value": 0},
+        }
+        due = {"id": "now", "type": "interval", "command": "say now", "interval_minutes": 1}
+        scheduler.SCHEDULE_FILE.write_text(json.dumps({"schedules": [not_due, due]}))
+
+        executed = []
+        monkeypatch.setattr(scheduler, "execute_command", lambda command: executed.append(command) or (True, "ok"))
+        monkeypatch.setattr(scheduler, "get_player_count", lambda: pytest.fail("condition evaluated"))
+
+        scheduler.check_and_run_schedules()
+
+        assert executed == ["say now"]
+        saved = json.loads(scheduler.SCHEDULE_FILE.read_text())["schedules"]
+        assert saved[1]["run_count"] == 1
+        assert list(schedule_files.glob(".command-schedule.json.*")) == []
+        log_entry = json.loads(scheduler.SCHEDULE_LOG_FILE.read_text())
+        assert log_entry["schedule_id"] == "now"
+
+    def test_log_entries_written_once_per_run(self, schedule_files, monkeypatch):
+        """Test every execution of a run is appended to the log in one write"""
+        schedules = [{"id": name, "type": "interval", "command": f"say {name}"} for name in ("a", "b")]
+        scheduler.SCHEDULE_FILE.write_text(json.dumps({"schedules": schedules}))
+        monkeypatch.setattr(scheduler, "execute_command", lambda command: (True, "ok"))
+
+        writes = []
+        write_execution_log = scheduler.write_execution_log
+        monkeypatch.setattr(scheduler, "write_execution_log", lambda p: writes.append(p) or write_execution_log(p))
+
+        scheduler.check_and_run_schedules()
+
+        assert len(writes) == 1
+        entries = [json.loads(line) for line in scheduler.SCHEDULE_LOG_FILE.read_text().splitlines()]
+        assert [entry["schedule_id"] for entry in entries] == ["a", "b"]
+        # One timestamp for the whole tick, matching the last_run it recorded
+        last_runs = {s["last_run"] for s in json.loads(scheduler.SCHEDULE_FILE.read_text())["schedules"]}
+        assert {entry["timestamp"] for entry in entries} == last_runs and len(last_runs) == 1
+
+    def test_add_schedule_uses_given_now(self, schedule_files):
+        """Test batch callers can stamp every schedule they add with one timestamp"""
+        now = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+        for minutes in (5, 10):
+            scheduler.add_schedule("say hi", "interval", now=now, interval_minutes=minutes)
+
+        saved = json.loads(scheduler.SCHEDULE_FILE.read_text())["schedules"]
+        assert [s["created"] for s in saved] == [now.isoformat()] * 2
+        assert [s["interval_minutes"] for s in saved] == [5, 10]
+
+    def test_due_commands_run_concurrently(self, schedule_files, monkeypatch):
+        """Test due commands are sent together and their results recorded in due order"""
+        schedules = [{"id": name, "type": "interval", "command": f"say {name}"} for name in ("a", "b")]
+        scheduler.SCHEDULE_FILE.write_text(json.dumps({"schedules": schedules}))
+        monkeypatch.setitem(scheduler._RCON, "client", False)
+
+        # Each command waits for the other: run one after the other, the barrier would time out
+        barrier = threading.Barrier(2, timeout=5)
+        monkeypatch.setattr(scheduler, "execute_command", lambda command: (barrier.wait() >= 0, command))
+
+        scheduler.check_and_run_schedules()
+
+        lines = scheduler.SCHEDULE_LOG_FILE.read_text().splitlines()
+        assert [json.loads(line)["output"] for line in lines] == ["say a", "say b"]
+        assert all(s["run_count"] == 1 for s in json.loads(scheduler.SCHEDULE_FILE.read_text())["schedules"])
+
+    def test_idle_tick_leaves_schedule_file_untouched(self, schedule_files, monkeypatch):
+        """Test a tick with nothing due neither rewrites nor re-parses the schedule file"""
+        now = datetime.now(timezone.utc)
+        schedule = {"id": "later", "type": "interval", "command": "say hi", "interval_minutes": 60}
+        schedule["last_run"] = now.isoformat()
+        scheduler.SCHEDULE_FILE.write_text(json.dumps({"schedules": [schedule]}))
+        before = scheduler.SCHEDULE_FILE.stat().st_mtime_ns
+
+        scheduler.check_and_run_schedules()
+        monkeypatch.setattr(scheduler, "_json_loads", lambda data: pytest.fail("schedule file re-parsed"))
+        scheduler.check_and_run_schedules()
+
+        assert scheduler.SCHEDULE_FILE.stat().st_mtime_ns == before
+        assert scheduler.list_schedules() == [schedule]
+
+    def test_next_run_times_reused_between_ticks(self, schedule_files, monkeypatch):
+        """Test run times are computed once per schedule file and after each check of a due schedule"""
+        now = datetime.now(timezone.utc)
+        later = {"id": "later", "type": "interval", "command": "say later", "interval_minutes": 60}
+        later["last_run"] = now.isoformat()
+        due = {"id": "now", "type": "interval", "command": "say now", "interval_minutes": 60}
+        scheduler.SCHEDULE_FILE.write_text(json.dumps({"schedules": [later, due]}))
+        monkeypatch.setattr(scheduler, "execute_command", lambda command: (True, "ok"))
+
+        computed = []
+        compute_next_run = scheduler.compute_next_run
+        monkeypatch.setattr(
+            scheduler, "compute_next_run", lambda s, t: computed.append(s["id"]) or compute_next_run(s, t)
+        )
+
+        scheduler.check_and_run_schedules()
+        assert computed == ["later", "now", "now"]
+
+        computed.clear()
+        scheduler.check_and_run_schedules()
+        assert computed == []
+        assert json.loads(scheduler.SCHEDULE_FILE.read_text())["schedules"][1]["run_count"] == 1
+
+    def test_disabled_schedules_are_never_checked(self, schedule_files, monkeypatch):
+        """Test disabled schedules are skipped before their run time or condition is looked at"""
+        disabled = {"id": "off", "type": "interval", "command": "say off", "enabled": False}
+        disabled["condition"] = {"type": "player_count", "min": 1}
+        scheduler.SCHEDULE_FILE.write_text(json.dumps({"schedules": [disabled]}))
+        monkeypatch.setattr(scheduler, "compute_next_run", lambda s, t: pytest.fail("disabled schedule timed"))
+        monkeypatch.setattr(scheduler, "should_run_schedule", lambda s, t: pytest.fail("disabled schedule checked"))
+
+        scheduler.check_and_run_schedules()
+
+        assert not scheduler.SCHEDULE_LOG_FILE.exists()
+
+
+class TestCommandTemplate:
+    """Tests for process_command_template"""
+
+    def test_substitutes_variables_and_keeps_other_braces(self, monkeypatch):
+        """Test variables are filled in one pass and JSON text components pass through"""
+        monkeypatch.setattr(scheduler, "get_player_count", lambda: 4)
+        now = datetime(2025, 1, 15, 18, 30, tzinfo=timezone.utc)
+
+        command = 'tellraw @a {"text":"{player_count} online at {time} on {date}"} {unknown}'
+        assert scheduler.process_command_template(command, now) == (
+            'tellraw @a {"text":"4 online at 18:30 on 2025-01-15"} {unknown}'
+        )
+        assert scheduler.process_command_template("say {datetime}", now) == f"say {now.isoformat()}"
+        monkeypatch.setattr(scheduler, "get_player_count", lambda: pytest.fail("player count queried"))
+        assert scheduler.process_command_template("say {time}", now) == "say 18:30"
+
+
+class TestExecuteCommand:
+    """Tests for execute_command"""
+
+    def test_uses_persistent_rcon_connection(self, monkeypatch):
+        """Test commands go over the shared RCON connection without spawning rcon-client.sh"""
+
+        class FakePool:
+            def __init__(self):
+                self.commands = []
+
+            def command(self, command):
+                self.commands.append(command)
+                return "There are 3 of a max of 20 players online"
+
+        pool = FakePool()
+        monkeypatch.setitem(scheduler._RCON, "client", pool)
+        monkeypatch.setattr(scheduler, "_PLAYER_COUNT_CACHE", {"value": 0, "checked": float("-inf")})
+        monkeypatch.setattr(scheduler, "run_with_group_timeout", lambda *a, **k: pytest.fail("rcon-client.sh spawned"))
+
+        assert scheduler.execute_command("say hi") == (True, "There are 3 of a max of 20 players online")
+        assert scheduler.get_player_count() == 3
+        assert pool.commands == ["say hi", "list"]
+
+    def test_player_count_reused_within_ttl(self, monkeypatch):
+        """Test one tick's templates and conditions share a single "list" round-trip"""
+        calls = []
+        monkeypatch.setattr(scheduler, "rcon_command", lambda command: calls.append(command) or "There are 2 of 20")
+        monkeypatch.setattr(scheduler, "_PLAYER_COUNT_CACHE", {"value": 0, "checked": float("-inf")})
+        now = datetime.now(timezone.utc)
+
+        assert scheduler.process_command_template("say {player_count} online", now) == "say 2 online"
+        assert scheduler.check_condition({"type": "player_count", "operator": ">=", "value": 2}, now)
+        assert calls == ["list"]
+
+        assert scheduler.get_player_count(force=True) == 2
+        assert calls == ["list", "list"]
+
+    def test_timeout_kills_script_process_group(self, tmp_path):
+        """Test a timed-out script is killed together with the processes it started"""
+        pid_file = tmp_path / "child.pid"
+        script = f"sleep 30 & echo $! > {pid_file}; wait"
+
+        with pytest.raises(scheduler.subprocess.TimeoutExpired):
+            scheduler.run_with_group_timeout(["sh", "-c", script], timeout=0.5)
+
+        status = Path(f"/proc/{pid_file.read_text().strip()}/status")
+        assert not status.exists() or "\tZ" in status.read_text()  # Gone, or killed and awaiting reaping
+
+        result = scheduler.run_with_group_timeout(["sh", "-c", "echo ok"], timeout=5)
+        assert (result.returncode, result.stdout) == (0, "ok\n")
+
+    def test_runs_against_one_packet_per_read_server(self, monkeypatch, rcon_server):
+        """Test commands run natively on a server that, like vanilla, reads one packet per recv"""
+        monkeypatch.setitem(scheduler._RCON, "client", None)
+        monkeypatch.setattr(
+            scheduler,
+            "load_rcon_config",
+            lambda path: {"RCON_HOST": "127.0.0.1", "RCON_PORT": str(rcon_server.port), "RCON_PASSWORD": "secret"},
+        )
+        monkeypatch.setattr(scheduler, "run_with_group_timeout", lambda *a, **k: pytest.fail("rcon-client.sh spawned"))
+
+        try:
+            assert scheduler.execute_command("say hi") == (True, "ran: say hi")
+            assert scheduler.execute_command("help") == (True, "x" * 10000)
+            assert rcon_server.executed == ["say hi", "help"]
+        finally:
+            scheduler._RCON["client"].close()
+
+    def test_sent_command_not_rerun_through_script(self, monkeypatch):
+        """Test a command whose RCON response was lost is reported failed, not sent again via rcon-client.sh"""
+
+        class LostResponsePool:
+            def command(self, command):
+                raise scheduler.RconResponseError("RCON response failed: timed out")
+
+        pool = LostResponsePool()
+        monkeypatch.setitem(scheduler._RCON, "client", pool)
+        monkeypatch.setattr(scheduler, "run_with_group_timeout", lambda *a, **k: pytest.fail("rcon-client.sh spawned"))
+
+        assert scheduler.execute_command("give steve diamond") == (False, "RCON response failed: timed out")
+        assert scheduler._RCON["client"] is pool
+
+    def test_falls_back_to_script_when_rcon_fails(self, monkeypatch):
+        """Test an unreachable RCON server falls back to rcon-client.sh until the retry interval passes"""
+
+        class DeadPool:
+            def command(self, command):
+                raise scheduler.RconError("connection refused")
+
+            def close(self):
+                pass
+
+        calls = []
+        result = type("Result", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
+        monkeypatch.setitem(scheduler._RCON, "client", DeadPool())
+        monkeypatch.setitem(scheduler._RCON, "retry_at", 0.0)
+        monkeypatch.setattr(scheduler, "run_with_group_timeout", lambda args, **k: calls.append(args) or result)
+
+        assert scheduler.execute_command("say hi") == (True, "ok")
+        assert scheduler._RCON["client"] is False
+        assert calls[0][1:] == ["command", "say hi"]
+
+        # Native RCON is tried again once the retry interval has passed
+        monkeypatch.setattr(scheduler, "load_rcon_config", lambda path: {"RCON_PASSWORD": "secret"})
+        assert scheduler.get_rcon_client() is None
+        scheduler._RCON["retry_at"] = 0.0
+        assert isinstance(scheduler.get_rcon_client(), scheduler.RconPool)
@@ -23,16 +23,6 @@ def client():
         yield client
 
 
-@pytest.fixture
-def mock_api_keys(monkeypatch):
-    """Mock API keys for testing"""
-    test_key = "test-api-key-123456789012345678901234567890"
-    import api.server as api_module
-
-    api_module.API_KEYS = {test_key: {"name": "test-key", "enabled": True, "created": "2025-01-15T00:00:00Z"}}
-    return test_key
-
-
 @pytest.fixture
 def temp_config_dir(tmp_path, monkeypatch):
     """Create temporary config directory"""
@@ -71,6 +61,29 @@ class TestConfigFilesList:
         assert "files" in data
         assert len(data["files"]) > 0
 
+    def test_list_reflects_external_edits(self, client, mock_api_keys, temp_config_dir):
+        """Listing right after an out-of-band edit reports the new size"""
+        config_dir, data_dir = temp_config_dir
+        test_file = data_dir / "server.properties"
+        test_file.write_text("a=1\n")
+        headers = {"X-API-Key": mock_api_keys}
+        assert client.get("/api/config/files", headers=headers).get_json()["files"][0]["size"] == 4
+
+        test_file.write_text("a=1\nb=2\n")
+        assert client.get("/api/config/files", headers=headers).get_json()["files"][0]["size"] == 8
+
+    def test_load_cached_reparses_on_change(self, tmp_path):
+        """An unchanged file reuses the cached parse; an edited one is parsed again"""
+        import api.server as api_module
+
+        props = tmp_path / "server.properties"
+        props.write_text("motd=hello\n")
+        first = api_module.load_cached(props, api_module.parse_properties_file)
+        assert api_module.load_cached(props, api_module.parse_properties_file) is first
+
+        props.write_text("motd=goodbye\n")
+        assert api_module.load_cached(props, api_module.parse_properties_file) == {"motd": "goodbye"}
+
 
 class TestConfigFileGet:
     """Tests for GET /api/config/files/<filename> endpoint"""
@@ -90,6 +103,26 @@ class TestConfigFileGet:
         response = client.get("/api/config/files/server.properties", headers={"X-API-Key": mock_api_keys})
         assert response.status_code == 404
 
+    def test_get_large_config_file_uses_accel_redirect(self, client, mock_api_keys, temp_config_dir, monkeypatch):
+        """Large files requested as text/plain are delegated to the reverse proxy"""
+        import api.server as api_module
+
+        config_dir, data_dir = temp_config_dir
+        (data_dir / "server.properties").write_text("motd=x\n" * 20000)
+        monkeypatch.setattr(api_module, "CONFIG_ACCEL_REDIRECT", "/_internal_files/")
+
+        response = client.get(
+            "/api/config/files/server.properties",
+            headers={"X-API-Key": mock_api_keys, "Accept": "text/plain"},
+        )
+        assert response.status_code == 200
+        assert response.headers["X-Accel-Redirect"] == "/_internal_files/data/server.properties"
+        assert response.data == b""
+
+        response = client.get("/api/config/files/server.properties", headers={"X-API-Key": mock_api_keys})
+        assert "X-Accel-Redirect" not in response.headers
+        assert json.loads(response.data)["content"].startswith("motd=x")
+
 
 class TestConfigFileSave:
     """Tests for POST /api/config/files/<filename> endpoint"""
@@ -150,6 +183,20 @@ class TestConfigFileSave:
         backup_files = list(backup_dir.glob("server.properties.*.backup"))
         assert len(backup_files) > 0
 
+    def test_backup_survives_in_place_rewrite(self, tmp_path):
+        """Backups are copies unless linking is asked for, so an in-place rewrite can't alter them"""
+        import api.server as api_module
+
+        source = tmp_path / "server.properties"
+        source.write_text("# Original content\n")
+        api_module.backup_file(source, tmp_path / "copy.backup")
+        api_module.backup_file(source, tmp_path / "link.backup", link=True)
+
+        with open(source, "r+") as f:  # In place, as the Minecraft server does
+            f.write("# Rewritten")
+        assert (tmp_path / "copy.backup").read_text() == "# Original content\n"
+        assert (tmp_path / "link.backup").samefile(source)
+
 
 class TestConfigFileValidate:
     """Tests for POST /api/config/files/<filename>/validate endpoint"""
@@ -49,30 +49,52 @@ class TestAPIContracts:
         # Should have backups array or list
         assert "backups" in data or "items" in data or isinstance(data, list)
 
-    def test_validate_response_schema_utility(self):
+    def test_validate_response_schema_utility(self, openapi_schema):
         """Test response schema validation utility"""
         response_data = {"status": "ok", "message": "Server is running"}
 
         # This will skip validation if schema not available or has issues
-        is_valid, error = validate_response_schema(response_data, "/api/health", "GET", 200)
+        is_valid, error = validate_response_schema(response_data, "/api/health", "GET", 200, schema=openapi_schema)
 
         # Should either be valid or skip (if schema not available or has reference issues)
         # The utility function now handles schema reference errors gracefully
         assert is_valid or error is None
 
-    def test_validate_request_schema_utility(self):
+    def test_validate_request_schema_utility(self, openapi_schema):
         """Test request schema validation utility"""
         request_data = {"username": "testuser", "password": "testpass"}
 
         # This will skip validation if schema not available
-        is_valid, error = validate_request_schema(request_data, "/api/auth/register", "POST")
+        is_valid, error = validate_request_schema(request_data, "/api/auth/register", "POST", schema=openapi_schema)
 
         # Should either be valid or skip (if schema not available)
         assert is_valid or error is None
 
-    def test_get_endpoint_schema_utility(self):
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_format_not_asserted(self, fast, monkeypatch):
+        """A "format" keyword is annotation only, with or without fastjsonschema installed"""
+        from tests.api import contract_test_utils
+
+        if fast:
+            pytest.importorskip("fastjsonschema")
+        else:
+            monkeypatch.setattr(contract_test_utils, "FASTJSONSCHEMA_AVAILABLE", False)
+
+        response_schema = {"type": "object", "properties": {"created": {"type": "string", "format": "date-time"}}}
+        schema = {
+            "paths": {
+                "/api/example": {
+                    "get": {"responses": {"200": {"content": {"application/json": {"schema": response_schema}}}}}
+                }
+            }
+        }
+        data = {"created": "2025-01-15T00:00:00.123456"}
+        assert validate_response_schema(data, "/api/example", "GET", 200, schema=schema) == (True, None)
+        assert validate_response_schema({"created": 1}, "/api/example", "GET", 200, schema=schema)[0] is False
+
+    def test_get_endpoint_schema_utility(self, openapi_schema):
         """Test endpoint schema retrieval utility"""
-        schema = get_endpoint_schema("/api/health", "GET")
+        schema = get_endpoint_schema("/api/health", "GET", schema=openapi_schema)
 
         # Should return schema dict or None
         assert schema is None or isinstance(schema, dict)
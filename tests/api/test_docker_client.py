@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the Docker Engine API client helpers
+"""
+
+import http.server
+import json
+import socketserver
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.docker_client import DockerClient, demux_log_stream, format_bytes
+
+
+def frame(stream, payload):
+    """Build a multiplexed log frame"""
+    return bytes([stream, 0, 0, 0]) + len(payload).to_bytes(4, "big") + payload
+
+
+class TestDockerClientHelpers:
+    """Tests for docker_client helper functions"""
+
+    def test_format_bytes(self):
+        """Sizes are formatted with binary units like the docker CLI"""
+        assert format_bytes(512) == "512B"
+        assert format_bytes(1536 * 1024 * 1024) == "1.5GiB"
+
+    def test_demux_log_stream(self):
+        """Multiplexed stdout/stderr frames are joined without headers"""
+        body = frame(1, b"line one\n") + frame(2, b"error line\n")
+        assert demux_log_stream(body) == b"line one\nerror line\n"
+
+    def test_demux_log_stream_tty(self):
+        """Raw TTY output is returned unchanged"""
+        assert demux_log_stream(b"[12:00:00] Done\n") == b"[12:00:00] Done\n"
+
+    def test_unavailable_without_socket(self, tmp_path):
+        """Client reports unavailable when the socket does not exist"""
+        assert not DockerClient(str(tmp_path / "docker.sock")).available()
+
+
+class FakeDockerHandler(http.server.BaseHTTPRequestHandler):
+    """Minimal Docker Engine API responder"""
+
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+
+    def address_string(self):
+        return "docker.sock"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.requests_seen.append(self.path)
+        if self.path.startswith("/containers/json"):
+            body = json.dumps([{"Names": ["/minecraft-server"], "Status": "Up 3 hours"}]).encode()
+        else:
+            body = b'{"message": "not found"}'
+        self.send_response(200 if self.path.startswith("/containers/json") else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def docker_socket(tmp_path):
+    """Serve the fake Docker API on a Unix socket"""
+    socket_path = str(tmp_path / "docker.sock")
+    server = socketserver.ThreadingUnixStreamServer(socket_path, FakeDockerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    FakeDockerHandler.requests_seen = []
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+
+
+class TestDockerClient:
+    """Tests for DockerClient over a Unix socket"""
+
+    def test_container_statuses_reuses_connection(self, docker_socket):
+        """Statuses are read from /containers/json over one keep-alive connection"""
+        client = DockerClient(docker_socket, timeout=5)
+        assert client.available()
+
+        assert client.container_statuses("minecraft-server") == ["Up 3 hours"]
+        connection = client._conn
+        assert client.container_statuses("minecraft-server") == ["Up 3 hours"]
+        assert client._conn is connection
+        assert len(FakeDockerHandler.requests_seen) == 2
+
+    def test_error_status_raises(self, docker_socket):
+        """Non-2xx responses raise DockerError"""
+        from api.docker_client import DockerError
+
+        with pytest.raises(DockerError):
+            DockerClient(docker_socket, timeout=5).container_stats("missing")
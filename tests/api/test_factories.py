@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Tests for test data factories"""
 
+import uuid
+from datetime import datetime, timedelta
+
 from tests.api.factories import (
     create_api_key_data,
     create_backup_metadata,
@@ -23,6 +26,7 @@ def test_generate_api_key():
     # Test custom length
     key = generate_api_key(32)
     assert len(key) == 32
+    assert len(generate_api_key(33)) == 33
 
 
 def test_create_user_data():
@@ -79,6 +83,9 @@ def test_create_whitelist_entry():
     assert entry["name"] == "testuser"
     assert "uuid" in entry
     assert len(entry["uuid"]) == 36  # UUID format
+    parsed = uuid.UUID(entry["uuid"])
+    assert str(parsed) == entry["uuid"]
+    assert parsed.version == 4 and parsed.variant == uuid.RFC_4122
 
 
 def test_create_ban_entry():
@@ -88,6 +95,10 @@ def test_create_ban_entry():
     assert entry["reason"] == "Test reason"
     assert "uuid" in entry
     assert "expires" in entry
+    # UTC timestamps carry a single Z suffix (not "+00:00Z")
+    created = datetime.fromisoformat(entry["created"].replace("Z", "+00:00"))
+    expires = datetime.fromisoformat(entry["expires"].replace("Z", "+00:00"))
+    assert expires - created == timedelta(days=1)
 
 
 def test_create_world_data():
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for file browser API endpoints
+"""
+
+import io
+import json
+import sys
+from pathlib import Path as PathLib
+
+import pytest
+
+PROJECT_ROOT = PathLib(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.server import app
+
+
+@pytest.fixture
+def client():
+    """Create test client"""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def temp_file_root(tmp_path, monkeypatch):
+    """Point the file browser at a temporary project root"""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+
+    import api.server as api_module
+
+    monkeypatch.setattr(api_module, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(api_module, "is_path_allowed", lambda path: str(path).startswith(str(config_dir)))
+
+    return tmp_path
+
+
+class TestPathAllowed:
+    """Tests for is_path_allowed"""
+
+    def test_rejects_traversal_and_symlink_escape(self, tmp_path, monkeypatch):
+        """Paths are checked after resolving '..' and symlinks"""
+        import api.server as api_module
+
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (tmp_path / "secret").mkdir()
+        (config_dir / "link").symlink_to(tmp_path / "secret")
+
+        monkeypatch.setattr(api_module, "_ALLOWED_RESOLVED", api_module._resolve_allowed_roots([config_dir]))
+        api_module._is_resolved_path_allowed.cache_clear()
+        try:
+            assert api_module.is_path_allowed(config_dir / "server.properties")
+            assert api_module.is_path_allowed(config_dir)
+            assert not api_module.is_path_allowed(config_dir / ".." / "secret")
+            assert not api_module.is_path_allowed(config_dir / "link" / "token")
+            assert not api_module.is_path_allowed(tmp_path / "config-other")
+        finally:
+            api_module._is_resolved_path_allowed.cache_clear()
+
+
+class TestFileList:
+    """Tests for GET /api/files/list endpoint"""
+
+    def test_list_files_sorted(self, client, mock_api_keys, temp_file_root):
+        """Directories are listed first, then files, both case-insensitively by name"""
+        config_dir = temp_file_root / "config"
+        (config_dir / "b.txt").write_text("bb")
+        (config_dir / "A.txt").write_text("a")
+        (config_dir / "plugins").mkdir()
+
+        response = client.get("/api/files/list?path=config", headers={"X-API-Key": mock_api_keys})
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["path"] == "config"
+        assert [(f["name"], f["type"], f["size"]) for f in data["files"]] == [
+            ("plugins", "directory", 0),
+            ("A.txt", "file", 1),
+            ("b.txt", "file", 2),
+        ]
+        assert data["files"][1]["path"] == "config/A.txt"
+
+
+class TestFileRead:
+    """Tests for GET /api/files/read endpoint"""
+
+    def test_read_file_reflects_changes(self, client, mock_api_keys, temp_file_root):
+        """Read returns the current content after the file changes"""
+        target = temp_file_root / "config" / "motd.txt"
+        target.write_text("first")
+        headers = {"X-API-Key": mock_api_keys}
+
+        response = client.get("/api/files/read?path=config/motd.txt", headers=headers)
+        assert response.status_code == 200
+        assert json.loads(response.data)["content"] == "first"
+
+        target.write_text("second, longer")
+        data = json.loads(client.get("/api/files/read?path=config/motd.txt", headers=headers).data)
+        assert data["content"] == "second, longer"
+        assert data["size"] == len("second, longer")
+
+    def test_read_file_not_modified(self, client, mock_api_keys, temp_file_root):
+        """Read answers a matching If-None-Match with an empty 304"""
+        (temp_file_root / "config" / "motd.txt").write_text("hello")
+        headers = {"X-API-Key": mock_api_keys}
+
+        response = client.get("/api/files/read?path=config/motd.txt", headers=headers)
+        etag = response.headers["ETag"]
+        assert etag.startswith("W/")
+
+        cached = client.get("/api/files/read?path=config/motd.txt", headers={**headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b""
+        assert cached.headers["ETag"] == etag
+
+    def test_read_file_rejects_directory(self, client, mock_api_keys, temp_file_root):
+        """Read returns 400 for a directory and 404 for a missing file"""
+        (temp_file_root / "config" / "plugins").mkdir()
+        headers = {"X-API-Key": mock_api_keys}
+
+        assert client.get("/api/files/read?path=config/plugins", headers=headers).status_code == 400
+        assert client.get("/api/files/read?path=config/missing.txt", headers=headers).status_code == 404
+
+
+class TestFileWrite:
+    """Tests for POST /api/files/write endpoint"""
+
+    def test_write_file_keeps_backup_of_old_content(self, client, mock_api_keys, temp_file_root):
+        """Overwriting a file leaves the previous content in the backup"""
+        target = temp_file_root / "config" / "motd.txt"
+        target.write_text("old content")
+        target.chmod(0o640)
+
+        response = client.post(
+            "/api/files/write",
+            headers={"X-API-Key": mock_api_keys},
+            json={"path": "config/motd.txt", "content": "new content"},
+        )
+
+        assert response.status_code == 200
+        backup = temp_file_root / json.loads(response.data)["backup"]
+        assert backup.read_text() == "old content"
+        assert target.read_text() == "new content"
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert list((temp_file_root / "config").glob(".motd.txt.*")) == []
+
+
+class TestFileUpload:
+    """Tests for POST /api/files/upload endpoint"""
+
+    def test_upload_file_success(self, client, mock_api_keys, temp_file_root):
+        """Upload writes the file and leaves no spool files behind"""
+        response = client.post(
+            "/api/files/upload",
+            headers={"X-API-Key": mock_api_keys},
+            data={"path": "config", "file": (io.BytesIO(b"motd=hello\n"), "custom.properties")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        assert json.loads(response.data)["path"] == "config/custom.properties"
+        assert (temp_file_root / "config" / "custom.properties").read_bytes() == b"motd=hello\n"
+        assert list(temp_file_root.glob(".upload-*")) == []
+
+    def test_upload_file_path_not_allowed(self, client, mock_api_keys, temp_file_root):
+        """Upload outside allowed paths is rejected and the spool is removed"""
+        response = client.post(
+            "/api/files/upload",
+            headers={"X-API-Key": mock_api_keys},
+            data={"path": "data", "file": (io.BytesIO(b"data"), "evil.txt")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 403
+        assert not (temp_file_root / "data" / "evil.txt").exists()
+        assert list(temp_file_root.glob(".upload-*")) == []
+
+    def test_upload_file_too_large(self, client, mock_api_keys, temp_file_root):
+        """Upload over the size cap is rejected"""
+        response = client.post(
+            "/api/files/upload",
+            headers={"X-API-Key": mock_api_keys},
+            data={"path": "config", "file": (io.BytesIO(b"x" * (11 * 1024 * 1024)), "big.bin")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 413
+        assert list(temp_file_root.glob(".upload-*")) == []
+
+
+class TestFileDownload:
+    """Tests for GET /api/files/download endpoint"""
+
+    def test_download_file_conditional(self, client, mock_api_keys, temp_file_root):
+        """Download sends an ETag and honours If-None-Match and Range"""
+        (temp_file_root / "config" / "ops.json").write_bytes(b"0123456789")
+        headers = {"X-API-Key": mock_api_keys}
+
+        response = client.get("/api/files/download?path=config/ops.json", headers=headers)
+        assert response.status_code == 200
+        assert response.data == b"0123456789"
+        etag = response.headers["ETag"]
+
+        response = client.get("/api/files/download?path=config/ops.json", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = client.get("/api/files/download?path=config/ops.json", headers={**headers, "Range": "bytes=2-4"})
+        assert response.status_code == 206
+        assert response.data == b"234"
+
+    def test_download_file_not_found(self, client, mock_api_keys, temp_file_root):
+        """Download returns 404 for a missing file"""
+        response = client.get("/api/files/download?path=config/missing.txt", headers={"X-API-Key": mock_api_keys})
+        assert response.status_code == 404
@@ -142,6 +142,46 @@ class TestOAuthLink:
         )
         assert response.status_code == 400
 
+    def test_link_oauth_duplicate_request_exchanges_code_once(self, client, mock_auth_session, temp_oauth_config):
+        """Repeated link requests with the same code share one token exchange"""
+        from unittest.mock import MagicMock, patch
+
+        token_response = MagicMock(status_code=200)
+        token_response.json.return_value = {"access_token": "token"}
+        userinfo_response = MagicMock(status_code=200)
+        userinfo_response.json.return_value = {"id": "dedupe-123"}
+
+        payload = {"code": "double-click-code", "redirect_uri": "http://localhost/callback"}
+        with patch("requests.Session.post", return_value=token_response) as mock_post:
+            with patch("requests.Session.get", return_value=userinfo_response):
+                first = client.post("/api/auth/oauth/google/link", json=payload)
+                second = client.post("/api/auth/oauth/google/link", json=payload)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert json.loads(first.data) == json.loads(second.data)
+        assert mock_post.call_count == 1
+
+    def test_link_oauth_google_uses_id_token(self, client, mock_auth_session, temp_oauth_config):
+        """Google identity is read from the id_token without a userinfo request"""
+        import base64
+        from unittest.mock import MagicMock, patch
+
+        import api.server as api_module
+
+        claims = base64.urlsafe_b64encode(json.dumps({"sub": "idtoken-456"}).encode()).decode().rstrip("=")
+        token_response = MagicMock(status_code=200)
+        token_response.json.return_value = {"access_token": "token", "id_token": f"header.{claims}.signature"}
+
+        payload = {"code": "id-token-code", "redirect_uri": "http://localhost/callback"}
+        with patch("requests.Session.post", return_value=token_response):
+            with patch("requests.Session.get") as mock_get:
+                response = client.post("/api/auth/oauth/google/link", json=payload)
+
+        assert response.status_code == 200
+        assert "google:idtoken-456" in api_module.USERS["testuser"]["oauth_providers"]
+        mock_get.assert_not_called()
+
 
 class TestOAuthUnlink:
     """Tests for POST /api/auth/oauth/<provider>/unlink endpoint"""
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the native RCON client
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.rcon import RconError, RconPool, RconResponseError, load_rcon_config
+
+
+class TestRconPool:
+    """Tests for RconPool"""
+
+    def test_commands_reuse_connection(self, rcon_server):
+        """Sequential commands share one authenticated connection"""
+        pool = RconPool("127.0.0.1", rcon_server.port, "secret")
+        assert pool.command("list") == "ran: list"
+        assert pool.command("say hi") == "ran: say hi"
+        assert rcon_server.connections == 1
+        pool.close()
+
+    def test_multi_packet_response_joined(self, rcon_server):
+        """A response split over several packets is returned whole and not left for the next command"""
+        pool = RconPool("127.0.0.1", rcon_server.port, "secret")
+        assert pool.command("help") == "x" * 10000
+        assert pool.command("list") == "ran: list"
+        pool.close()
+
+    def test_stale_idle_connection_retried(self, rcon_server):
+        """A pooled connection the server has dropped is replaced and the command sent once"""
+        pool = RconPool("127.0.0.1", rcon_server.port, "secret")
+        assert pool.command("list") == "ran: list"
+        rcon_server.drop_connections()
+
+        assert pool.command("say hi") == "ran: say hi"
+        assert rcon_server.executed == ["list", "say hi"]
+        assert rcon_server.connections == 2
+        pool.close()
+
+    def test_lost_response_not_resent(self, rcon_server):
+        """A command whose response times out is not sent again"""
+        pool = RconPool("127.0.0.1", rcon_server.port, "secret", timeout=0.5)
+        assert pool.command("list") == "ran: list"
+
+        with pytest.raises(RconResponseError):
+            pool.command("hang")
+        assert rcon_server.executed == ["list", "hang"]
+        pool.close()
+
+    def test_server_does_not_rerun_sent_command_through_script(self, monkeypatch):
+        """The API only falls back to rcon-client.sh for commands that never reached the server"""
+        import api.server as api_module
+
+        class LostResponsePool:
+            def command(self, command):
+                raise RconResponseError("timed out")
+
+        monkeypatch.setattr(api_module, "get_rcon_pool", lambda: LostResponsePool())
+        fallback = lambda *args: pytest.fail("rcon-client.sh run for a command already sent")  # noqa: E731
+        assert api_module.rcon_command("op steve", fallback=fallback) == ("", "timed out", 1)
+
+    def test_wrong_password_raises(self, rcon_server):
+        """Failed authentication raises RconError"""
+        pool = RconPool("127.0.0.1", rcon_server.port, "wrong")
+        with pytest.raises(RconError):
+            pool.command("list")
+
+
+class TestRconConfig:
+    """Tests for load_rcon_config"""
+
+    def test_parses_shell_assignments(self, tmp_path):
+        """Quoted values, comments and export prefixes are handled"""
+        config_file = tmp_path / "rcon.conf"
+        config_file.write_text("# RCON\nRCON_HOST=\"127.0.0.1\"\nexport RCON_PORT=25575\nRCON_PASSWORD='p@ss word'\n")
+        assert load_rcon_config(config_file) == {
+            "RCON_HOST": "127.0.0.1",
+            "RCON_PORT": "25575",
+            "RCON_PASSWORD": "p@ss word",
+        }
+
+    def test_missing_file(self, tmp_path):
+        """A missing config file yields no settings"""
+        assert load_rcon_config(tmp_path / "missing.conf") == {}